@@ -0,0 +1,4 @@
+"""Benchmarks for bite-parser.
+
+Run ``python -m benchmarks.run --help`` from the repository root for usage.
+"""
@@ -0,0 +1,217 @@
+"""Reference grammars for the benchmarks.
+
+Each grammar parses a single message of its format, so that it can be used
+with `bite.parse_incremental` directly and with a `bite.Repeat` for
+`bite.parse_bytes`. All grammars are picklable.
+"""
+
+from bite import (
+    CaselessLiteral,
+    CharacterSet,
+    Combine,
+    Counted,
+    FixedByteCount,
+    Forward,
+    Literal,
+    MatchFirst,
+    Opt,
+    Parser,
+    Suppress,
+)
+
+DIGITS = b"0123456789"
+CONTROL_CHARS = bytes(range(0x20)) + b"\x7f"
+
+SP = Literal(b" ", name="SP")
+CRLF = Literal(b"\r\n", name="CRLF")
+
+
+def imap_response() -> Parser:
+    """Grammar for a simplified IMAP4rev1 server response (RFC 3501).
+
+    Returns
+    -------
+    :
+        Grammar parsing a single untagged or tagged response line including
+        nested lists, quoted strings and literals.
+    """
+    number = Combine(CharacterSet(DIGITS)[1, ...], name="number")
+    # Numbers are parsed as atoms, which they are a subset of.
+    atom = Combine(
+        CharacterSet(b'(){ "' + CONTROL_CHARS, invert=True)[1, ...], name="atom"
+    )
+    quoted = (
+        Suppress(Literal(b'"'))
+        + Combine(
+            MatchFirst(
+                [
+                    CharacterSet(b'"\\\r\n', invert=True),
+                    Suppress(Literal(b"\\")) + CharacterSet(b'"\\'),
+                ]
+            )[0, ...]
+        )
+        + Suppress(Literal(b'"'))
+    )
+    literal = Counted(
+        Suppress(Literal(b"{")) + number + Suppress(Literal(b"}") + CRLF),
+        FixedByteCount,
+        name="literal",
+    )
+    nil = CaselessLiteral(b"NIL", name="nil")
+
+    item = Forward(name="item")
+    paren_list = Literal(b"(") + Opt(item + (SP + item)[0, ...]) + Literal(b")")
+    item.assign(MatchFirst([paren_list, quoted, literal, nil, atom]))
+
+    tag = MatchFirst([Literal(b"*"), Literal(b"+"), atom], name="tag")
+    return tag + (SP + item)[1, ...] + CRLF
+
+
+def json_document() -> Parser:
+    """Grammar for a JSON document terminated by a newline (JSON lines).
+
+    Returns
+    -------
+    :
+        Grammar parsing a JSON value (RFC 8259) followed by a line feed.
+    """
+    ws = Suppress(CharacterSet(b" \t\r\n")[0, ...])
+
+    # Whitespace is only consumed before tokens. Otherwise, the terminating
+    # newline would be consumed as whitespace.
+    def token(char: bytes) -> Parser:
+        return Suppress(ws + Literal(char))
+
+    digits = CharacterSet(DIGITS)[1, ...]
+    number = Combine(
+        Opt(Literal(b"-"))
+        + MatchFirst([Literal(b"0"), CharacterSet(b"123456789") + digits[0, ...]])
+        + Opt(Literal(b".") + digits)
+        + Opt(CharacterSet(b"eE") + Opt(CharacterSet(b"+-")) + digits),
+        name="number",
+    )
+    hex_digit = CharacterSet(b"0123456789abcdefABCDEF")
+    string = (
+        Suppress(Literal(b'"'))
+        + Combine(
+            MatchFirst(
+                [
+                    CharacterSet(b'"\\' + CONTROL_CHARS, invert=True),
+                    Literal(b"\\") + CharacterSet(b'"\\/bfnrt'),
+                    Literal(b"\\u") + hex_digit[4],
+                ]
+            )[0, ...]
+        )
+        + Suppress(Literal(b'"'))
+    )
+
+    value = Forward(name="value")
+    member = ws + string + token(b":") + value
+    json_object = (
+        token(b"{") + Opt(member + (token(b",") + member)[0, ...]) + token(b"}")
+    )
+    array = token(b"[") + Opt(value + (token(b",") + value)[0, ...]) + token(b"]")
+    value.assign(
+        ws
+        + MatchFirst(
+            [
+                json_object,
+                array,
+                string,
+                number,
+                Literal(b"true"),
+                Literal(b"false"),
+                Literal(b"null"),
+            ]
+        )
+    )
+    return value + Suppress(CharacterSet(b" \t\r")[0, ...]) + Literal(b"\n")
+
+
+def csv_record() -> Parser:
+    """Grammar for a CSV record (RFC 4180).
+
+    Returns
+    -------
+    :
+        Grammar parsing a single record terminated by a line break.
+    """
+    quoted_field = (
+        Suppress(Literal(b'"'))
+        + Combine(
+            MatchFirst(
+                [
+                    CharacterSet(b'"', invert=True),
+                    Suppress(Literal(b'"')) + Literal(b'"'),
+                ]
+            )[0, ...]
+        )
+        + Suppress(Literal(b'"'))
+    )
+    plain_field = Combine(CharacterSet(b',"\r\n', invert=True)[0, ...])
+    field = MatchFirst([quoted_field, plain_field], name="field")
+    line_break = MatchFirst([CRLF, Literal(b"\n")])
+    return field + (Suppress(Literal(b",")) + field)[0, ...] + line_break
+
+
+def http_request_head() -> Parser:
+    """Grammar for the head of an HTTP/1.1 request (RFC 9112).
+
+    Returns
+    -------
+    :
+        Grammar parsing the request line and the header fields including the
+        terminating empty line.
+    """
+    tchar = CharacterSet(
+        b"!#$%&'*+-.^_`|~"
+        + DIGITS
+        + bytes(range(0x41, 0x5B))
+        + bytes(range(0x61, 0x7B))
+    )
+    token = Combine(tchar[1, ...], name="token")
+    ows = Suppress(CharacterSet(b" \t")[0, ...])
+    target = Combine(CharacterSet(b" " + CONTROL_CHARS, invert=True)[1, ...])
+    version = Combine(
+        Literal(b"HTTP/") + CharacterSet(DIGITS) + Literal(b".") + CharacterSet(DIGITS)
+    )
+    request_line = (
+        token + Suppress(SP) + target + Suppress(SP) + version + Suppress(CRLF)
+    )
+
+    field_value = Combine(CharacterSet(b"\r\n", invert=True)[0, ...])
+    field = token + Suppress(Literal(b":")) + ows + field_value + Suppress(CRLF)
+    return request_line + field[0, ...] + Suppress(CRLF)
+
+
+def pathological(alternatives: int = 8) -> Parser:
+    """Grammar that causes extensive backtracking.
+
+    Each line consists of a run of ``a`` bytes followed by a terminating byte.
+    The alternatives each match the whole run before checking for their
+    terminating byte, so that the run is scanned again for each alternative.
+
+    Parameters
+    ----------
+    alternatives:
+        Number of alternatives. The last alternative is terminated by ``z``,
+        all others by consecutive letters starting at ``b``.
+
+    Returns
+    -------
+    :
+        Grammar parsing a single line.
+    """
+    run = Combine(Literal(b"a")[0, ...])
+    terminators = [bytes([ord("b") + i]) for i in range(alternatives - 1)] + [b"z"]
+    return MatchFirst([run + Literal(t) for t in terminators]) + Literal(b"\n")
+
+
+GRAMMARS = {
+    "imap": imap_response,
+    "json": json_document,
+    "csv": csv_record,
+    "http": http_request_head,
+    "pathological": pathological,
+}
+"""Factories of the reference grammars by name."""
@@ -0,0 +1,166 @@
+"""Deterministic input generators for the reference grammars.
+
+Each generator takes a :class:`random.Random` instance and returns a single
+message matching the grammar of the same name in :mod:`benchmarks.grammars`.
+"""
+
+import json
+import random
+import string
+from typing import Callable, Dict, List
+
+WORDS = [
+    b"alpha",
+    b"bravo",
+    b"charlie",
+    b"delta",
+    b"echo",
+    b"foxtrot",
+    b"golf",
+    b"hotel",
+    b"india",
+    b"juliett",
+]
+
+SIZES = {"small": 2**10, "medium": 2**16, "large": 2**20}
+"""Named approximate input sizes in bytes."""
+
+
+def _word(rng: random.Random) -> bytes:
+    return rng.choice(WORDS)
+
+
+def _text(rng: random.Random, min_words: int, max_words: int) -> bytes:
+    return b" ".join(_word(rng) for _ in range(rng.randint(min_words, max_words)))
+
+
+def imap_response(rng: random.Random) -> bytes:
+    kind = rng.random()
+    if kind < 0.6:
+        body = _text(rng, 5, 50) + b"\r\n"
+        return (
+            b"* %d FETCH (UID %d FLAGS (\\Seen \\Answered) "
+            b'INTERNALDATE "17-Jul-1996 02:44:25 -0700" '
+            b'ENVELOPE (NIL "%s" (("%s" NIL "%s" "example.com")) NIL) '
+            b"BODY[TEXT] {%d}\r\n%s)\r\n"
+            % (
+                rng.randint(1, 10000),
+                rng.randint(1, 100000),
+                _text(rng, 2, 8),
+                _word(rng),
+                _word(rng),
+                len(body),
+                body,
+            )
+        )
+    if kind < 0.9:
+        return b"* OK [UIDVALIDITY %d] %s\r\n" % (
+            rng.randint(1, 2**32),
+            _text(rng, 1, 5),
+        )
+    return b"a%03d OK %s completed\r\n" % (rng.randint(0, 999), _word(rng))
+
+
+def _json_value(rng: random.Random, depth: int):
+    kind = rng.randrange(7 if depth < 3 else 5)
+    if kind == 0:
+        return rng.randint(-(10**6), 10**6)
+    if kind == 1:
+        return rng.uniform(-1000, 1000)
+    if kind == 2:
+        return _text(rng, 1, 4).decode() + '\n"é'
+    if kind == 3:
+        return rng.choice([True, False, None])
+    if kind == 4:
+        return "".join(rng.choices(string.ascii_letters, k=rng.randint(0, 16)))
+    if kind == 5:
+        return [_json_value(rng, depth + 1) for _ in range(rng.randint(0, 5))]
+    return {
+        _word(rng).decode() + str(i): _json_value(rng, depth + 1)
+        for i in range(rng.randint(0, 5))
+    }
+
+
+def json_document(rng: random.Random) -> bytes:
+    document = {
+        "id": rng.randint(0, 10**9),
+        "items": [_json_value(rng, 1) for _ in range(rng.randint(1, 4))],
+    }
+    return json.dumps(document, indent=rng.choice([None, 1])).encode() + b"\n"
+
+
+def csv_record(rng: random.Random) -> bytes:
+    fields: List[bytes] = []
+    for _ in range(8):
+        kind = rng.randrange(4)
+        if kind == 0:
+            fields.append(b"%d" % rng.randint(0, 10**6))
+        elif kind == 1:
+            fields.append(_word(rng))
+        elif kind == 2:
+            fields.append(b'"%s, ""%s"""' % (_text(rng, 1, 3), _word(rng)))
+        else:
+            fields.append(b"")
+    return b",".join(fields) + b"\r\n"
+
+
+def http_request_head(rng: random.Random) -> bytes:
+    path = b"/".join(_word(rng) for _ in range(rng.randint(1, 4)))
+    headers = [
+        b"Host: %s.example.com" % _word(rng),
+        b"User-Agent: bench/%d.%d" % (rng.randint(0, 9), rng.randint(0, 9)),
+        b"Accept: text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+        b"Accept-Encoding: gzip, deflate",
+        b"Connection: keep-alive",
+    ]
+    headers.extend(
+        b"X-%s: %s" % (_word(rng), _text(rng, 1, 6)) for _ in range(rng.randint(0, 5))
+    )
+    return (
+        b"%s /%s?q=%d HTTP/1.1\r\n"
+        % (rng.choice([b"GET", b"POST", b"HEAD"]), path, rng.randint(0, 999))
+        + b"".join(header + b"\r\n" for header in headers)
+        + b"\r\n"
+    )
+
+
+def pathological(rng: random.Random) -> bytes:
+    return b"a" * rng.randint(16, 256) + b"z\n"
+
+
+GENERATORS: Dict[str, Callable[[random.Random], bytes]] = {
+    "imap": imap_response,
+    "json": json_document,
+    "csv": csv_record,
+    "http": http_request_head,
+    "pathological": pathological,
+}
+"""Message generators by grammar name."""
+
+
+def generate_messages(name: str, size: int, seed: int = 0) -> List[bytes]:
+    """Generate messages for a grammar.
+
+    Parameters
+    ----------
+    name:
+        Name of the grammar in `GENERATORS`.
+    size:
+        Approximate total size of the messages in bytes. At least one message
+        is generated.
+    seed:
+        Seed for the random number generator.
+
+    Returns
+    -------
+    :
+        The generated messages.
+    """
+    rng = random.Random(seed)
+    generator = GENERATORS[name]
+    messages = [generator(rng)]
+    total = len(messages[0])
+    while total < size:
+        messages.append(generator(rng))
+        total += len(messages[-1])
+    return messages
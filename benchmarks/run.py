@@ -0,0 +1,211 @@
+"""Measure throughput and memory usage of the reference grammars.
+
+Run from the repository root, for example::
+
+    python -m benchmarks.run --grammar json --size medium --save baseline.json
+    python -m benchmarks.run --grammar json --size medium --baseline baseline.json
+
+Each benchmark is timed without memory tracing (best of ``--repeat`` runs).
+A separate run under :mod:`tracemalloc` records the peak memory and the
+memory blocks still allocated when the run finished, which are dominated by
+the retained parse trees.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import time
+import tracemalloc
+from asyncio import StreamReader
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from benchmarks.grammars import GRAMMARS
+from benchmarks.inputs import SIZES, generate_messages
+from bite import Parser, parse_bytes, parse_incremental
+
+
+@dataclass
+class Result:
+    """Result of a single benchmark."""
+
+    grammar: str
+    function: str
+    size: int
+    messages: int
+    seconds: float
+    peak_memory: int
+    retained_blocks: int
+
+    @property
+    def key(self) -> str:
+        """Identifier of the benchmark to compare with a baseline."""
+        return f"{self.grammar}/{self.function}/{self.size}"
+
+    @property
+    def throughput(self) -> float:
+        """Parsed bytes per second."""
+        return self.size / self.seconds
+
+    @property
+    def message_rate(self) -> float:
+        """Parsed messages per second."""
+        return self.messages / self.seconds
+
+
+async def run_parse_bytes(grammar: Parser, data: bytes) -> Any:
+    return await parse_bytes(grammar[1, ...], data, parse_all=True)
+
+
+async def run_parse_incremental(grammar: Parser, data: bytes) -> Any:
+    reader = StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return [parsed async for parsed in parse_incremental(grammar, reader)]
+
+
+FUNCTIONS: Dict[str, Callable[[Parser, bytes], Awaitable[Any]]] = {
+    "parse_bytes": run_parse_bytes,
+    "parse_incremental": run_parse_incremental,
+}
+
+
+def measure(grammar_name: str, function_name: str, size: int, repeat: int) -> Result:
+    """Run a single benchmark.
+
+    Parameters
+    ----------
+    grammar_name:
+        Name of the grammar in `benchmarks.grammars.GRAMMARS`.
+    function_name:
+        Name of the parse function in `FUNCTIONS`.
+    size:
+        Approximate input size in bytes.
+    repeat:
+        Number of timed runs.
+
+    Returns
+    -------
+    :
+        The benchmark result.
+    """
+    grammar = GRAMMARS[grammar_name]()
+    messages = generate_messages(grammar_name, size)
+    data = b"".join(messages)
+    function = FUNCTIONS[function_name]
+
+    seconds = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        asyncio.run(function(grammar, data))
+        seconds = min(seconds, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = asyncio.run(function(grammar, data))
+        _, peak_memory = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    retained_blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+
+    return Result(
+        grammar=grammar_name,
+        function=function_name,
+        size=len(data),
+        messages=len(messages),
+        seconds=seconds,
+        peak_memory=peak_memory,
+        retained_blocks=retained_blocks,
+    )
+
+
+def format_results(
+    results: Iterable[Result], baseline: Optional[Dict[str, Dict[str, Any]]] = None
+) -> str:
+    """Format benchmark results as a table.
+
+    Parameters
+    ----------
+    results:
+        The results to format.
+    baseline:
+        Results of a previous run as saved with ``--save`` to show the speedup
+        relative to.
+
+    Returns
+    -------
+    :
+        The formatted table.
+    """
+    lines = [
+        f"{'benchmark':<40} {'MiB/s':>8} {'msgs/s':>10} {'peak KiB':>10} "
+        + f"{'blocks':>9} {'speedup':>8}"
+    ]
+    for result in results:
+        speedup = ""
+        if baseline and result.key in baseline:
+            speedup = f"{baseline[result.key]['seconds'] / result.seconds:.2f}x"
+        lines.append(
+            f"{result.key:<40} {result.throughput / 2**20:>8.3f} "
+            + f"{result.message_rate:>10.0f} {result.peak_memory / 2**10:>10.0f} "
+            + f"{result.retained_blocks:>9} {speedup:>8}"
+        )
+    return "\n".join(lines)
+
+
+def parse_size(value: str) -> int:
+    return SIZES[value] if value in SIZES else int(value)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--grammar",
+        action="append",
+        choices=sorted(GRAMMARS),
+        help="grammar to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--function",
+        action="append",
+        choices=sorted(FUNCTIONS),
+        help="parse function to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        type=parse_size,
+        help="input size in bytes or one of "
+        + ", ".join(SIZES)
+        + " (default: small and medium)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs")
+    parser.add_argument("--save", help="save the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON file of results to compare with")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = [
+        measure(grammar, function, size, args.repeat)
+        for grammar in args.grammar or GRAMMARS
+        for function in args.function or FUNCTIONS
+        for size in args.size or [SIZES["small"], SIZES["medium"]]
+    ]
+    print(format_results(results, baseline))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({result.key: asdict(result) for result in results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Measure parse_incremental throughput and latency under streaming conditions.
+
+Run from the repository root, for example::
+
+    python -m benchmarks.streaming --grammar http --chunk-size 64 \\
+        --chunk-size 4096 --delay 0 --delay 0.0001 --pipeline 1 --pipeline 16
+
+The messages are fed to a :class:`asyncio.StreamReader` in chunks of the given
+size with the given delay after each chunk. The pipelining depth limits the
+number of messages sent before their parse results have been received. A depth
+of 1 simulates a request-response protocol where the peer waits for each
+message to be processed.
+
+The latency of a message is measured from feeding its last byte until it has
+been parsed. All combinations of the given options are run.
+"""
+
+import argparse
+import asyncio
+import itertools
+import math
+import time
+from asyncio import StreamReader
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from benchmarks.grammars import GRAMMARS
+from benchmarks.inputs import SIZES, generate_messages
+from benchmarks.run import parse_size
+from bite import Parser, parse_incremental
+
+
+@dataclass
+class StreamResult:
+    """Result of a single streaming benchmark."""
+
+    grammar: str
+    chunk_size: int
+    delay: float
+    pipeline: int
+    messages: int
+    seconds: float
+    time_to_first_message: float
+    latencies: List[float]
+
+    @property
+    def message_rate(self) -> float:
+        """Parsed messages per second."""
+        return self.messages / self.seconds
+
+    def latency_percentile(self, percentile: float) -> float:
+        """Get a percentile of the per-message latencies.
+
+        Parameters
+        ----------
+        percentile:
+            The percentile in the range 0 to 100.
+
+        Returns
+        -------
+        :
+            The latency in seconds (nearest-rank method).
+        """
+        latencies = sorted(self.latencies)
+        rank = max(1, math.ceil(percentile / 100 * len(latencies)))
+        return latencies[rank - 1]
+
+
+async def feed_messages(
+    reader: StreamReader,
+    messages: Sequence[bytes],
+    completed_at: List[float],
+    in_flight: asyncio.Semaphore,
+    chunk_size: int,
+    delay: float,
+):
+    """Feed messages to a stream reader in chunks.
+
+    Parameters
+    ----------
+    reader:
+        The stream reader to feed.
+    messages:
+        The messages to feed.
+    completed_at:
+        List to append the time at which the last byte of each message was
+        fed to.
+    in_flight:
+        Semaphore acquired for each message before it is fed and released by
+        the consumer when the message was parsed.
+    chunk_size:
+        Maximum number of bytes to feed at once.
+    delay:
+        Time in seconds to wait after feeding each chunk.
+    """
+    pending = bytearray()
+    message_ends: List[int] = []
+
+    async def feed(data: bytes):
+        reader.feed_data(data)
+        now = time.perf_counter()
+        while message_ends and message_ends[0] <= len(data):
+            completed_at.append(now)
+            message_ends.pop(0)
+        for i in range(len(message_ends)):
+            message_ends[i] -= len(data)
+        await asyncio.sleep(delay)
+
+    for message in messages:
+        if in_flight.locked():
+            # Send what is pending, the consumer cannot make progress otherwise.
+            while pending:
+                await feed(bytes(pending[:chunk_size]))
+                del pending[:chunk_size]
+        await in_flight.acquire()
+        pending += message
+        message_ends.append(len(pending))
+        while len(pending) >= chunk_size:
+            await feed(bytes(pending[:chunk_size]))
+            del pending[:chunk_size]
+    while pending:
+        await feed(bytes(pending[:chunk_size]))
+        del pending[:chunk_size]
+    reader.feed_eof()
+
+
+async def run_stream(
+    grammar_name: str,
+    grammar: Parser,
+    messages: Sequence[bytes],
+    chunk_size: int,
+    delay: float,
+    pipeline: int,
+) -> StreamResult:
+    """Run a single streaming benchmark.
+
+    Parameters
+    ----------
+    grammar_name:
+        Name of the grammar for the result.
+    grammar:
+        Grammar parsing a single message.
+    messages:
+        The messages to stream.
+    chunk_size:
+        Maximum number of bytes fed at once.
+    delay:
+        Time in seconds to wait after feeding each chunk.
+    pipeline:
+        Maximum number of messages fed before their parse result was received.
+
+    Returns
+    -------
+    :
+        The benchmark result.
+    """
+    reader = StreamReader()
+    completed_at: List[float] = []
+    in_flight = asyncio.Semaphore(pipeline)
+    latencies: List[float] = []
+    first_message_at: Optional[float] = None
+
+    start = time.perf_counter()
+    feed_task = asyncio.create_task(
+        feed_messages(reader, messages, completed_at, in_flight, chunk_size, delay)
+    )
+    async for _ in parse_incremental(grammar, reader):
+        now = time.perf_counter()
+        if first_message_at is None:
+            first_message_at = now
+        latencies.append(now - completed_at[len(latencies)])
+        in_flight.release()
+    await feed_task
+    end = time.perf_counter()
+
+    assert len(latencies) == len(messages)
+    assert first_message_at is not None
+    return StreamResult(
+        grammar=grammar_name,
+        chunk_size=chunk_size,
+        delay=delay,
+        pipeline=pipeline,
+        messages=len(messages),
+        seconds=end - start,
+        time_to_first_message=first_message_at - start,
+        latencies=latencies,
+    )
+
+
+def format_results(results: Sequence[StreamResult]) -> str:
+    """Format streaming benchmark results as a table.
+
+    Parameters
+    ----------
+    results:
+        The results to format.
+
+    Returns
+    -------
+    :
+        The formatted table. Times are given in milliseconds.
+    """
+    lines = [
+        f"{'grammar':<14} {'chunk':>7} {'delay':>8} {'pipe':>5} {'msgs/s':>9} "
+        + f"{'first':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}"
+    ]
+    for r in results:
+        lines.append(
+            f"{r.grammar:<14} {r.chunk_size:>7} {r.delay * 1e3:>8.3f} "
+            + f"{r.pipeline:>5} {r.message_rate:>9.0f} "
+            + f"{r.time_to_first_message * 1e3:>8.3f} "
+            + " ".join(
+                f"{r.latency_percentile(p) * 1e3:>8.3f}" for p in (50, 90, 99, 100)
+            )
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--grammar",
+        action="append",
+        choices=sorted(GRAMMARS),
+        help="grammar to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--size",
+        type=parse_size,
+        default=SIZES["small"] * 16,
+        help="total size of the messages in bytes or one of " + ", ".join(SIZES),
+    )
+    parser.add_argument(
+        "--chunk-size",
+        action="append",
+        type=int,
+        help="number of bytes fed at once (default: 16, 1024, and 65536)",
+    )
+    parser.add_argument(
+        "--delay",
+        action="append",
+        type=float,
+        help="seconds to wait after each chunk (default: 0)",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="append",
+        type=int,
+        help="messages in flight before waiting for results (default: 1 and 64)",
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    for grammar_name in args.grammar or GRAMMARS:
+        grammar = GRAMMARS[grammar_name]()
+        messages = generate_messages(grammar_name, args.size)
+        for chunk_size, delay, pipeline in itertools.product(
+            args.chunk_size or [16, 1024, 65536],
+            args.delay or [0.0],
+            args.pipeline or [1, 64],
+        ):
+            results.append(
+                asyncio.run(
+                    run_stream(
+                        grammar_name, grammar, messages, chunk_size, delay, pipeline
+                    )
+                )
+            )
+    print(format_results(results))
+    print("Delays, time to first message, and latencies in milliseconds.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,13 @@
-from .parse_functions import parse_bytes, parse_incremental
+from .io import BufferLimitExceededError, WouldBlock
+from .parallel import parse_file_parallel, parse_many
+from .parse_functions import (
+    parse_bytes,
+    parse_file,
+    parse_file_incremental,
+    parse_incremental,
+    parse_incremental_batches,
+    parse_iter,
+)
 from .parsers import (
     And,
     CaselessLiteral,
@@ -6,38 +15,60 @@ from .parsers import (
     Combine,
     Counted,
     CountedParseTree,
+    DelimitedList,
     FixedByteCount,
     Forward,
+    Integer,
     Literal,
     MatchFirst,
     Not,
+    Number,
     OneOrMore,
     Opt,
     ParsedAnd,
     ParsedBaseNode,
     ParsedCounted,
+    ParsedDelimitedList,
+    ParsedInteger,
     ParsedLeaf,
     ParsedList,
     ParsedLiteral,
     ParsedMatchFirst,
     ParsedNil,
     ParsedNode,
+    ParsedNumber,
     ParsedOneOrMore,
     ParsedOpt,
+    ParsedQuotedString,
+    ParsedRegex,
     ParsedRepeat,
+    ParsedSkipTo,
     ParsedZeroOrMore,
     ParseError,
     Parser,
+    QuotedString,
+    Regex,
     Repeat,
+    SkipTo,
     TrailingBytesError,
     UnmetExpectationError,
     ZeroOrMore,
 )
+from .protocol import ParserProtocol
+from .push import PushParser
 from .transformers import Group, ParsedTransform, Suppress, Transform, TransformValues
 
 __all__ = [
     "parse_incremental",
+    "parse_incremental_batches",
+    "parse_iter",
     "parse_bytes",
+    "parse_file",
+    "parse_file_incremental",
+    "parse_many",
+    "parse_file_parallel",
+    "ParserProtocol",
+    "PushParser",
     "ParsedNode",
     "ParsedBaseNode",
     "ParsedLeaf",
@@ -56,6 +87,16 @@ __all__ = [
     "CaselessLiteral",
     "CharacterSet",
     "FixedByteCount",
+    "Regex",
+    "ParsedRegex",
+    "SkipTo",
+    "ParsedSkipTo",
+    "Integer",
+    "ParsedInteger",
+    "Number",
+    "ParsedNumber",
+    "QuotedString",
+    "ParsedQuotedString",
     "ZeroOrMore",
     "ParsedZeroOrMore",
     "ParsedRepeat",
@@ -66,6 +107,8 @@ __all__ = [
     "CountedParseTree",
     "ParsedCounted",
     "Counted",
+    "ParsedDelimitedList",
+    "DelimitedList",
     "Combine",
     "ParseError",
     "UnmetExpectationError",
@@ -75,4 +118,6 @@ __all__ = [
     "Suppress",
     "TransformValues",
     "Group",
+    "WouldBlock",
+    "BufferLimitExceededError",
 ]
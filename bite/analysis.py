@@ -0,0 +1,380 @@
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+from bite.instrumentation import iter_parsers
+from bite.parsers import (
+    And,
+    CaselessLiteral,
+    CharacterSet,
+    Counted,
+    DelimitedList,
+    FixedByteCount,
+    Forward,
+    Integer,
+    Literal,
+    MatchFirst,
+    Not,
+    Number,
+    Parser,
+    QuotedString,
+    Regex,
+    Repeat,
+    SkipTo,
+)
+
+ALL_BYTES: FrozenSet[int] = frozenset(range(256))
+
+NULLABLE_REPEAT = "nullable-repeat"
+"""Kind of `Hazard` for an unbounded `bite.parsers.Repeat` or
+`bite.parsers.DelimitedList` of parsers that may match without consuming input.
+Parsing raises a `ValueError` when this happens."""
+
+LEFT_RECURSION = "left-recursion"
+"""Kind of `Hazard` for a `bite.parsers.Forward` that may invoke itself without
+consuming input, which causes an infinite recursion."""
+
+SHADOWED_ALTERNATIVE = "shadowed-alternative"
+"""Kind of `Hazard` for an alternative of a `bite.parsers.MatchFirst` that is
+never tried because a preceding alternative may match without consuming
+input."""
+
+OVERLAPPING_ALTERNATIVES = "overlapping-alternatives"
+"""Kind of `Hazard` for alternatives of a `bite.parsers.MatchFirst` within a
+repetition that can start with the same byte. The input might be scanned
+repeatedly by each alternative in each iteration, which can cause exponential
+run time when repetitions are nested."""
+
+
+@dataclass(frozen=True)
+class Hazard:
+    """Potential problem of a grammar found by `analyze`."""
+
+    kind: str
+    """One of `NULLABLE_REPEAT`, `LEFT_RECURSION`, `SHADOWED_ALTERNATIVE`, or
+    `OVERLAPPING_ALTERNATIVES`."""
+
+    parser: Parser
+    """The offending parser."""
+
+    message: str
+    """Description of the hazard."""
+
+    def __str__(self) -> str:
+        return f"{self.kind}: {self.message}"
+
+
+class GrammarAnalysis:
+    """Static analysis of a grammar.
+
+    The analysis determines for each parser whether it is *nullable*, i.e.
+    whether it may match without consuming any input, and its *FIRST set*, i.e.
+    the bytes that a match consuming input may start with.
+
+    The built-in parsers are analyzed according to their semantics. Other
+    parsers with a single child are assumed to match the same input as the
+    child. Other parsers without children are assumed to not be nullable and to
+    possibly start with any byte. Parsers created dynamically during parsing
+    (e.g., by `bite.parsers.Counted`) are not analyzed.
+
+    Parameters
+    ----------
+    grammar:
+        The grammar to analyze.
+    """
+
+    def __init__(self, grammar: Parser):
+        self.grammar = grammar
+        self._parsers = list(iter_parsers(grammar))
+        self._nullable: Dict[int, bool] = {id(p): False for p in self._parsers}
+        self._first: Dict[int, FrozenSet[int]] = {
+            id(p): frozenset() for p in self._parsers
+        }
+        self._compute_fixed_point()
+        self._repeat_depth = self._compute_repeat_depths()
+
+    def nullable(self, parser: Parser) -> bool:
+        """Determine whether a parser may match without consuming input.
+
+        Parameters
+        ----------
+        parser:
+            A parser of the analyzed grammar.
+
+        Returns
+        -------
+        :
+            Whether the *parser* is nullable.
+        """
+        return self._nullable[id(parser)]
+
+    def first(self, parser: Parser) -> FrozenSet[int]:
+        """Determine the bytes that a parser's match may start with.
+
+        Parameters
+        ----------
+        parser:
+            A parser of the analyzed grammar.
+
+        Returns
+        -------
+        :
+            The FIRST set of the *parser*. It does not include anything for
+            the empty match of a nullable parser.
+        """
+        return self._first[id(parser)]
+
+    def hazards(self) -> List[Hazard]:
+        """Find potential problems in the grammar.
+
+        Returns
+        -------
+        :
+            The found hazards in the order of the parsers in the grammar.
+        """
+        hazards = []
+        left_recursive = self._left_recursive()
+        for parser in self._parsers:
+            if (
+                isinstance(parser, Repeat)
+                and parser.max_repeats is None
+                and self.nullable(parser.parser)
+            ):
+                hazards.append(
+                    Hazard(
+                        NULLABLE_REPEAT,
+                        parser,
+                        f"{_label(parser)} repeats {_label(parser.parser)} without "
+                        "bound, which may match without consuming input",
+                    )
+                )
+            if (
+                isinstance(parser, DelimitedList)
+                and parser.max_items is None
+                and self.nullable(parser.separator)
+                and self.nullable(parser.item)
+            ):
+                hazards.append(
+                    Hazard(
+                        NULLABLE_REPEAT,
+                        parser,
+                        f"{_label(parser)} repeats {_label(parser.separator)} and "
+                        f"{_label(parser.item)} without bound, which may match "
+                        "without consuming input",
+                    )
+                )
+            if isinstance(parser, Forward) and id(parser) in left_recursive:
+                hazards.append(
+                    Hazard(
+                        LEFT_RECURSION,
+                        parser,
+                        f"{_label(parser)} may invoke itself without consuming input",
+                    )
+                )
+            if isinstance(parser, MatchFirst):
+                hazards.extend(self._match_first_hazards(parser))
+        return hazards
+
+    def _match_first_hazards(self, parser: MatchFirst) -> List[Hazard]:
+        hazards = []
+        choices = tuple(parser.choices)
+        for choice in choices[:-1]:
+            if self.nullable(choice):
+                hazards.append(
+                    Hazard(
+                        SHADOWED_ALTERNATIVE,
+                        parser,
+                        f"alternatives of {_label(parser)} after {_label(choice)} are "
+                        f"never tried because {_label(choice)} may match without "
+                        "consuming input",
+                    )
+                )
+                break
+
+        depth = self._repeat_depth[id(parser)]
+        if depth == 0:
+            return hazards
+        within = "nested repetitions" if depth > 1 else "a repetition"
+        for i, a in enumerate(choices):
+            for b in choices[i + 1 :]:
+                overlap = self.first(a) & self.first(b)
+                if overlap:
+                    hazards.append(
+                        Hazard(
+                            OVERLAPPING_ALTERNATIVES,
+                            parser,
+                            f"alternatives {_label(a)} and {_label(b)} of "
+                            f"{_label(parser)} within {within} may both start with "
+                            f"{_format_bytes(overlap)}",
+                        )
+                    )
+        return hazards
+
+    def _compute_fixed_point(self):
+        changed = True
+        while changed:
+            changed = False
+            for parser in self._parsers:
+                nullable, first = self._transfer(parser)
+                key = id(parser)
+                if nullable != self._nullable[key] or first != self._first[key]:
+                    self._nullable[key] = nullable
+                    self._first[key] = first
+                    changed = True
+
+    def _transfer(self, parser: Parser) -> Tuple[bool, FrozenSet[int]]:
+        if isinstance(parser, Literal):
+            return len(parser.literal) == 0, frozenset(parser.literal[:1])
+        if isinstance(parser, CaselessLiteral):
+            return len(parser.literal) == 0, frozenset(
+                parser.literal[:1].lower() + parser.literal[:1].upper()
+            )
+        if isinstance(parser, CharacterSet):
+            if parser.invert:
+                return False, ALL_BYTES - parser.charset
+            return False, parser.charset
+        if isinstance(parser, FixedByteCount):
+            return parser.count == 0, ALL_BYTES if parser.count > 0 else frozenset()
+        if isinstance(parser, Regex):
+            return parser.pattern.match(b"") is not None, ALL_BYTES
+        if isinstance(parser, Integer):
+            return False, frozenset(parser.digits + (b"+-" if parser.signed else b""))
+        if isinstance(parser, Number):
+            return False, frozenset(b"0123456789." + (b"+-" if parser.signed else b""))
+        if isinstance(parser, QuotedString):
+            return False, frozenset(parser.quote)
+        if isinstance(parser, SkipTo):
+            return True, ALL_BYTES
+        if isinstance(parser, Not):
+            return True, frozenset()
+        if isinstance(parser, Repeat):
+            if parser.max_repeats == 0:
+                return True, frozenset()
+            nullable = parser.min_repeats == 0 or self.nullable(parser.parser)
+            return nullable, self.first(parser.parser)
+        if isinstance(parser, DelimitedList):
+            if parser.max_items == 0:
+                return True, frozenset()
+            nullable = parser.min_items == 0 or self.nullable(parser.item)
+            first = self.first(parser.item)
+            if self.nullable(parser.item) and parser.max_items != 1:
+                first |= self.first(parser.separator)
+            return nullable, first
+        if isinstance(parser, Counted):
+            # The counted parser is only known while parsing.
+            return self.nullable(parser.count_parser), self.first(parser.count_parser)
+        return self._transfer_sequence(parser.children, isinstance(parser, MatchFirst))
+
+    def _transfer_sequence(
+        self, children: Tuple[Parser, ...], is_choice: bool
+    ) -> Tuple[bool, FrozenSet[int]]:
+        if not children:
+            return False, ALL_BYTES
+        first: Set[int] = set()
+        if is_choice:
+            for child in children:
+                first |= self.first(child)
+            return any(self.nullable(child) for child in children), frozenset(first)
+        for child in children:
+            first |= self.first(child)
+            if not self.nullable(child):
+                return False, frozenset(first)
+        return True, frozenset(first)
+
+    def _left_children(self, parser: Parser) -> Tuple[Parser, ...]:
+        if isinstance(parser, And):
+            parsers = tuple(parser.parsers)
+            for i, child in enumerate(parsers):
+                if not self.nullable(child):
+                    return parsers[: i + 1]
+            return parsers
+        return parser.children
+
+    def _left_recursive(self) -> Set[int]:
+        left_recursive = set()
+        for parser in self._parsers:
+            seen: Set[int] = set()
+            stack = list(self._left_children(parser))
+            while stack:
+                current = stack.pop()
+                if current is parser:
+                    left_recursive.add(id(parser))
+                    break
+                if id(current) not in seen:
+                    seen.add(id(current))
+                    stack.extend(self._left_children(current))
+        return left_recursive
+
+    def _compute_repeat_depths(self) -> Dict[int, int]:
+        # Number of enclosing repetitions, capped at 2 to terminate for
+        # recursive grammars.
+        depths = {id(self.grammar): 0}
+        stack = [self.grammar]
+        while stack:
+            parser = stack.pop()
+            depth = depths[id(parser)]
+            if (
+                isinstance(parser, Repeat)
+                and (parser.max_repeats is None or parser.max_repeats > 1)
+            ) or (
+                isinstance(parser, DelimitedList)
+                and (parser.max_items is None or parser.max_items > 1)
+            ):
+                depth = min(2, depth + 1)
+            for child in parser.children:
+                if depths.get(id(child), -1) < depth:
+                    depths[id(child)] = depth
+                    stack.append(child)
+        return depths
+
+
+def analyze(grammar: Parser) -> List[Hazard]:
+    """Find potential problems in a grammar.
+
+    Parameters
+    ----------
+    grammar:
+        The grammar to analyze.
+
+    Returns
+    -------
+    :
+        The found hazards. See `GrammarAnalysis` for the assumptions made
+        about parsers that are not built into bite.
+
+    Examples
+    --------
+
+    .. testcode:: analyze
+
+        from bite import Forward, Literal, Opt
+        from bite.analysis import analyze
+
+        item = Opt(Literal(b'a'), name='item')
+        items = item[0, ...]
+
+        expr = Forward(name='expr')
+        expr.assign(expr + Literal(b'+') | Literal(b'1'))
+
+        for hazard in analyze(items) + analyze(expr):
+            print(hazard)
+
+    .. testoutput:: analyze
+
+        nullable-repeat: ((b'a')[0, 1])[0, ...] repeats item without bound, which may match without consuming input
+        left-recursion: expr may invoke itself without consuming input
+    """  # noqa: E501
+    return GrammarAnalysis(grammar).hazards()
+
+
+def _label(parser: Parser, max_length: int = 60) -> str:
+    label = str(parser) if parser.name is None else parser.name
+    if len(label) > max_length:
+        label = label[: max_length - 3] + "..."
+    return label
+
+
+def _format_bytes(values: FrozenSet[int], limit: int = 8) -> str:
+    formatted = ", ".join(repr(bytes([value])) for value in sorted(values)[:limit])
+    if len(values) > limit:
+        formatted += f", ... ({len(values)} bytes)"
+    return formatted
@@ -0,0 +1,164 @@
+import hashlib
+import inspect
+import marshal
+import os
+import pickle
+import sys
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from typing import Callable, TypeVar, Union
+
+from bite.parsers import Parser
+
+T = TypeVar("T", covariant=True)
+V = TypeVar("V", covariant=True)
+
+
+def default_cache_dir() -> Path:
+    """Get the default directory to store cached grammars in.
+
+    Returns
+    -------
+    :
+        The ``bite`` directory within ``$XDG_CACHE_HOME`` if set, otherwise
+        within ``~/.cache``.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "bite"
+
+
+def cached_grammar(
+    build: Callable[[], Parser[T, V]],
+    *,
+    cache_dir: Union[str, "os.PathLike[str]", None] = None,
+    key: str = "",
+) -> Parser[T, V]:
+    r"""Build a grammar or load it from an on-disk cache.
+
+    The grammar returned by *build* is pickled into the *cache_dir*. Subsequent
+    calls, also from other processes, load the grammar from the cache instead
+    of building it again as long as the definition of the *build* function did
+    not change.
+
+    The cache entry is identified by a hash of the source code of the module
+    defining *build* (or the compiled code of *build* if the source is not
+    available), the *key*, and the Python and bite versions. If the grammar
+    depends on anything else (e.g., grammars defined in other modules or
+    configuration), a *key* that changes along with it must be given.
+
+    Only use a *cache_dir* that is not writable by untrusted users as the
+    cached grammars are loaded with :mod:`pickle`.
+
+    Parameters
+    ----------
+    build:
+        Function building the grammar. The grammar must be picklable to be
+        cached. In particular, functions given to
+        `bite.transformers.Transform` and `bite.transformers.TransformValues`
+        must not be lambdas or local functions. Otherwise, or if the
+        *cache_dir* is not writable, the grammar is built on each call.
+    cache_dir:
+        Directory to store the cached grammars in. Defaults to
+        `default_cache_dir`.
+    key:
+        Additional key identifying the cache entry.
+
+    Returns
+    -------
+    :
+        The grammar.
+
+    Examples
+    --------
+
+    .. testcode:: cached_grammar
+        :hide:
+
+        import tempfile
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        cache_dir = tmp_dir.name
+
+    .. testcode:: cached_grammar
+
+        import asyncio
+        from bite import CharacterSet, Combine, Literal, parse_bytes
+        from bite.cache import cached_grammar
+
+        def build_grammar():
+            integer_token = Combine(CharacterSet(b'0123456789')[1, ...])
+            return integer_token + Literal(b'+') + integer_token
+
+        grammar = cached_grammar(build_grammar, cache_dir=cache_dir)
+        print(asyncio.run(parse_bytes(grammar, b'23+42')).values)
+
+    .. testoutput:: cached_grammar
+
+        (b'23', b'+', b'42')
+
+    .. testcode:: cached_grammar
+        :hide:
+
+        tmp_dir.cleanup()
+    """
+
+    path = Path(default_cache_dir() if cache_dir is None else cache_dir)
+    path /= _cache_key(build, key) + ".pickle"
+
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass
+
+    grammar = build()
+    try:
+        _store(grammar, path)
+    except (OSError, pickle.PicklingError, AttributeError, TypeError):
+        # Caching is only an optimization. Unpicklable grammars raise one of
+        # the latter errors depending on the offending object.
+        pass
+    return grammar
+
+
+def _store(grammar: Parser, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first to never expose a partially written file
+    # to concurrently starting processes.
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(grammar, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _cache_key(build: Callable[[], Parser], key: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(sys.version.encode())
+    digest.update(_bite_version().encode())
+    digest.update(f"{build.__module__}.{build.__qualname__}".encode())
+    digest.update(_definition(build))
+    digest.update(key.encode())
+    return digest.hexdigest()
+
+
+def _definition(build: Callable[[], Parser]) -> bytes:
+    module = inspect.getmodule(build)
+    try:
+        source_file = inspect.getsourcefile(module) if module else None
+        if source_file:
+            return Path(source_file).read_bytes()
+    except (OSError, TypeError):
+        pass
+    return marshal.dumps(build.__code__)
+
+
+def _bite_version() -> str:
+    try:
+        return metadata.version("bite-parser")
+    except metadata.PackageNotFoundError:
+        return "unknown"
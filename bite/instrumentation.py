@@ -0,0 +1,144 @@
+from typing import Any, Callable, Coroutine, Iterator, List, Tuple
+
+from bite.io import ParserBuffer
+from bite.parsers import ParsedNode, Parser
+
+ParseMethod = Callable[[ParserBuffer, int], Coroutine[Any, Any, ParsedNode]]
+ParseNowaitMethod = Callable[[ParserBuffer, int], ParsedNode]
+
+
+def iter_parsers(grammar: Parser) -> Iterator[Parser]:
+    """Iterate over all parsers in a grammar.
+
+    Each parser reachable via :attr:`bite.parsers.Parser.children` is returned
+    exactly once, even if it is used multiple times or recursively.
+
+    Parameters
+    ----------
+    grammar:
+        The grammar to iterate over.
+
+    Yields
+    ------
+    :
+        The parsers of the grammar, starting with *grammar* itself.
+    """
+    seen = set()
+    stack = [grammar]
+    while stack:
+        parser = stack.pop()
+        if id(parser) in seen:
+            continue
+        seen.add(id(parser))
+        yield parser
+        stack.extend(reversed(parser.children))
+
+
+class Instrumentation:
+    """Base class for instrumenting all parsers of a grammar.
+
+    While attached, the ``parse`` and ``parse_nowait`` methods of each parser
+    in the grammar are replaced on the parser instance with the wrappers
+    returned by :meth:`wrap_parse` and :meth:`wrap_parse_nowait`. Thus, the
+    instrumentation does not cause any overhead when it is not attached.
+
+    Instrumentations can be used as context managers to attach them for the
+    duration of a ``with`` block. While attached, the grammar cannot be
+    pickled.
+
+    Parameters
+    ----------
+    grammar:
+        The grammar to instrument.
+    """
+
+    def __init__(self, grammar: Parser):
+        self.grammar = grammar
+        self._replaced: List[Tuple[Parser, str, Any]] = []
+
+    @property
+    def attached(self) -> bool:
+        """Whether the instrumentation is currently attached."""
+        return bool(self._replaced)
+
+    def attach(self):
+        """Attach the instrumentation to the parsers of the grammar.
+
+        Raises
+        ------
+        RuntimeError
+            If the instrumentation is already attached.
+        """
+        if self.attached:
+            raise RuntimeError("instrumentation is already attached")
+        for parser in iter_parsers(self.grammar):
+            self._replace(parser, "parse", self.wrap_parse(parser, parser.parse))
+            # The default implementation delegates to the already wrapped
+            # parse method. Wrapping it as well would record each call twice.
+            if type(parser).parse_nowait is not Parser.parse_nowait:
+                self._replace(
+                    parser,
+                    "parse_nowait",
+                    self.wrap_parse_nowait(parser, parser.parse_nowait),
+                )
+
+    def detach(self):
+        """Restore the original methods of the parsers of the grammar."""
+        for parser, attr, previous in reversed(self._replaced):
+            if previous is None:
+                delattr(parser, attr)
+            else:
+                setattr(parser, attr, previous)
+        self._replaced = []
+
+    def __enter__(self):
+        self.attach()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.detach()
+
+    def _replace(self, parser: Parser, attr: str, method: Any):
+        # Only methods set on the instance (e.g., by another instrumentation)
+        # need to be restored, otherwise the class method becomes visible again
+        # by deleting the instance attribute.
+        self._replaced.append((parser, attr, vars(parser).get(attr)))
+        setattr(parser, attr, method)
+
+    def wrap_parse(self, parser: Parser, parse: ParseMethod) -> ParseMethod:
+        """Create the wrapper for the ``parse`` method of a parser.
+
+        Parameters
+        ----------
+        parser:
+            The parser to instrument.
+        parse:
+            The ``parse`` method to wrap.
+
+        Returns
+        -------
+        :
+            The wrapped method. The default implementation returns *parse*
+            unchanged.
+        """
+        return parse
+
+    def wrap_parse_nowait(
+        self, parser: Parser, parse_nowait: ParseNowaitMethod
+    ) -> ParseNowaitMethod:
+        """Create the wrapper for the ``parse_nowait`` method of a parser.
+
+        Parameters
+        ----------
+        parser:
+            The parser to instrument.
+        parse_nowait:
+            The ``parse_nowait`` method to wrap.
+
+        Returns
+        -------
+        :
+            The wrapped method. The default implementation returns
+            *parse_nowait* unchanged.
+        """
+        return parse_nowait
@@ -1,5 +1,23 @@
-from asyncio import IncompleteReadError, StreamReader
-from typing import Protocol, Union
+import asyncio
+import functools
+import mmap
+import os
+import re
+import time
+from asyncio import StreamReader
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Match, Optional, Pattern, Protocol, Union
+
+try:
+    from re import _constants as _sre_constants  # type: ignore[attr-defined]
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:  # Python < 3.11
+    import sre_constants as _sre_constants
+    import sre_parse as _sre_parse
+
+DEFAULT_CHUNK_SIZE = 2**16
+"""Default number of bytes to request per read from an underlying stream."""
 
 
 def _copy_doc(source):
@@ -10,6 +28,291 @@ def _copy_doc(source):
     return decorate
 
 
+class WouldBlock(Exception):
+    """Raised by non-blocking operations if they cannot complete without
+    waiting for more input."""
+
+
+class BufferLimitExceededError(Exception):
+    """Raised if serving a request would exceed a configured buffer limit."""
+
+
+def _max_index(key: slice) -> Optional[int]:
+    if (key.start is not None and key.start < 0) or (
+        key.stop is not None and key.stop < 0
+    ):
+        return None
+    elif key.step is None or key.step > 0:
+        return key.stop
+    elif key.start is not None:
+        return key.start + 1
+    else:
+        return None
+
+
+def _offset_slice(key: slice, offset: int, length: int) -> slice:
+    start, stop, step = key.indices(length)
+    if (step > 0 and start >= stop) or (step < 0 and start <= stop):
+        return slice(0, 0)
+    stop += offset
+    return slice(start + offset, stop if stop >= 0 else None, step)
+
+
+def _bytes_slice(buf: bytearray, key: slice) -> bytes:
+    # Copies only once, unlike bytes(buf[key]). The views are released
+    # explicitly because a bytearray cannot be resized while exported.
+    with memoryview(buf) as view, view[key] as part:
+        return part.tobytes()
+
+
+def _match(
+    pattern: "Pattern[bytes]",
+    data,
+    pos: int,
+    endpos: int,
+    max_length: Optional[int],
+    final: bool,
+) -> Optional["Match[bytes]"]:
+    # The result is final if no more bytes can be added, or if the pattern
+    # cannot inspect the end of the buffered bytes on its way to a result.
+    # Otherwise, more bytes could extend or change the match or turn a failed
+    # match into a successful one.
+    if max_length is not None and endpos - pos >= max_length:
+        endpos = pos + max_length
+        final = True
+    match = pattern.match(data, pos, endpos)
+    if final:
+        return match
+    prefix_pattern = _prefix_pattern(pattern)
+    if prefix_pattern is not None and not prefix_pattern.fullmatch(data, pos, endpos):
+        return match
+    raise WouldBlock()
+
+
+@functools.lru_cache(maxsize=512)
+def _prefix_pattern(pattern: "Pattern[bytes]") -> Optional["Pattern[bytes]"]:
+    # Derives a pattern matching (at least) every proper prefix of the input
+    # after which the given pattern inspects the next byte, e.g. to extend a
+    # repetition or to test an end anchor. If it does not match the buffered
+    # bytes, more bytes can change neither a successful nor a failed match.
+    # Constructs that cannot be handled are over-approximated, in the worst
+    # case by returning None to always wait for more bytes.
+    if not isinstance(pattern.pattern, bytes):
+        return None
+    try:
+        parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+        source = _prefix_source(list(parsed))
+        if source is None:
+            return None
+        return re.compile(source.encode("ascii"), pattern.flags)
+    except (_UnsupportedRegex, re.error, RecursionError, OverflowError):
+        return None
+
+
+class _UnsupportedRegex(Exception):
+    pass
+
+
+_MAX_PREFIX_NESTING = 100
+
+_ANY_SOURCE = "(?s:.*)"
+
+_NEVER_SOURCE = "(?!)"
+
+_FLAG_LETTERS = (
+    (re.IGNORECASE, "i"),
+    (re.LOCALE, "L"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+    (re.ASCII, "a"),
+)
+
+_CATEGORY_SOURCES = {
+    _sre_constants.CATEGORY_DIGIT: r"\d",
+    _sre_constants.CATEGORY_NOT_DIGIT: r"\D",
+    _sre_constants.CATEGORY_SPACE: r"\s",
+    _sre_constants.CATEGORY_NOT_SPACE: r"\S",
+    _sre_constants.CATEGORY_WORD: r"\w",
+    _sre_constants.CATEGORY_NOT_WORD: r"\W",
+}
+
+_SINGLE_BYTES = (
+    _sre_constants.LITERAL,
+    _sre_constants.NOT_LITERAL,
+    _sre_constants.ANY,
+    _sre_constants.IN,
+)
+
+_REPEATS = tuple(
+    getattr(_sre_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_sre_constants, name)
+)
+
+_BEGINNINGS = (
+    _sre_constants.AT_BEGINNING,
+    _sre_constants.AT_BEGINNING_LINE,
+    _sre_constants.AT_BEGINNING_STRING,
+)
+
+
+def _prefix_source(nodes: List[Any]) -> Optional[str]:
+    # The proper prefixes of a sequence are the proper prefixes of its first
+    # node, or the first node followed by a proper prefix of the remaining
+    # sequence. A prefix source of None stands for any bytes.
+    rest: Optional[str] = _NEVER_SOURCE
+    if len(nodes) > _MAX_PREFIX_NESTING:
+        nodes = nodes[:_MAX_PREFIX_NESTING]
+        rest = None
+    for op, av in reversed(nodes):
+        head = _node_prefix_source(op, av)
+        if head is None:
+            rest = None
+        elif rest is None:
+            rest = f"(?:{head}|{_node_source(op, av)}{_ANY_SOURCE})"
+        elif rest == _NEVER_SOURCE:
+            rest = head
+        else:
+            rest = f"(?:{head}|{_node_source(op, av)}{rest})"
+    return rest
+
+
+def _node_prefix_source(op: Any, av: Any) -> Optional[str]:
+    c = _sre_constants
+    if op in _SINGLE_BYTES:
+        return ""
+    if op is c.BRANCH:
+        branches = [_prefix_source(list(branch)) for branch in av[1]]
+        if any(branch is None for branch in branches):
+            return None
+        return "(?:" + "|".join(branches) + ")"  # type: ignore[arg-type]
+    if op is c.SUBPATTERN:
+        _, add_flags, del_flags, nodes = av
+        source = _prefix_source(list(nodes))
+        return None if source is None else _group(source, add_flags, del_flags)
+    if op in _REPEATS:
+        _, max_repeats, nodes = av
+        if max_repeats == 0:
+            return _NEVER_SOURCE
+        item = _sequence_source(nodes)
+        if len(nodes) == 1 and nodes[0][0] in _SINGLE_BYTES:
+            # Avoids an ambiguous pattern that is slow to fail.
+            if max_repeats == c.MAXREPEAT:
+                return f"(?:{item})*"
+            return f"(?:{item}){{0,{max_repeats - 1}}}"
+        source = _prefix_source(list(nodes))
+        if source is None:
+            return None
+        if max_repeats == c.MAXREPEAT:
+            return f"(?:(?:{item})*{source})"
+        return f"(?:(?:{item}){{0,{max_repeats - 1}}}{source})"
+    if op is getattr(c, "ATOMIC_GROUP", None):
+        return _prefix_source(list(av))
+    if op is c.AT:
+        # Anchors at the beginning only look at preceding bytes, all others at
+        # the next byte, and $ at the byte after a trailing newline.
+        if av in _BEGINNINGS:
+            return _NEVER_SOURCE
+        return "\\x0a?" if av is c.AT_END else ""
+    if op in (c.ASSERT, c.ASSERT_NOT):
+        direction, nodes = av
+        return _NEVER_SOURCE if direction < 0 else _prefix_source(list(nodes))
+    if op in (c.GROUPREF, c.GROUPREF_EXISTS):
+        return None
+    raise _UnsupportedRegex(op)
+
+
+def _sequence_source(nodes: Any) -> str:
+    return "".join(_node_source(op, av) for op, av in nodes)
+
+
+def _node_source(op: Any, av: Any) -> str:
+    # Zero-width assertions are dropped and group references replaced by any
+    # bytes. This only allows more matches, which keeps the derived prefix
+    # pattern sound.
+    c = _sre_constants
+    if op is c.LITERAL:
+        return _escape_byte(av)
+    if op is c.NOT_LITERAL:
+        return f"[^{_escape_byte(av)}]"
+    if op is c.ANY:
+        return "."
+    if op is c.IN:
+        return "[" + "".join(_set_item_source(*item) for item in av) + "]"
+    if op is c.BRANCH:
+        return "(?:" + "|".join(_sequence_source(branch) for branch in av[1]) + ")"
+    if op is c.SUBPATTERN:
+        _, add_flags, del_flags, nodes = av
+        return _group(_sequence_source(nodes), add_flags, del_flags)
+    if op in _REPEATS:
+        min_repeats, max_repeats, nodes = av
+        max_source = _max_repeats_source(max_repeats)
+        return f"(?:{_sequence_source(nodes)}){{{min_repeats},{max_source}}}"
+    if op is getattr(c, "ATOMIC_GROUP", None):
+        return f"(?:{_sequence_source(av)})"
+    if op in (c.AT, c.ASSERT, c.ASSERT_NOT):
+        return ""
+    if op in (c.GROUPREF, c.GROUPREF_EXISTS):
+        return _ANY_SOURCE
+    raise _UnsupportedRegex(op)
+
+
+def _max_repeats_source(max_repeats: int) -> str:
+    return "" if max_repeats == _sre_constants.MAXREPEAT else str(max_repeats)
+
+
+def _set_item_source(op: Any, av: Any) -> str:
+    c = _sre_constants
+    if op is c.NEGATE:
+        return "^"
+    if op is c.LITERAL:
+        return _escape_byte(av)
+    if op is c.RANGE:
+        return f"{_escape_byte(av[0])}-{_escape_byte(av[1])}"
+    if op is c.CATEGORY and av in _CATEGORY_SOURCES:
+        return _CATEGORY_SOURCES[av]
+    raise _UnsupportedRegex(op)
+
+
+def _escape_byte(value: int) -> str:
+    if value > 0xFF:
+        raise _UnsupportedRegex(value)
+    return f"\\x{value:02x}"
+
+
+def _group(source: str, add_flags: int, del_flags: int) -> str:
+    add = "".join(letter for flag, letter in _FLAG_LETTERS if add_flags & flag)
+    remove = "".join(letter for flag, letter in _FLAG_LETTERS if del_flags & flag)
+    return f"(?{add}-{remove}:{source})" if remove else f"(?{add}:{source})"
+
+
+def _find(
+    data, sub: bytes, start: int, buffered_end: int, end: Optional[int], final: bool
+) -> int:
+    # Not finding *sub* is only final if no more bytes can be added or the
+    # search range is completely buffered.
+    if end is not None and end <= buffered_end:
+        buffered_end = end
+        final = True
+    index = data.find(sub, start, buffered_end)
+    if index >= 0 or final:
+        return index
+    raise WouldBlock()
+
+
+class _WaitForData:
+    """Awaitable used by buffers that are fed by a driver (instead of an event
+    loop) to suspend until more data has been fed."""
+
+    def __await__(self):
+        yield self
+
+
+WAIT_FOR_DATA = _WaitForData()
+"""Object yielded by a suspended `FeedBuffer` to its driver."""
+
+
 class ParserBuffer(Protocol):
     """Protocol used by parsers to read from a bytes buffer."""
 
@@ -39,8 +342,171 @@ class ParserBuffer(Protocol):
         # noqa: DAR202
         """
 
-    def get_current(self) -> bytes:
-        """Get all bytes currently stored in the buffer."""
+    def get_nowait(self, key: Union[int, slice]) -> bytes:
+        """Get a range from the buffer without blocking.
+
+        Behaves like :meth:`get`, but instead of blocking when the requested
+        range is not available yet, `WouldBlock` is raised.
+
+        Parameters
+        ----------
+        key
+            Range to return. An integer ``i`` is treated as a single byte range
+            ``slice(i, i + 1)``.
+
+        Returns
+        -------
+        :
+            A ``bytes`` object containing the requested range from the buffer.
+
+        Raises
+        ------
+        WouldBlock
+            If the requested range may become available, but is not available
+            yet.
+
+        # noqa: DAR202
+        """
+
+    def get_current(self, key: slice = slice(None)) -> bytes:
+        """Get bytes currently stored in the buffer.
+
+        Never blocks or reads additional bytes into the buffer.
+
+        Parameters
+        ----------
+        key
+            Range of the currently stored bytes to return. By default, all
+            currently stored bytes are returned.
+
+        Returns
+        -------
+        :
+            A ``bytes`` object containing the requested range of the currently
+            stored bytes.
+
+        # noqa: DAR202
+        """
+
+    async def match(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        """Match a regular expression at a location in the buffer.
+
+        The pattern is matched against the buffered bytes without copying them.
+        Blocks while the result could still change with more bytes, i.e. while
+        the end of file has not been found, fewer than *max_length* bytes
+        after *loc* are buffered, and the pattern might inspect the bytes
+        following the buffered ones, e.g. to extend a match or to complete a
+        match that fails for lack of bytes.
+
+        Parameters
+        ----------
+        pattern
+            Compiled regular expression to match.
+        loc
+            Index in the buffer to match the *pattern* at.
+        max_length
+            Maximum number of bytes the match may span. ``None`` disables the
+            limit.
+
+        Returns
+        -------
+        :
+            The match or ``None`` if the *pattern* does not match. Indices of
+            the match are not relative to the buffer, but ``match.pos``
+            corresponds to *loc*.
+
+        # noqa: DAR202
+        """
+
+    def match_nowait(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        """Match a regular expression at a location in the buffer without
+        blocking.
+
+        Behaves like :meth:`match`, but instead of blocking when the result
+        could still change with more bytes, `WouldBlock` is raised.
+
+        Parameters
+        ----------
+        pattern
+            Compiled regular expression to match.
+        loc
+            Index in the buffer to match the *pattern* at.
+        max_length
+            Maximum number of bytes the match may span. ``None`` disables the
+            limit.
+
+        Returns
+        -------
+        :
+            The match or ``None`` if the *pattern* does not match.
+
+        Raises
+        ------
+        WouldBlock
+            If the result could still change with more bytes.
+
+        # noqa: DAR202
+        """
+
+    async def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        """Find the first occurrence of a byte sequence in the buffer.
+
+        The buffered bytes are searched without copying them. Blocks until an
+        occurrence is found, or the end of file or *end* has been buffered.
+        Bytes that have already been searched are not searched again when more
+        bytes become available.
+
+        Parameters
+        ----------
+        sub
+            Byte sequence to find.
+        start
+            Index in the buffer to start the search at.
+        end
+            Index in the buffer (exclusive) where the occurrence has to end.
+            ``None`` searches until the end of file.
+
+        Returns
+        -------
+        :
+            The index of the first occurrence of *sub* or -1 if there is none.
+
+        # noqa: DAR202
+        """
+
+    def find_nowait(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        """Find the first occurrence of a byte sequence in the buffer without
+        blocking.
+
+        Behaves like :meth:`find`, but instead of blocking when no occurrence
+        has been found in the buffered bytes yet, `WouldBlock` is raised.
+
+        Parameters
+        ----------
+        sub
+            Byte sequence to find.
+        start
+            Index in the buffer to start the search at.
+        end
+            Index in the buffer (exclusive) where the occurrence has to end.
+            ``None`` searches until the end of file.
+
+        Returns
+        -------
+        :
+            The index of the first occurrence of *sub* or -1 if there is none.
+
+        Raises
+        ------
+        WouldBlock
+            If *sub* was not found, but might occur in bytes not buffered yet.
+
+        # noqa: DAR202
+        """
 
     def at_eof(self) -> bool:
         """Whether the end of file has been found.
@@ -66,13 +532,37 @@ class BytesBuffer:
 
     @_copy_doc(ParserBuffer.get)
     async def get(self, key: Union[int, slice]) -> bytes:
+        return self.get_nowait(key)
+
+    @_copy_doc(ParserBuffer.get_nowait)
+    def get_nowait(self, key: Union[int, slice]) -> bytes:
         if not isinstance(key, slice):
             key = slice(key, key + 1)
         return self._data[key]
 
     @_copy_doc(ParserBuffer.get_current)
-    def get_current(self) -> bytes:
-        return self._data
+    def get_current(self, key: slice = slice(None)) -> bytes:
+        return self._data[key]
+
+    @_copy_doc(ParserBuffer.match)
+    async def match(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        return self.match_nowait(pattern, loc, max_length)
+
+    @_copy_doc(ParserBuffer.match_nowait)
+    def match_nowait(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        return _match(pattern, self._data, loc, len(self._data), max_length, True)
+
+    @_copy_doc(ParserBuffer.find)
+    async def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        return self.find_nowait(sub, start, end)
+
+    @_copy_doc(ParserBuffer.find_nowait)
+    def find_nowait(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        return _find(self._data, sub, start, len(self._data), end, True)
 
     def at_eof(self) -> bool:
         """Always returns True as the complete buffer is provided at
@@ -80,55 +570,779 @@ class BytesBuffer:
         return True
 
 
+class MmapBuffer:
+    """Implements the `ParserBuffer` protocol for a memory-mapped file.
+
+    The file is mapped read-only into memory. Only the requested ranges are
+    copied out of the mapping and it is left to the operating system which
+    parts of the file are actually resident in memory. Like `BytesBuffer`, the
+    buffer is static, i.e. all bytes are available from the start.
+
+    The buffer should be closed with :meth:`close` once it is no longer
+    needed. It can also be used as a context manager to close it automatically.
+
+    Parameters
+    ----------
+    path:
+        Path of the file to map into memory.
+    end:
+        Index into the file at which the buffer ends, i.e. bytes from this index
+        onwards are treated as if the file ended there. Defaults to the actual
+        end of the file.
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]"], *, end: Optional[int] = None
+    ):
+        with open(path, "rb") as f:
+            self._data: Union[mmap.mmap, bytes] = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if os.fstat(f.fileno()).st_size > 0
+                else b""
+            )
+        self._offset = 0
+        self._end = len(self._data) if end is None else min(end, len(self._data))
+
+    def __enter__(self) -> "MmapBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._end - self._offset
+
+    def close(self):
+        """Unmap the file from memory."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    @_copy_doc(ParserBuffer.get)
+    async def get(self, key: Union[int, slice]) -> bytes:
+        return self.get_nowait(key)
+
+    @_copy_doc(ParserBuffer.get_nowait)
+    def get_nowait(self, key: Union[int, slice]) -> bytes:
+        if not isinstance(key, slice):
+            key = slice(key, key + 1)
+        if self._offset == 0 and self._end == len(self._data):
+            return self._data[key]
+        return self._data[_offset_slice(key, self._offset, len(self))]
+
+    @_copy_doc(ParserBuffer.get_current)
+    def get_current(self, key: slice = slice(None)) -> bytes:
+        return self.get_nowait(key)
+
+    @_copy_doc(ParserBuffer.match)
+    async def match(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        return self.match_nowait(pattern, loc, max_length)
+
+    @_copy_doc(ParserBuffer.match_nowait)
+    def match_nowait(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        return _match(
+            pattern, self._data, self._offset + loc, self._end, max_length, True
+        )
+
+    @_copy_doc(ParserBuffer.find)
+    async def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        return self.find_nowait(sub, start, end)
+
+    @_copy_doc(ParserBuffer.find_nowait)
+    def find_nowait(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        index = _find(
+            self._data,
+            sub,
+            self._offset + start,
+            self._end,
+            None if end is None else self._offset + end,
+            True,
+        )
+        return index if index < 0 else index - self._offset
+
+    def drop_prefix(self, n: int):
+        """Drop the first *n* bytes in the buffer.
+
+        This does not copy any data, but only moves the start of the buffer
+        within the mapped file.
+        """
+        if n > len(self):
+            raise ValueError("cannot drop more bytes than available")
+        self._offset += n
+
+    def at_eof(self) -> bool:
+        """Always returns True as the complete file is available at
+        construction time."""
+        return True
+
+
+class IterableBuffer:
+    """Implements the `ParserBuffer` protocol for an iterable of ``bytes``
+    chunks.
+
+    Chunks are pulled synchronously from the iterable when bytes beyond the
+    currently buffered ones are requested. Thus, the buffer never blocks in the
+    asynchronous sense, but the iteration itself might block (e.g. when reading
+    from a pipe).
+
+    Chunks are kept as they are and only concatenated if a requested range
+    spans multiple chunks.
+
+    Parameters
+    ----------
+    chunks:
+        Iterable providing the bytes to be read into the buffer.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunk_iter = iter(chunks)
+        self._exhausted = False
+        self._chunks: List[bytes] = []
+        self._chunk_ends: List[int] = []
+        self._start = 0
+
+    def __len__(self) -> int:
+        if not self._chunk_ends:
+            return 0
+        return self._chunk_ends[-1] - self._start
+
+    @_copy_doc(ParserBuffer.get)
+    async def get(self, key: Union[int, slice]) -> bytes:
+        return self.get_nowait(key)
+
+    @_copy_doc(ParserBuffer.get_nowait)
+    def get_nowait(self, key: Union[int, slice]) -> bytes:
+        if not isinstance(key, slice):
+            key = slice(key, key + 1)
+
+        max_index = _max_index(key)
+        while not self._exhausted and (max_index is None or len(self) < max_index):
+            self._pull_chunk()
+        return self._get_buffered(key)
+
+    def _get_buffered(self, key: slice) -> bytes:
+        start, stop, step = key.indices(len(self))
+        if (step > 0 and start >= stop) or (step < 0 and start <= stop):
+            return b""
+
+        if step != 1:
+            self._concat_chunks(0, len(self._chunks))
+            return self._chunks[0][_offset_slice(key, self._start, len(self))]
+
+        first = bisect_right(self._chunk_ends, start + self._start)
+        last = bisect_left(self._chunk_ends, stop + self._start)
+        if first != last:
+            self._concat_chunks(first, last + 1)
+        chunk_start = self._chunk_ends[first] - len(self._chunks[first])
+        return self._chunks[first][
+            start + self._start - chunk_start : stop + self._start - chunk_start
+        ]
+
+    def _pull_chunk(self):
+        try:
+            chunk = next(self._chunk_iter)
+        except StopIteration:
+            self._exhausted = True
+        else:
+            if chunk:
+                self._chunks.append(bytes(chunk))
+                self._chunk_ends.append(len(self) + self._start + len(chunk))
+
+    def _concat_chunks(self, first: int, last: int):
+        self._chunks[first:last] = [b"".join(self._chunks[first:last])]
+        self._chunk_ends[first:last] = [self._chunk_ends[last - 1]]
+
+    @_copy_doc(ParserBuffer.get_current)
+    def get_current(self, key: slice = slice(None)) -> bytes:
+        return self._get_buffered(key)
+
+    @_copy_doc(ParserBuffer.match)
+    async def match(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        return self.match_nowait(pattern, loc, max_length)
+
+    @_copy_doc(ParserBuffer.match_nowait)
+    def match_nowait(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        while True:
+            if loc < len(self):
+                # The pattern can only be matched against a contiguous chunk.
+                first = bisect_right(self._chunk_ends, loc + self._start)
+                self._concat_chunks(first, len(self._chunks))
+                chunk = self._chunks[first]
+                pos = loc + self._start - (self._chunk_ends[first] - len(chunk))
+            else:
+                chunk, pos = b"", 0
+            try:
+                return _match(
+                    pattern, chunk, pos, len(chunk), max_length, self._exhausted
+                )
+            except WouldBlock:
+                self._pull_chunk()
+
+    @_copy_doc(ParserBuffer.find)
+    async def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        return self.find_nowait(sub, start, end)
+
+    @_copy_doc(ParserBuffer.find_nowait)
+    def find_nowait(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        # Each chunk is searched separately to avoid concatenating them.
+        # Occurrences spanning a chunk boundary are found by searching the
+        # last len(sub) - 1 bytes before the boundary joined with the first
+        # bytes after it.
+        start += self._start
+        stop = None if end is None else end + self._start
+        if stop is not None and stop - start < len(sub):
+            return -1
+        if not sub:
+            while len(self) + self._start < start and not self._exhausted:
+                self._pull_chunk()
+            return start - self._start if start <= len(self) + self._start else -1
+        overlap = max(len(sub) - 1, 0)
+        carry = b""
+        i = bisect_right(self._chunk_ends, start)
+        while True:
+            if i == len(self._chunks):
+                if self._exhausted:
+                    return -1
+                self._pull_chunk()
+                continue
+
+            chunk = self._chunks[i]
+            chunk_start = self._chunk_ends[i] - len(chunk)
+            offset = max(start - chunk_start, 0)
+            limit = len(chunk) if stop is None else min(len(chunk), stop - chunk_start)
+            if carry:
+                index = (carry + chunk[: min(overlap, limit)]).find(sub)
+                if index >= 0:
+                    return chunk_start - len(carry) + index - self._start
+            index = chunk.find(sub, offset, limit)
+            if index >= 0:
+                return chunk_start + index - self._start
+            if stop is not None and self._chunk_ends[i] >= stop:
+                return -1
+            if overlap:
+                tail = chunk[max(offset, len(chunk) - overlap) :]
+                carry = (carry + tail)[-overlap:]
+            i += 1
+
+    def drop_prefix(self, n: int):
+        """Drop the first *n* bytes in the buffer.
+
+        Chunks are pulled from the iterable as needed to drop the requested
+        number of bytes.
+        """
+        while len(self) < n and not self._exhausted:
+            self._pull_chunk()
+        if len(self) < n:
+            raise ValueError("cannot drop more bytes than available")
+
+        self._start += n
+        drop = bisect_right(self._chunk_ends, self._start)
+        if drop > 0:
+            dropped_len = self._chunk_ends[drop - 1]
+            del self._chunks[:drop]
+            del self._chunk_ends[:drop]
+            self._start -= dropped_len
+            self._chunk_ends = [end - dropped_len for end in self._chunk_ends]
+
+    @_copy_doc(ParserBuffer.at_eof)
+    def at_eof(self) -> bool:
+        return len(self) == 0 and self._exhausted
+
+
+class FeedBuffer:
+    """Implements the `ParserBuffer` protocol for bytes fed by a driver.
+
+    Instead of reading from a source itself, bytes are written into this buffer
+    by some driver, either by copying them with :meth:`feed` or without copying
+    by writing directly into the memory provided with :meth:`get_buffer` (as
+    done by a :class:`asyncio.BufferedProtocol`).
+
+    When :meth:`get` needs to wait for more data, it yields `WAIT_FOR_DATA` to
+    the driver of the coroutine instead of an :mod:`asyncio` future. Thus, the
+    parse coroutine has to be driven by calling its ``send`` method after more
+    data has been fed and cannot be awaited in an :mod:`asyncio` task.
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._start = 0
+        self._end = 0
+        self._eof = False
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Get writable memory to write at least *sizehint* bytes into.
+
+        The memory directly follows the bytes currently stored in the buffer.
+        Call :meth:`buffer_updated` after writing to it.
+
+        Parameters
+        ----------
+        sizehint:
+            Minimum size of the returned memory. Values smaller than 1 request
+            a buffer of the default chunk size.
+
+        Returns
+        -------
+        :
+            Memory to write the data into.
+        """
+        if sizehint < 1:
+            sizehint = DEFAULT_CHUNK_SIZE
+        if len(self._buf) - self._end < sizehint:
+            pending = len(self)
+            if self._start >= pending and len(self._buf) - pending >= sizehint:
+                # Compacting copies at most as many bytes as it reclaims.
+                self._buf[:pending] = self._buf[self._start : self._end]
+            else:
+                # Growing geometrically keeps appending amortized linear.
+                buf = bytearray(max(pending + sizehint, 2 * len(self._buf)))
+                buf[:pending] = self._buf[self._start : self._end]
+                self._buf = buf
+            self._start = 0
+            self._end = pending
+        return memoryview(self._buf)[self._end :]
+
+    def buffer_updated(self, nbytes: int):
+        """Mark *nbytes* bytes written to the memory obtained with
+        :meth:`get_buffer` as stored in the buffer."""
+        self._end += nbytes
+
+    def feed(self, data: bytes):
+        """Copy *data* into the buffer."""
+        with self.get_buffer(len(data)) as memory:
+            memory[: len(data)] = data
+        self.buffer_updated(len(data))
+
+    def feed_eof(self):
+        """Mark the end of file. No more data may be fed afterwards."""
+        self._eof = True
+
+    @_copy_doc(ParserBuffer.get)
+    async def get(self, key: Union[int, slice]) -> bytes:
+        while True:
+            try:
+                return self.get_nowait(key)
+            except WouldBlock:
+                await WAIT_FOR_DATA
+
+    @_copy_doc(ParserBuffer.get_nowait)
+    def get_nowait(self, key: Union[int, slice]) -> bytes:
+        if not isinstance(key, slice):
+            key = slice(key, key + 1)
+
+        max_index = _max_index(key)
+        if not self._eof and (max_index is None or len(self) < max_index):
+            raise WouldBlock()
+        return self.get_current(key)
+
+    @_copy_doc(ParserBuffer.get_current)
+    def get_current(self, key: slice = slice(None)) -> bytes:
+        return _bytes_slice(self._buf, _offset_slice(key, self._start, len(self)))
+
+    @_copy_doc(ParserBuffer.match)
+    async def match(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        while True:
+            try:
+                return self.match_nowait(pattern, loc, max_length)
+            except WouldBlock:
+                await WAIT_FOR_DATA
+
+    @_copy_doc(ParserBuffer.match_nowait)
+    def match_nowait(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        return _match(
+            pattern, self._buf, self._start + loc, self._end, max_length, self._eof
+        )
+
+    @_copy_doc(ParserBuffer.find)
+    async def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        while True:
+            try:
+                return self.find_nowait(sub, start, end)
+            except WouldBlock:
+                # Only the bytes fed from now on can complete an occurrence.
+                start = max(start, len(self) - len(sub) + 1)
+                await WAIT_FOR_DATA
+
+    @_copy_doc(ParserBuffer.find_nowait)
+    def find_nowait(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        index = _find(
+            self._buf,
+            sub,
+            self._start + start,
+            self._end,
+            None if end is None else self._start + end,
+            self._eof,
+        )
+        return index if index < 0 else index - self._start
+
+    def drop_prefix(self, n: int):
+        """Drop the first *n* bytes in the buffer."""
+        if n > len(self):
+            raise ValueError("cannot drop more bytes than available")
+        self._start += n
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    @_copy_doc(ParserBuffer.at_eof)
+    def at_eof(self) -> bool:
+        return len(self) == 0 and self._eof
+
+
+@dataclass
+class StreamStats:
+    """Counters describing the processing of a stream.
+
+    Pass an instance to `StreamReaderBuffer` or `bite.parse_incremental` to
+    collect the counters. The ``record_*`` methods are called for each read and
+    message and can be overridden to additionally forward individual
+    observations, for example, to a histogram of a metrics system.
+    """
+
+    bytes_read: int = 0
+    """Total number of bytes read from the stream."""
+
+    reads: int = 0
+    """Number of read calls to the stream."""
+
+    buffer_high_water_mark: int = 0
+    """Maximum number of bytes held in the buffer at once."""
+
+    io_wait_time: float = 0.0
+    """Time in seconds spent waiting for reads from the stream to complete."""
+
+    messages: int = 0
+    """Number of parsed messages."""
+
+    message_bytes: int = 0
+    """Total number of bytes of the parsed messages."""
+
+    parse_time: float = 0.0
+    """Time in seconds spent parsing messages excluding the time waiting for
+    reads."""
+
+    max_message_latency: float = 0.0
+    """Maximum time in seconds from starting to parse a message until it was
+    completely parsed, including time waiting for reads."""
+
+    def record_read(self, size: int, buffered: int, wait_time: float):
+        """Record a completed read from the stream.
+
+        Parameters
+        ----------
+        size:
+            Number of bytes read.
+        buffered:
+            Number of bytes buffered after the read.
+        wait_time:
+            Time in seconds that the read took.
+        """
+        self.bytes_read += size
+        self.reads += 1
+        self.io_wait_time += wait_time
+        if buffered > self.buffer_high_water_mark:
+            self.buffer_high_water_mark = buffered
+
+    def record_message(self, size: int, latency: float, parse_time: float):
+        """Record a parsed message.
+
+        Parameters
+        ----------
+        size:
+            Number of bytes of the message.
+        latency:
+            Time in seconds from starting to parse the message until it was
+            completely parsed.
+        parse_time:
+            Part of the *latency* not spent waiting for reads.
+        """
+        self.messages += 1
+        self.message_bytes += size
+        self.parse_time += parse_time
+        if latency > self.max_message_latency:
+            self.max_message_latency = latency
+
+
 class StreamReaderBuffer:
     """Implements the `ParserBuffer` protocol for a :class:`asyncio.StreamReader`.
 
+    Bytes are read ahead in chunks: whenever the buffer has to wait for more
+    bytes, it requests up to *chunk_size* bytes from the *reader* and accepts
+    whatever is available at that point. It only blocks if strictly more bytes
+    are required to serve a request.
+
     Parameters
     ----------
     reader:
         Reader providing the bytes to be read into the buffer.
+    chunk_size:
+        Maximum number of bytes to read ahead with a single read from the
+        *reader*.
+    max_buffer_size:
+        Maximum number of bytes to hold in the buffer. Read-ahead is limited
+        accordingly. If more bytes are required to serve a request, a
+        `BufferLimitExceededError` is raised. ``None`` disables the limit.
+    max_lookahead:
+        Maximum (exclusive) index that may be requested from the buffer, i.e.
+        how far parsers may look ahead from the start of the buffer. Requests
+        beyond this index raise a `BufferLimitExceededError`. This includes
+        requests up to the end of file. ``None`` disables the limit.
+    stats:
+        `StreamStats` to record the reads from the *reader* in.
     """
 
-    def __init__(self, reader: StreamReader):
+    def __init__(
+        self,
+        reader: StreamReader,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_buffer_size: Optional[int] = None,
+        max_lookahead: Optional[int] = None,
+        stats: Optional[StreamStats] = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
         self._reader = reader
+        self._chunk_size = chunk_size
+        self._max_buffer_size = max_buffer_size
+        self._max_lookahead = max_lookahead
         self._buf = bytearray()
+        self.stats = stats
 
     @_copy_doc(ParserBuffer.get)
     async def get(self, key: Union[int, slice]) -> bytes:
         if not isinstance(key, slice):
             key = slice(key, key + 1)
 
-        if key.step is None or key.step > 0:
-            max_index = key.stop
-        elif key.start is not None:
-            max_index = key.start + 1
+        max_index = _max_index(key)
+        self._check_lookahead(max_index)
+        if max_index is None:
+            while await self._read_chunk(1):
+                pass
         else:
-            max_index = None
+            while len(self._buf) < max_index:
+                if not await self._read_chunk(max_index - len(self._buf)):
+                    break
 
-        if max_index is None or max_index < 0:
-            self._buf.extend(await self._reader.read())
-        elif len(self._buf) <= max_index:
-            try:
-                self._buf.extend(
-                    await self._reader.readexactly(max_index - len(self._buf))
-                )
-            except IncompleteReadError as err:
-                self._buf.extend(err.partial)
+        return _bytes_slice(self._buf, key)
+
+    @_copy_doc(ParserBuffer.get_nowait)
+    def get_nowait(self, key: Union[int, slice]) -> bytes:
+        if not isinstance(key, slice):
+            key = slice(key, key + 1)
+
+        max_index = _max_index(key)
+        self._check_lookahead(max_index)
+        if not self._reader.at_eof() and (
+            max_index is None or len(self._buf) < max_index
+        ):
+            raise WouldBlock()
 
-        return self._buf[key]
+        return _bytes_slice(self._buf, key)
+
+    def _check_lookahead(self, max_index: Optional[int]):
+        if self._max_lookahead is not None and (
+            max_index is None or max_index > self._max_lookahead
+        ):
+            raise BufferLimitExceededError(
+                f"lookahead of {'unlimited' if max_index is None else max_index} "
+                f"bytes exceeds the limit of {self._max_lookahead} bytes"
+            )
+
+    async def _read_chunk(self, min_size: int) -> int:
+        size = max(min_size, self._chunk_size)
+        if self._max_buffer_size is not None:
+            available_size = self._max_buffer_size - len(self._buf)
+            if min_size > available_size and not self._reader.at_eof():
+                raise BufferLimitExceededError(
+                    f"buffering {len(self._buf) + min_size} bytes exceeds the "
+                    f"limit of {self._max_buffer_size} bytes"
+                )
+            size = min(size, available_size)
+        if self.stats is None:
+            chunk = await self._reader.read(size)
+            self._buf.extend(chunk)
+        else:
+            start = time.perf_counter()
+            chunk = await self._reader.read(size)
+            self._buf.extend(chunk)
+            self.stats.record_read(
+                len(chunk), len(self._buf), time.perf_counter() - start
+            )
+        return len(chunk)
 
     @_copy_doc(ParserBuffer.get_current)
-    def get_current(self) -> bytes:
-        return self._buf[:]
+    def get_current(self, key: slice = slice(None)) -> bytes:
+        return _bytes_slice(self._buf, key)
+
+    @_copy_doc(ParserBuffer.match)
+    async def match(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        while True:
+            try:
+                return self.match_nowait(pattern, loc, max_length)
+            except WouldBlock:
+                self._check_lookahead(len(self._buf) + 1)
+                await self._read_chunk(1)
+
+    @_copy_doc(ParserBuffer.match_nowait)
+    def match_nowait(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        return _match(
+            pattern,
+            self._buf,
+            loc,
+            len(self._buf),
+            max_length,
+            self._reader.at_eof(),
+        )
+
+    @_copy_doc(ParserBuffer.find)
+    async def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        while True:
+            try:
+                return self.find_nowait(sub, start, end)
+            except WouldBlock:
+                # Only the bytes read from now on can complete an occurrence.
+                start = max(start, len(self._buf) - len(sub) + 1)
+                self._check_lookahead(len(self._buf) + 1)
+                await self._read_chunk(1)
+
+    @_copy_doc(ParserBuffer.find_nowait)
+    def find_nowait(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        return _find(self._buf, sub, start, len(self._buf), end, self._reader.at_eof())
 
     async def drop_prefix(self, n: int):
         """Drop the first *n* bytes in the buffer."""
         if len(self._buf) < n:
-            await self._reader.readexactly(n - len(self._buf))
+            start = time.perf_counter()
+            skipped = await self._reader.readexactly(n - len(self._buf))
+            if self.stats is not None:
+                self.stats.record_read(
+                    len(skipped), len(self._buf), time.perf_counter() - start
+                )
             self._buf = bytearray()
         else:
-            self._buf = bytearray(self._buf[n:])
+            del self._buf[:n]
 
     @_copy_doc(ParserBuffer.at_eof)
     def at_eof(self) -> bool:
         return len(self._buf) == 0 and self._reader.at_eof()
+
+
+class YieldingBuffer:
+    """Wraps a `ParserBuffer` to periodically yield to the event loop while
+    parsing.
+
+    If all required input is already buffered, a parse never suspends and
+    blocks the event loop until it is done. This buffer limits the number of
+    buffer accesses (roughly corresponding to parser invocations) and the time
+    between suspensions. Once one of the limits is exceeded, the synchronous
+    fast path is interrupted with `WouldBlock` and the next asynchronous access
+    yields to the event loop with ``asyncio.sleep(0)``.
+
+    Parameters
+    ----------
+    buffer:
+        The buffer to wrap.
+    max_steps:
+        Maximum number of buffer accesses between yielding to the event loop.
+        ``None`` disables the limit.
+    max_interval:
+        Maximum time in seconds between yielding to the event loop. ``None``
+        disables the limit.
+    """
+
+    def __init__(
+        self,
+        buffer: ParserBuffer,
+        *,
+        max_steps: Optional[int] = None,
+        max_interval: Optional[float] = None,
+    ):
+        if max_steps is not None and max_steps < 1:
+            raise ValueError("max_steps must be positive")
+        self.buffer = buffer
+        self._max_steps = max_steps
+        self._max_interval = max_interval
+        self._reset_budget()
+
+    def _reset_budget(self):
+        self._steps = 0
+        self._deadline = (
+            None
+            if self._max_interval is None
+            else time.monotonic() + self._max_interval
+        )
+
+    def _consume_budget(self) -> bool:
+        self._steps += 1
+        return (self._max_steps is not None and self._steps > self._max_steps) or (
+            self._deadline is not None and time.monotonic() >= self._deadline
+        )
+
+    @_copy_doc(ParserBuffer.get)
+    async def get(self, key: Union[int, slice]) -> bytes:
+        if self._consume_budget():
+            await asyncio.sleep(0)
+            self._reset_budget()
+        return await self.buffer.get(key)
+
+    @_copy_doc(ParserBuffer.get_nowait)
+    def get_nowait(self, key: Union[int, slice]) -> bytes:
+        if self._consume_budget():
+            raise WouldBlock()
+        return self.buffer.get_nowait(key)
+
+    @_copy_doc(ParserBuffer.get_current)
+    def get_current(self, key: slice = slice(None)) -> bytes:
+        return self.buffer.get_current(key)
+
+    @_copy_doc(ParserBuffer.match)
+    async def match(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        if self._consume_budget():
+            await asyncio.sleep(0)
+            self._reset_budget()
+        return await self.buffer.match(pattern, loc, max_length)
+
+    @_copy_doc(ParserBuffer.match_nowait)
+    def match_nowait(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        if self._consume_budget():
+            raise WouldBlock()
+        return self.buffer.match_nowait(pattern, loc, max_length)
+
+    @_copy_doc(ParserBuffer.find)
+    async def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        if self._consume_budget():
+            await asyncio.sleep(0)
+            self._reset_budget()
+        return await self.buffer.find(sub, start, end)
+
+    @_copy_doc(ParserBuffer.find_nowait)
+    def find_nowait(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        if self._consume_budget():
+            raise WouldBlock()
+        return self.buffer.find_nowait(sub, start, end)
+
+    @_copy_doc(ParserBuffer.at_eof)
+    def at_eof(self) -> bool:
+        return self.buffer.at_eof()
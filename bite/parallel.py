@@ -0,0 +1,446 @@
+import asyncio
+import functools
+import itertools
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from bite.io import (
+    DEFAULT_CHUNK_SIZE,
+    BytesBuffer,
+    MmapBuffer,
+    ParserBuffer,
+    WouldBlock,
+)
+from bite.parsers import (
+    ParsedNode,
+    ParsedRepeat,
+    ParseError,
+    Parser,
+    Repeat,
+    TrailingBytesError,
+    UnmetExpectationError,
+)
+
+T = TypeVar("T", covariant=True)
+V = TypeVar("V", covariant=True)
+
+_Batch = Tuple[int, List[bytes]]
+_BatchResult = Tuple[int, List[Union[ParsedNode, ParseError]]]
+
+_worker_grammar: Optional[Parser] = None
+_worker_parse_all = False
+
+
+def _init_worker(grammar: Parser, parse_all: bool):
+    global _worker_grammar, _worker_parse_all
+    _worker_grammar = grammar
+    _worker_parse_all = parse_all
+
+
+def _parse_batch(batch: _Batch) -> _BatchResult:
+    assert _worker_grammar is not None
+    start_index, inputs = batch
+    results: List[Union[ParsedNode, ParseError]] = []
+    for data in inputs:
+        try:
+            results.append(_parse_data(_worker_grammar, data, _worker_parse_all))
+        except ParseError as err:
+            results.append(err)
+    return start_index, results
+
+
+def _parse_data(grammar: Parser[T, V], data: bytes, parse_all: bool) -> ParsedNode:
+    buffer = BytesBuffer(data)
+    parse_tree = _parse_buffer(grammar, buffer, 0)
+    if parse_all and parse_tree.end_loc < len(data):
+        raise TrailingBytesError("trailing bytes")
+    return parse_tree
+
+
+def _parse_buffer(grammar: Parser[T, V], buffer: ParserBuffer, loc: int) -> ParsedNode:
+    try:
+        return grammar.parse_nowait(buffer, loc)
+    except WouldBlock:
+        return asyncio.run(grammar.parse(buffer, loc))
+
+
+def _parse_file_chunk(path: Union[str, "os.PathLike[str]"], start: int, end: int):
+    assert _worker_grammar is not None
+    with MmapBuffer(path, end=end) as buffer:
+        return _parse_buffer(_worker_grammar, buffer, start)
+
+
+def _batches(inputs: Iterable[bytes], batch_size: int) -> Iterator[_Batch]:
+    iterator = iter(inputs)
+    for start_index in itertools.count(step=batch_size):
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield start_index, batch
+
+
+def parse_many(
+    grammar: Parser[T, V],
+    inputs: Iterable[bytes],
+    *,
+    workers: Optional[int] = None,
+    batch_size: int = 64,
+    ordered: bool = True,
+    parse_all: bool = False,
+    return_exceptions: bool = False,
+) -> Iterator[Any]:
+    r"""Parse many independent bytes objects in parallel worker processes.
+
+    The *grammar* is sent to each worker process only once. The *inputs* are
+    sent to the workers in batches of *batch_size* to reduce the communication
+    overhead. Only a limited number of batches is submitted at a time, such
+    that the *inputs* may be a lazily evaluated iterable of arbitrary length.
+
+    Parse trees are transferred back from the worker processes by pickling.
+    Thus, the *grammar* and the values in the resulting parse trees need to be
+    picklable. In particular, functions given to `bite.transformers.Transform`
+    and `bite.transformers.TransformValues` must not be lambdas or local
+    functions.
+
+    Parameters
+    ----------
+    grammar:
+        Parser combinators defining the grammar to parse.
+    inputs:
+        The bytes objects to parse. Each one is parsed independently.
+    workers:
+        Number of worker processes. Defaults to the number of processors.
+    batch_size:
+        Number of *inputs* to send to a worker process at once.
+    ordered:
+        If set to ``True``, the results are yielded in the order of the
+        *inputs*. Otherwise, tuples of the index into the *inputs* and the
+        result are yielded in the order that they are completed.
+    parse_all:
+        If set to ``True``, all bytes of each input must be parsed. Otherwise,
+        trailing, unparsed bytes are allowed.
+    return_exceptions:
+        If set to ``True``, a `bite.parsers.ParseError` for an input is yielded
+        in place of the parse tree instead of being raised.
+
+    Yields
+    ------
+    :
+        The parse tree for each of the *inputs* if *ordered* is ``True``,
+        otherwise a tuple of the index of the input and its parse tree.
+
+    Raises
+    ------
+    ValueError
+        If the *batch_size* is not positive.
+    bite.parsers.TrailingBytesError
+        If ``parse_all=True`` and not all of an input was consumed by the
+        parser.
+    bite.parsers.ParseError
+        If the provided *grammar* fails to parse one of the inputs and
+        ``return_exceptions=False``.
+
+    Examples
+    --------
+
+    .. testcode:: parse_many
+
+        from bite import CharacterSet, Combine, Literal, parse_many
+
+        integer_token = Combine(CharacterSet(b'0123456789')[1, ...])
+        expr = integer_token + Literal(b'+') + integer_token
+
+        for parse_tree in parse_many(expr, [b"1+2", b"23+42", b"1234+4321"]):
+            print(parse_tree.values)
+
+    .. testoutput:: parse_many
+
+        (b'1', b'+', b'2')
+        (b'23', b'+', b'42')
+        (b'1234', b'+', b'4321')
+    """
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(grammar, parse_all)
+    )
+    try:
+        # Keep the workers busy while the results of a batch are consumed.
+        max_pending = 2 * workers
+        batches = _batches(inputs, batch_size)
+        if ordered:
+            results = _map_ordered(executor, batches, max_pending)
+        else:
+            results = _map_as_completed(executor, batches, max_pending)
+
+        for index, result in results:
+            if isinstance(result, ParseError) and not return_exceptions:
+                raise result
+            yield result if ordered else (index, result)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _map_ordered(
+    executor: ProcessPoolExecutor, batches: Iterator[_Batch], max_pending: int
+) -> Iterator[Tuple[int, Any]]:
+    pending: Deque[Future[_BatchResult]] = deque()
+    for batch in batches:
+        pending.append(executor.submit(_parse_batch, batch))
+        if len(pending) >= max_pending:
+            yield from _enumerate_batch_result(pending.popleft().result())
+    while pending:
+        yield from _enumerate_batch_result(pending.popleft().result())
+
+
+def _map_as_completed(
+    executor: ProcessPoolExecutor, batches: Iterator[_Batch], max_pending: int
+) -> Iterator[Tuple[int, Any]]:
+    pending: Set[Future[_BatchResult]] = set()
+    for batch in batches:
+        pending.add(executor.submit(_parse_batch, batch))
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from _enumerate_batch_result(future.result())
+    for future in as_completed(pending):
+        yield from _enumerate_batch_result(future.result())
+
+
+def _enumerate_batch_result(batch_result: _BatchResult) -> Iterator[Tuple[int, Any]]:
+    start_index, results = batch_result
+    return enumerate(results, start_index)
+
+
+def parse_file_parallel(
+    grammar: Repeat[T, V],
+    path: Union[str, "os.PathLike[str]"],
+    *,
+    delimiter: Optional[bytes] = None,
+    sync_point: Optional[Callable[[ParserBuffer, int], bool]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 2**24,
+    parse_all: bool = False,
+) -> ParsedRepeat:
+    r"""Parse a file with a repeated grammar in parallel worker processes.
+
+    The file is mapped into memory and split into chunks of approximately
+    *chunk_size* bytes. Each chunk is parsed with the repeated parser of the
+    *grammar* in a worker process and the results are combined into a single
+    parse tree with location indices relative to the start of the file.
+
+    Chunks are only split at synchronization points, i.e. locations where a
+    match of the repeated parser may start. These are either given by a
+    *delimiter* (a chunk starts right after it) or a *sync_point* predicate.
+    A match of the repeated parser must never span a synchronization point.
+    Otherwise, the result might differ from parsing the file sequentially.
+
+    Parameters
+    ----------
+    grammar:
+        The `bite.parsers.Repeat` parser to apply to the file.
+    path:
+        Path of the file to parse.
+    delimiter:
+        Bytes after which a new chunk may start.
+    sync_point:
+        Function taking a buffer of the file and an index into it and returning
+        whether a new chunk may start at the index. Only called for locations
+        close to the desired chunk boundaries.
+    workers:
+        Number of worker processes. Defaults to the number of processors.
+    chunk_size:
+        Approximate number of bytes in each chunk.
+    parse_all:
+        If set to ``True``, the whole file must be parsed. Otherwise, trailing,
+        unparsed bytes are allowed.
+
+    Returns
+    -------
+    :
+        The resulting parse tree.
+
+    Raises
+    ------
+    TypeError
+        If the *grammar* is not a `bite.parsers.Repeat` parser.
+    ValueError
+        If not exactly one of *delimiter* and *sync_point* is given, the
+        *chunk_size* is not positive, or a match of the repeated parser has been
+        found to span a synchronization point.
+    bite.parsers.TrailingBytesError
+        If ``parse_all=True`` and not the whole file was consumed by the
+        parser.
+    bite.parsers.ParseError
+        If the provided *grammar* fails to parse the file.
+
+    Examples
+    --------
+
+    .. testcode:: parse_file_parallel
+        :hide:
+
+        import os
+        import tempfile
+
+        cwd = os.getcwd()
+        tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(tmp_dir.name)
+        with open("lines.txt", "wb") as f:
+            f.write(b"1+2\r\n23+42\r\n1234+4321\r\n")
+
+    .. testcode:: parse_file_parallel
+
+        from bite import CharacterSet, Combine, Literal, parse_file_parallel
+
+        integer_token = Combine(CharacterSet(b'0123456789')[1, ...])
+        line = integer_token + Literal(b'+') + integer_token + Literal(b'\r\n')
+
+        parse_tree = parse_file_parallel(
+            line[0, ...], "lines.txt", delimiter=b"\r\n", chunk_size=8
+        )
+        for parsed_line in parse_tree.parse_tree:
+            print(parsed_line.start_loc, parsed_line.values[:3])
+
+    .. testoutput:: parse_file_parallel
+
+        0 (b'1', b'+', b'2')
+        5 (b'23', b'+', b'42')
+        12 (b'1234', b'+', b'4321')
+
+    .. testcode:: parse_file_parallel
+        :hide:
+
+        os.chdir(cwd)
+        tmp_dir.cleanup()
+    """
+
+    if not isinstance(grammar, Repeat):
+        raise TypeError("grammar must be a Repeat parser")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    find_sync_point: Callable[[MmapBuffer, int], int]
+    if delimiter is not None and sync_point is None:
+        if len(delimiter) == 0:
+            raise ValueError("delimiter must not be empty")
+        find_sync_point = functools.partial(_find_after_delimiter, delimiter)
+    elif sync_point is not None and delimiter is None:
+        find_sync_point = functools.partial(_scan_for_sync_point, sync_point)
+    else:
+        raise ValueError("exactly one of delimiter and sync_point must be given")
+
+    with MmapBuffer(path) as buffer:
+        file_size = len(buffer)
+        bounds = _chunk_bounds(buffer, chunk_size, find_sync_point)
+
+    parsed: List[ParsedNode] = []
+    complete = True
+    # The workers apply the repeated parser without limiting the number of
+    # repetitions as the limits can only be checked on the combined result.
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(Repeat(grammar.parser), False),
+    )
+    try:
+        chunk_trees = executor.map(
+            _parse_file_chunk,
+            itertools.repeat(path),
+            (start for start, _ in bounds),
+            (end for _, end in bounds),
+        )
+        for (_, end), chunk_tree in zip(bounds, chunk_trees):
+            parsed.extend(chunk_tree.parse_tree)
+            if chunk_tree.end_loc < end:
+                complete = False
+                break
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    if grammar.max_repeats is not None and len(parsed) >= grammar.max_repeats:
+        del parsed[grammar.max_repeats :]
+    elif not complete or len(parsed) < grammar.min_repeats:
+        _check_end_of_repetition(grammar, path, parsed)
+
+    parse_tree = ParsedRepeat(grammar.name, tuple(parsed), 0)
+    if parse_all and parse_tree.end_loc < file_size:
+        raise TrailingBytesError("trailing bytes")
+    return parse_tree
+
+
+def _find_after_delimiter(delimiter: bytes, buffer: MmapBuffer, loc: int) -> int:
+    window_start = max(0, loc - len(delimiter))
+    while True:
+        window = buffer.get_nowait(
+            slice(window_start, window_start + DEFAULT_CHUNK_SIZE + len(delimiter))
+        )
+        index = window.find(delimiter)
+        if index >= 0:
+            return window_start + index + len(delimiter)
+        if window_start + len(window) >= len(buffer):
+            return len(buffer)
+        window_start += len(window) - len(delimiter) + 1
+
+
+def _scan_for_sync_point(
+    sync_point: Callable[[ParserBuffer, int], bool], buffer: MmapBuffer, loc: int
+) -> int:
+    while loc < len(buffer) and not sync_point(buffer, loc):
+        loc += 1
+    return loc
+
+
+def _chunk_bounds(
+    buffer: MmapBuffer,
+    chunk_size: int,
+    find_sync_point: Callable[[MmapBuffer, int], int],
+) -> List[Tuple[int, int]]:
+    bounds = []
+    start = 0
+    while start < len(buffer):
+        end = start + chunk_size
+        end = find_sync_point(buffer, end) if end < len(buffer) else len(buffer)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _check_end_of_repetition(
+    grammar: Repeat, path: Union[str, "os.PathLike[str]"], parsed: List[ParsedNode]
+):
+    # Parsing the next repetition has to fail at the end of the combined
+    # result, just as it would if the file were parsed sequentially.
+    end_loc = parsed[-1].end_loc if parsed else 0
+    # Not closed as a raised ParseError might still need to access the buffer.
+    buffer = MmapBuffer(path)
+    try:
+        _parse_buffer(grammar.parser, buffer, end_loc)
+    except UnmetExpectationError:
+        if len(parsed) < grammar.min_repeats:
+            raise
+        return
+    raise ValueError(f"a match of the repeated parser spans location {end_loc}")
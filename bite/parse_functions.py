@@ -1,24 +1,94 @@
+import asyncio
+import os
+import time
 from asyncio import StreamReader
-from typing import AsyncGenerator, TypeVar
-
-from bite.io import BytesBuffer, StreamReaderBuffer
-from bite.parsers import ParsedNode, Parser, TrailingBytesError
+from concurrent.futures import Executor
+from typing import (
+    AsyncGenerator,
+    BinaryIO,
+    Generator,
+    Iterable,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from bite.io import (
+    DEFAULT_CHUNK_SIZE,
+    BufferLimitExceededError,
+    BytesBuffer,
+    FeedBuffer,
+    IterableBuffer,
+    MmapBuffer,
+    ParserBuffer,
+    StreamReaderBuffer,
+    StreamStats,
+    WouldBlock,
+    YieldingBuffer,
+)
+from bite.parsers import ParsedNode, ParseError, Parser, TrailingBytesError
 
 T = TypeVar("T", covariant=True)
 V = TypeVar("V", covariant=True)
 
 
 async def parse_incremental(
-    grammar: Parser[T, V], reader: StreamReader
+    grammar: Parser[T, V],
+    reader: StreamReader,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_buffer_size: Optional[int] = None,
+    max_lookahead: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    offload_threshold: int = DEFAULT_CHUNK_SIZE,
+    yield_steps: Optional[int] = None,
+    yield_interval: Optional[float] = None,
+    stats: Optional[StreamStats] = None,
 ) -> AsyncGenerator[ParsedNode[T, V], None]:
     r"""Parse bytes from an asynchronous stream incrementally.
 
+    Parsing a large message that has already been received completely can
+    block the event loop for a considerable time. To avoid this, an *executor*
+    can be given. Each message is first parsed on the event loop. Once that
+    parse looks ahead beyond *offload_threshold* bytes, it is abandoned and the
+    buffered bytes (at most *max_lookahead*) are parsed in the *executor*
+    instead. If the bytes do not contain a complete message, the message is
+    parsed on the event loop as usual while the remaining bytes are received.
+
     Parameters
     ----------
     grammar:
         Parser combinators defining the grammar to parse.
     reader:
         The stream reader to read bytes with.
+    chunk_size:
+        Maximum number of bytes to read ahead with a single read from the
+        *reader*.
+    max_buffer_size:
+        Maximum number of bytes to buffer. ``None`` disables the limit.
+    max_lookahead:
+        Maximum number of bytes that a single match of the *grammar* may look
+        ahead (i.e., the maximum size of a message). ``None`` disables the limit.
+    executor:
+        A :class:`concurrent.futures.Executor` to parse messages in. If a
+        :class:`concurrent.futures.ProcessPoolExecutor` is used, the *grammar*
+        needs to be picklable.
+    offload_threshold:
+        Number of bytes that a message may look ahead on the event loop before
+        it is parsed in the *executor*.
+    yield_steps:
+        Maximum number of buffer accesses by the *grammar* between yielding to
+        the event loop. ``None`` disables the limit. See
+        `bite.io.YieldingBuffer`.
+    yield_interval:
+        Maximum time in seconds between yielding to the event loop while
+        parsing. ``None`` disables the limit.
+    stats:
+        `bite.io.StreamStats` to record reads and parsed messages in.
 
     Yields
     ------
@@ -31,6 +101,9 @@ async def parse_incremental(
     ------
     bite.parsers.ParseError
         If the provided *grammar* fails to parse the incoming bytes.
+    bite.io.BufferLimitExceededError
+        If parsing a message would exceed the *max_buffer_size* or
+        *max_lookahead*.
 
     Examples
     --------
@@ -76,16 +149,260 @@ async def parse_incremental(
         Parsed line: (b'1234', b'+', b'4321')
     """
 
-    buffer = StreamReaderBuffer(reader)
+    buffer = StreamReaderBuffer(
+        reader,
+        chunk_size=chunk_size,
+        max_buffer_size=max_buffer_size,
+        max_lookahead=max_lookahead,
+        stats=stats,
+    )
+    parse_buffer = _yielding(buffer, yield_steps, yield_interval)
+    if executor is not None:
+        # Read the available bytes to be able to offload the first message.
+        await buffer.get(slice(0, 1))
     while not buffer.at_eof():
-        parse_tree = await grammar.parse(buffer, 0)
+        start = _start_message(stats)
+        parse_tree = None
+        if executor is not None:
+            probe = _OffloadProbe(parse_buffer, offload_threshold)
+            try:
+                parse_tree = grammar.parse_nowait(probe, 0)
+            except WouldBlock:
+                if probe.exceeded:
+                    buffered = buffer.get_current(slice(0, max_lookahead))
+                    at_eof = reader.at_eof() and (
+                        max_lookahead is None or len(buffered) < max_lookahead
+                    )
+                    parse_tree = await asyncio.get_running_loop().run_in_executor(
+                        executor, _parse_buffered, grammar, buffered, at_eof
+                    )
+            if parse_tree is None:
+                parse_tree = await grammar.parse(parse_buffer, 0)
+        else:
+            try:
+                parse_tree = grammar.parse_nowait(parse_buffer, 0)
+            except WouldBlock:
+                parse_tree = await grammar.parse(parse_buffer, 0)
+        if stats is not None:
+            _record_message(stats, start, parse_tree.end_loc)
         yield parse_tree
         await buffer.drop_prefix(parse_tree.end_loc)
         await buffer.get(slice(0, 1))  # Ensure to read EOF state
 
 
+def _start_message(stats: Optional[StreamStats]) -> Tuple[float, float]:
+    if stats is None:
+        return 0.0, 0.0
+    return time.perf_counter(), stats.io_wait_time
+
+
+def _record_message(stats: StreamStats, start: Tuple[float, float], size: int):
+    start_time, start_io_wait_time = start
+    latency = time.perf_counter() - start_time
+    parse_time = latency - (stats.io_wait_time - start_io_wait_time)
+    stats.record_message(size, latency, parse_time)
+
+
+def _yielding(
+    buffer: ParserBuffer, yield_steps: Optional[int], yield_interval: Optional[float]
+) -> ParserBuffer:
+    if yield_steps is None and yield_interval is None:
+        return buffer
+    return YieldingBuffer(buffer, max_steps=yield_steps, max_interval=yield_interval)
+
+
+class _OffloadProbe:
+    # Interrupts a synchronous parse with WouldBlock once it accesses bytes
+    # beyond the threshold, which marks the message as large enough to be
+    # parsed in an executor.
+
+    def __init__(self, buffer: ParserBuffer, threshold: int):
+        self.buffer = buffer
+        self.threshold = threshold
+        self.exceeded = False
+
+    def _check(self, stop: Optional[int]):
+        if stop is None or stop < 0 or stop > self.threshold:
+            self.exceeded = True
+            raise WouldBlock()
+
+    async def get(self, key: Union[int, slice]) -> bytes:
+        return await self.buffer.get(key)
+
+    def get_nowait(self, key: Union[int, slice]) -> bytes:
+        self._check(key + 1 if isinstance(key, int) else key.stop)
+        return self.buffer.get_nowait(key)
+
+    def get_current(self, key: slice = slice(None)) -> bytes:
+        return self.buffer.get_current(key)
+
+    async def match(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        return await self.buffer.match(pattern, loc, max_length)
+
+    def match_nowait(
+        self, pattern: "Pattern[bytes]", loc: int, max_length: Optional[int] = None
+    ) -> Optional["Match[bytes]"]:
+        self._check(loc + 1)
+        return self.buffer.match_nowait(pattern, loc, max_length)
+
+    async def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        return await self.buffer.find(sub, start, end)
+
+    def find_nowait(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        self._check(start + 1)
+        return self.buffer.find_nowait(sub, start, end)
+
+    def at_eof(self) -> bool:
+        return self.buffer.at_eof()
+
+
+def _parse_buffered(
+    grammar: Parser[T, V], data: bytes, at_eof: bool
+) -> Optional[ParsedNode[T, V]]:
+    buffer = FeedBuffer()
+    buffer.feed(data)
+    if at_eof:
+        buffer.feed_eof()
+    try:
+        return grammar.parse_nowait(buffer, 0)
+    except WouldBlock:
+        return None
+
+
+async def parse_incremental_batches(
+    grammar: Parser[T, V],
+    reader: StreamReader,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_buffer_size: Optional[int] = None,
+    max_lookahead: Optional[int] = None,
+    yield_steps: Optional[int] = None,
+    yield_interval: Optional[float] = None,
+    stats: Optional[StreamStats] = None,
+) -> AsyncGenerator[List[ParsedNode[T, V]], None]:
+    r"""Parse bytes from an asynchronous stream incrementally in batches.
+
+    Works like `parse_incremental`, but instead of yielding each parse tree
+    individually, all complete matches of the *grammar* that are already
+    buffered are parsed in one pass and yielded together. This reduces the
+    per-message overhead when many small messages arrive at once, e.g. when a
+    server pipelines responses.
+
+    Parameters
+    ----------
+    grammar:
+        Parser combinators defining the grammar to parse.
+    reader:
+        The stream reader to read bytes with.
+    chunk_size:
+        Maximum number of bytes to read ahead with a single read from the
+        *reader*.
+    max_buffer_size:
+        Maximum number of bytes to buffer. ``None`` disables the limit.
+    max_lookahead:
+        Maximum number of bytes that a single match of the *grammar* may look
+        ahead (i.e., the maximum size of a message). ``None`` disables the limit.
+        A batch ends before a message that would look ahead further than this
+        from the start of the batch.
+    yield_steps:
+        Maximum number of buffer accesses by the *grammar* between yielding to
+        the event loop. ``None`` disables the limit. See
+        `bite.io.YieldingBuffer`.
+    yield_interval:
+        Maximum time in seconds between yielding to the event loop while
+        parsing. ``None`` disables the limit.
+    stats:
+        `bite.io.StreamStats` to record reads and parsed messages in. Each
+        message of a batch is recorded individually.
+
+    Yields
+    ------
+    :
+        A non-empty list of parse trees for complete matches of the given
+        *grammar*. Note that location indices of the parse trees will be
+        relative to the start of the batch.
+
+    Raises
+    ------
+    bite.parsers.ParseError
+        If the provided *grammar* fails to parse the incoming bytes. The
+        complete messages preceding the malformed one are yielded first.
+    bite.io.BufferLimitExceededError
+        If parsing a message would exceed the *max_buffer_size* or
+        *max_lookahead*.
+
+    Examples
+    --------
+
+    .. testcode:: parse_incremental_batches
+
+        import asyncio
+        from bite import CharacterSet, Combine, Literal, parse_incremental_batches, Suppress
+
+        integer_token = Combine(CharacterSet(b'0123456789')[1, ...])
+        line = integer_token + Literal(b'+') + integer_token + Suppress(Literal(b'\r\n'))
+
+        async def main():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"1+2\r\n23+42\r\n1234+")
+            reader.feed_data(b"4321\r\n")
+            reader.feed_eof()
+            async for batch in parse_incremental_batches(line, reader):
+                print("Parsed batch:", [parsed_line.values for parsed_line in batch])
+
+        asyncio.run(main())
+
+    .. testoutput:: parse_incremental_batches
+
+        Parsed batch: [(b'1', b'+', b'2'), (b'23', b'+', b'42'), (b'1234', b'+', b'4321')]
+    """
+
+    buffer = StreamReaderBuffer(
+        reader,
+        chunk_size=chunk_size,
+        max_buffer_size=max_buffer_size,
+        max_lookahead=max_lookahead,
+        stats=stats,
+    )
+    parse_buffer = _yielding(buffer, yield_steps, yield_interval)
+    while not buffer.at_eof():
+        start = _start_message(stats)
+        try:
+            batch = [grammar.parse_nowait(parse_buffer, 0)]
+        except WouldBlock:
+            batch = [await grammar.parse(parse_buffer, 0)]
+
+        end_loc = batch[-1].end_loc
+        while True:
+            if stats is not None:
+                _record_message(stats, start, end_loc - batch[-1].start_loc)
+                start = _start_message(stats)
+            try:
+                if not buffer.get_nowait(slice(end_loc, end_loc + 1)):
+                    break
+                batch.append(grammar.parse_nowait(parse_buffer, end_loc))
+            except (WouldBlock, ParseError, BufferLimitExceededError):
+                # The lookahead limit applies from the start of the batch.
+                # Thus, a message hitting it (or a malformed message) is
+                # parsed again from the start of the buffer after yielding the
+                # batch.
+                break
+            end_loc = batch[-1].end_loc
+
+        yield batch
+        await buffer.drop_prefix(end_loc)
+        await buffer.get(slice(0, 1))  # Ensure to read EOF state
+
+
 async def parse_bytes(
-    grammar: Parser[T, V], data: bytes, *, parse_all: bool = False
+    grammar: Parser[T, V],
+    data: bytes,
+    *,
+    parse_all: bool = False,
+    yield_steps: Optional[int] = None,
+    yield_interval: Optional[float] = None,
 ) -> ParsedNode[T, V]:
     """Parse an in-memory bytes object.
 
@@ -98,6 +415,13 @@ async def parse_bytes(
     parse_all:
         If set to ``True``, the all bytes must be parsed. Otherwise, trailing,
         unparsed bytes are allowed.
+    yield_steps:
+        Maximum number of buffer accesses by the *grammar* between yielding to
+        the event loop. ``None`` disables the limit. See
+        `bite.io.YieldingBuffer`.
+    yield_interval:
+        Maximum time in seconds between yielding to the event loop while
+        parsing. ``None`` disables the limit.
 
     Returns
     -------
@@ -134,7 +458,186 @@ async def parse_bytes(
         bite.parsers.TrailingBytesError: trailing bytes
     """
 
-    parse_tree = await grammar.parse(BytesBuffer(data))
+    buffer = _yielding(BytesBuffer(data), yield_steps, yield_interval)
+    try:
+        parse_tree = grammar.parse_nowait(buffer)
+    except WouldBlock:
+        parse_tree = await grammar.parse(buffer)
     if parse_all and parse_tree.end_loc < len(data):
         raise TrailingBytesError("trailing bytes")
     return parse_tree
+
+
+async def parse_file(
+    grammar: Parser[T, V],
+    path: Union[str, "os.PathLike[str]"],
+    *,
+    parse_all: bool = False,
+    yield_steps: Optional[int] = None,
+    yield_interval: Optional[float] = None,
+) -> ParsedNode[T, V]:
+    """Parse a file by mapping it into memory.
+
+    In contrast to reading the file into a ``bytes`` object, the file is not
+    required to fit into memory. Only the parts of the file accessed by the
+    parser will be loaded (and may be evicted again) by the operating system.
+
+    Parameters
+    ----------
+    grammar:
+        Parser combinators defining the grammar to parse.
+    path:
+        Path of the file to parse.
+    parse_all:
+        If set to ``True``, the all bytes must be parsed. Otherwise, trailing,
+        unparsed bytes are allowed.
+    yield_steps:
+        Maximum number of buffer accesses by the *grammar* between yielding to
+        the event loop. ``None`` disables the limit. See
+        `bite.io.YieldingBuffer`.
+    yield_interval:
+        Maximum time in seconds between yielding to the event loop while
+        parsing. ``None`` disables the limit.
+
+    Returns
+    -------
+    The resulting parse tree.
+
+    Exceptions
+    ----------
+    bite.parsers.TrailingBytesError
+        If ``parse_all=True`` and not all input was consumed by the parser.
+    bite.parsers.ParseError
+        If the provided *grammar* fails to parse the incoming bytes.
+    """
+
+    with MmapBuffer(path) as buffer:
+        parse_buffer = _yielding(buffer, yield_steps, yield_interval)
+        try:
+            parse_tree = grammar.parse_nowait(parse_buffer)
+        except WouldBlock:
+            parse_tree = await grammar.parse(parse_buffer)
+        if parse_all and parse_tree.end_loc < len(buffer):
+            raise TrailingBytesError("trailing bytes")
+        return parse_tree
+
+
+async def parse_file_incremental(
+    grammar: Parser[T, V],
+    path: Union[str, "os.PathLike[str]"],
+    *,
+    yield_steps: Optional[int] = None,
+    yield_interval: Optional[float] = None,
+) -> AsyncGenerator[ParsedNode[T, V], None]:
+    """Parse a file incrementally by mapping it into memory.
+
+    The *grammar* is applied repeatedly until the whole file has been parsed.
+    Like with `parse_file`, the file is not required to fit into memory.
+
+    Parameters
+    ----------
+    grammar:
+        Parser combinators defining the grammar to parse.
+    path:
+        Path of the file to parse.
+    yield_steps:
+        Maximum number of buffer accesses by the *grammar* between yielding to
+        the event loop. ``None`` disables the limit. See
+        `bite.io.YieldingBuffer`.
+    yield_interval:
+        Maximum time in seconds between yielding to the event loop while
+        parsing. ``None`` disables the limit.
+
+    Yields
+    ------
+    :
+        A parse tree for each complete match of the given *grammar*. Note that
+        location indices of the parse tree will be relative to the start of that
+        parsed segment.
+
+    Raises
+    ------
+    bite.parsers.ParseError
+        If the provided *grammar* fails to parse the file.
+    """
+
+    with MmapBuffer(path) as buffer:
+        parse_buffer = _yielding(buffer, yield_steps, yield_interval)
+        while len(buffer) > 0:
+            try:
+                parse_tree = grammar.parse_nowait(parse_buffer, 0)
+            except WouldBlock:
+                parse_tree = await grammar.parse(parse_buffer, 0)
+            yield parse_tree
+            buffer.drop_prefix(parse_tree.end_loc)
+
+
+def parse_iter(
+    grammar: Parser[T, V],
+    source: Union[Iterable[bytes], BinaryIO],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Generator[ParsedNode[T, V], None, None]:
+    r"""Parse bytes from an iterable of chunks or a file-like object
+    incrementally and synchronously.
+
+    This is the synchronous counterpart of `parse_incremental` and does not
+    require an event loop. Bytes are only read from the *source* when needed
+    and consumed bytes are released after each complete match of the
+    *grammar*.
+
+    Parameters
+    ----------
+    grammar:
+        Parser combinators defining the grammar to parse.
+    source:
+        Either an iterable providing ``bytes`` chunks (e.g., a generator) or a
+        binary file-like object with a ``read`` method (e.g., a pipe or a file
+        opened in binary mode).
+    chunk_size:
+        Maximum number of bytes to read at once if *source* is a file-like
+        object.
+
+    Yields
+    ------
+    :
+        A parse tree for each complete match of the given *grammar*. Note that
+        location indices of the parse tree will be relative to the start of that
+        parsed segment.
+
+    Raises
+    ------
+    bite.parsers.ParseError
+        If the provided *grammar* fails to parse the incoming bytes.
+
+    Examples
+    --------
+
+    .. testcode:: parse_iter
+
+        from bite import CharacterSet, Combine, Literal, parse_iter, Suppress
+
+        integer_token = Combine(CharacterSet(b'0123456789')[1, ...])
+        line = integer_token + Literal(b'+') + integer_token + Suppress(Literal(b'\r\n'))
+
+        chunks = [b"1+2\r\n23+", b"42\r", b"\n1234+4321\r\n"]
+        for parsed_line in parse_iter(line, chunks):
+            print("Parsed line:", parsed_line.values)
+
+    .. testoutput:: parse_iter
+
+        Parsed line: (b'1', b'+', b'2')
+        Parsed line: (b'23', b'+', b'42')
+        Parsed line: (b'1234', b'+', b'4321')
+    """
+
+    if hasattr(source, "read"):
+        read = getattr(source, "read1", source.read)
+        source = iter(lambda: read(chunk_size), b"")
+    buffer = IterableBuffer(source)
+    buffer.get_nowait(slice(0, 1))  # Detect empty input before parsing
+    while not buffer.at_eof():
+        parse_tree = grammar.parse_nowait(buffer, 0)
+        yield parse_tree
+        buffer.drop_prefix(parse_tree.end_loc)
+        buffer.get_nowait(slice(0, 1))  # Ensure to read EOF state
@@ -1,20 +1,33 @@
 import builtins
 import itertools
-from dataclasses import dataclass
+import re
+import weakref
+from dataclasses import dataclass, fields
 from typing import (
     Any,
     Callable,
+    Dict,
     Generic,
     Iterable,
+    List,
+    Mapping,
+    Match,
     NoReturn,
     Optional,
+    Pattern,
     Protocol,
     Tuple,
     TypeVar,
     Union,
 )
 
-from bite.io import ParserBuffer
+from bite.io import (
+    BytesBuffer,
+    MmapBuffer,
+    ParserBuffer,
+    WouldBlock,
+    YieldingBuffer,
+)
 
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
@@ -63,6 +76,11 @@ class ParsedBaseNode(Generic[T]):
     parse_tree: T
     """Children of the node."""
 
+    def __reduce__(self):
+        # More compact than the default of pickling the instance dictionary,
+        # which matters for transferring parse trees between processes.
+        return type(self), tuple(getattr(self, f.name) for f in fields(self))
+
 
 @dataclass(frozen=True)
 class ParsedLeaf(ParsedBaseNode[T]):
@@ -101,6 +119,9 @@ class ParsedNil:
     loc: int
     """Index into the input buffer to where the node was generated."""
 
+    def __reduce__(self):
+        return type(self), (self.name, self.loc)
+
     @property
     def parse_tree(self) -> None:
         """Children of the node. Will always return ``None``."""
@@ -126,7 +147,9 @@ class ParsedNil:
 class Parser(Generic[T, V]):
     """Abstract base class for parsers.
 
-    Implementors must at least override the :meth:`.parse` method.
+    Implementors must at least override the :meth:`.parse` method. To take
+    advantage of the non-suspending fast path when the input is already
+    buffered, the :meth:`.parse_nowait` method should be overridden as well.
 
     The following operator implementations are provided:
 
@@ -151,6 +174,15 @@ class Parser(Generic[T, V]):
     def __str__(self) -> str:
         return self.name if self.name else super().__str__()
 
+    @property
+    def children(self) -> Tuple["Parser", ...]:
+        """Parsers directly applied by this parser.
+
+        Parsers only created while parsing (e.g., by `Counted`) are not
+        included.
+        """
+        return ()
+
     async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedNode[T, V]:
         """Try to parse the provided input.
 
@@ -180,6 +212,47 @@ class Parser(Generic[T, V]):
         """
         raise NotImplementedError()
 
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedNode[T, V]:
+        """Try to parse the provided input without waiting for more input.
+
+        Behaves like :meth:`parse`, but does not suspend. If the input required
+        to complete parsing is not available in the buffer yet,
+        `bite.io.WouldBlock` is raised and :meth:`parse` has to be awaited
+        instead.
+
+        The default implementation runs :meth:`parse` up to its first
+        suspension point. Parsers should override this method with a
+        synchronous implementation to avoid the coroutine overhead.
+
+        Parameters
+        ----------
+        buf:
+            Buffer providing access to the input.
+        loc:
+            Index into the buffer from where to start parsing.
+
+        Returns
+        -------
+        :
+            If parsing is successful, a parse tree representing the parse result
+            is returned.
+
+        Raises
+        ------
+        UnmetExpectationError
+            If parsing was unsuccessful, because the input does not match what
+            is expected from this parser.
+        bite.io.WouldBlock
+            If parsing cannot be completed without waiting for more input.
+        """
+        coroutine = self.parse(buf, loc)
+        try:
+            coroutine.send(None)
+        except StopIteration as stop:
+            return stop.value
+        coroutine.close()
+        raise WouldBlock()
+
     def __add__(self, other: "Parser") -> "And":
         return And((self, other), name=f"({self}) + ({other})")
 
@@ -262,18 +335,33 @@ class MatchFirst(Parser[ParsedNode[Any, V], V]):
         super().__init__(name)
         self.choices = choices
 
+    @property
+    def children(self) -> Tuple[Parser, ...]:
+        return tuple(self.choices)
+
     def __str__(self):
         return " | ".join(f"({choice})" for choice in self.choices)
 
     async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedMatchFirst:
         for i, choice in enumerate(self.choices):
             try:
-                parsed_node = await choice.parse(buf, loc)
+                try:
+                    parsed_node = choice.parse_nowait(buf, loc)
+                except WouldBlock:
+                    parsed_node = await choice.parse(buf, loc)
                 return ParsedMatchFirst(self.name, parsed_node, i)
             except UnmetExpectationError:
                 pass
         raise UnmetExpectationError(self, loc, buf)
 
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedMatchFirst:
+        for i, choice in enumerate(self.choices):
+            try:
+                return ParsedMatchFirst(self.name, choice.parse_nowait(buf, loc), i)
+            except UnmetExpectationError:
+                pass
+        raise UnmetExpectationError(self, loc, buf)
+
     def __or__(self, other: "Parser") -> "MatchFirst":
         return MatchFirst(tuple(self.choices) + (other,), name=f"{self} | ({other})")
 
@@ -343,6 +431,10 @@ class And(Parser[Tuple[ParsedNode, ...], Any]):
         super().__init__(name)
         self.parsers = parsers
 
+    @property
+    def children(self) -> Tuple[Parser, ...]:
+        return tuple(self.parsers)
+
     def __str__(self):
         return " + ".join(f"({parser})" for parser in self.parsers)
 
@@ -350,7 +442,18 @@ class And(Parser[Tuple[ParsedNode, ...], Any]):
         current_loc = loc
         parsed_nodes = []
         for parser in self.parsers:
-            parsed_nodes.append(await parser.parse(buf, current_loc))
+            try:
+                parsed_nodes.append(parser.parse_nowait(buf, current_loc))
+            except WouldBlock:
+                parsed_nodes.append(await parser.parse(buf, current_loc))
+            current_loc = parsed_nodes[-1].end_loc
+        return ParsedAnd(self.name, tuple(parsed_nodes), loc)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedAnd:
+        current_loc = loc
+        parsed_nodes = []
+        for parser in self.parsers:
+            parsed_nodes.append(parser.parse_nowait(buf, current_loc))
             current_loc = parsed_nodes[-1].end_loc
         return ParsedAnd(self.name, tuple(parsed_nodes), loc)
 
@@ -376,6 +479,17 @@ class Repeat(Parser[Tuple[ParsedNode[T, V], ...], V]):
     name:
         Name to assign to the resulting parse tree node.
 
+    Raises
+    ------
+    ValueError
+        If *max_repeats* is ``None`` and the *parser* matches without consuming
+        any input as it would be applied infinitely often.
+
+    See Also
+    --------
+    bite.analysis.analyze: Detects parsers that may match without consuming
+        input before parsing.
+
     Examples
     --------
 
@@ -432,27 +546,56 @@ class Repeat(Parser[Tuple[ParsedNode[T, V], ...], V]):
         self.min_repeats = min_repeats
         self.max_repeats = max_repeats
 
+    @property
+    def children(self) -> Tuple[Parser, ...]:
+        return (self.parser,)
+
     def __str__(self):
         return f"({self.parser})[{self.min_repeats}, {self.max_repeats}]"
 
     async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedRepeat:
         current_loc = loc
         parsed = []
-        for _ in range(self.min_repeats):
-            parsed.append(await self.parser.parse(buf, current_loc))
-            current_loc = parsed[-1].end_loc
+        for i in itertools.count():
+            if self.max_repeats is not None and i >= self.max_repeats:
+                break
+            try:
+                try:
+                    parsed.append(self.parser.parse_nowait(buf, current_loc))
+                except WouldBlock:
+                    parsed.append(await self.parser.parse(buf, current_loc))
+                current_loc = self._advance(parsed[-1], current_loc)
+            except UnmetExpectationError:
+                if i < self.min_repeats:
+                    raise
+                break
 
-        for i in itertools.count(self.min_repeats):
+        return ParsedRepeat(self.name, tuple(parsed), loc)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedRepeat:
+        current_loc = loc
+        parsed = []
+        for i in itertools.count():
             if self.max_repeats is not None and i >= self.max_repeats:
                 break
             try:
-                parsed.append(await self.parser.parse(buf, current_loc))
-                current_loc = parsed[-1].end_loc
+                parsed.append(self.parser.parse_nowait(buf, current_loc))
+                current_loc = self._advance(parsed[-1], current_loc)
             except UnmetExpectationError:
+                if i < self.min_repeats:
+                    raise
                 break
 
         return ParsedRepeat(self.name, tuple(parsed), loc)
 
+    def _advance(self, parse_tree: ParsedNode[T, V], loc: int) -> int:
+        if parse_tree.end_loc == loc and self.max_repeats is None:
+            raise ValueError(
+                f"{self.name} repeats a parser that matched without consuming "
+                f"input at position {loc}, which would loop forever"
+            )
+        return parse_tree.end_loc
+
 
 class Not(Parser[None, NoReturn]):
     """Negative look-ahead.
@@ -498,9 +641,24 @@ class Not(Parser[None, NoReturn]):
         super().__init__(name if name else f"Not({parser})")
         self.parser = parser
 
+    @property
+    def children(self) -> Tuple[Parser, ...]:
+        return (self.parser,)
+
     async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedNil:
         try:
-            await self.parser.parse(buf, loc)
+            try:
+                self.parser.parse_nowait(buf, loc)
+            except WouldBlock:
+                await self.parser.parse(buf, loc)
+        except UnmetExpectationError:
+            return ParsedNil(self.name, loc)
+        else:
+            raise UnmetExpectationError(self, loc, buf)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedNil:
+        try:
+            self.parser.parse_nowait(buf, loc)
         except UnmetExpectationError:
             return ParsedNil(self.name, loc)
         else:
@@ -550,11 +708,20 @@ class Forward(Parser[T, V]):
         """Assign a concrete parser to the forward declaration."""
         self.parser = parser
 
+    @property
+    def children(self) -> Tuple[Parser, ...]:
+        return () if self.parser is None else (self.parser,)
+
     async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedNode[T, V]:
         if self.parser is None:
             raise ValueError("unassigned forward parser")
         return await self.parser.parse(buf, loc)
 
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedNode[T, V]:
+        if self.parser is None:
+            raise ValueError("unassigned forward parser")
+        return self.parser.parse_nowait(buf, loc)
+
 
 ParsedLiteral = ParsedLeaf[bytes]
 
@@ -589,10 +756,16 @@ class Literal(Parser[bytes, bytes]):
         self.literal = literal
 
     async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedLiteral:
-        end_loc = loc + len(self.literal)
-        peek = await buf.get(slice(loc, end_loc))
+        peek = await buf.get(slice(loc, loc + len(self.literal)))
+        return self._parse_peek(peek, buf, loc)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedLiteral:
+        peek = buf.get_nowait(slice(loc, loc + len(self.literal)))
+        return self._parse_peek(peek, buf, loc)
+
+    def _parse_peek(self, peek: bytes, buf: ParserBuffer, loc: int) -> ParsedLiteral:
         if peek == self.literal:
-            return ParsedLiteral(self.name, self.literal, loc, end_loc)
+            return ParsedLiteral(self.name, self.literal, loc, loc + len(self.literal))
         else:
             raise UnmetExpectationError(self, loc, buf)
 
@@ -632,10 +805,16 @@ class CaselessLiteral(Parser[bytes, bytes]):
         self._lowercased_literal = self.literal.lower()
 
     async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedLiteral:
-        end_loc = loc + len(self.literal)
-        peek = await buf.get(slice(loc, end_loc))
+        peek = await buf.get(slice(loc, loc + len(self.literal)))
+        return self._parse_peek(peek, buf, loc)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedLiteral:
+        peek = buf.get_nowait(slice(loc, loc + len(self.literal)))
+        return self._parse_peek(peek, buf, loc)
+
+    def _parse_peek(self, peek: bytes, buf: ParserBuffer, loc: int) -> ParsedLiteral:
         if peek.lower() == self._lowercased_literal:
-            return ParsedLiteral(self.name, self.literal, loc, end_loc)
+            return ParsedLiteral(self.name, self.literal, loc, loc + len(self.literal))
         else:
             raise UnmetExpectationError(self, loc, buf)
 
@@ -689,7 +868,14 @@ class CharacterSet(Parser[bytes, bytes]):
         self.invert = invert
 
     async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedCharacterSet:
-        char = await buf.get(loc)
+        return self._parse_peek(await buf.get(loc), buf, loc)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedCharacterSet:
+        return self._parse_peek(buf.get_nowait(loc), buf, loc)
+
+    def _parse_peek(
+        self, char: bytes, buf: ParserBuffer, loc: int
+    ) -> ParsedCharacterSet:
         if len(char) == 1 and (char[0] in self.charset) != self.invert:
             return ParsedCharacterSet(self.name, char, loc, loc + 1)
         else:
@@ -729,7 +915,14 @@ class FixedByteCount(Parser[bytes, bytes]):
         self.count = count
 
     async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedFixedByteCount:
-        read_bytes = await buf.get(slice(loc, loc + self.count))
+        return self._parse_peek(await buf.get(slice(loc, loc + self.count)), buf, loc)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedFixedByteCount:
+        return self._parse_peek(buf.get_nowait(slice(loc, loc + self.count)), buf, loc)
+
+    def _parse_peek(
+        self, read_bytes: bytes, buf: ParserBuffer, loc: int
+    ) -> ParsedFixedByteCount:
         if len(read_bytes) == self.count:
             return ParsedFixedByteCount(
                 self.name, read_bytes, loc, loc + len(read_bytes)
@@ -738,6 +931,627 @@ class FixedByteCount(Parser[bytes, bytes]):
             raise UnmetExpectationError(self, loc, buf)
 
 
+@dataclass(frozen=True)
+class ParsedRegex(ParsedLeaf[bytes]):
+    """A leaf node in a parse tree created by the `Regex` parser."""
+
+    groups: Tuple[Optional[bytes], ...] = ()
+    """Bytes matched by each numbered group of the regular expression. Groups
+    that did not participate in the match are ``None``."""
+
+    named_groups: Tuple[Tuple[str, Optional[bytes]], ...] = ()
+    """Names and matched bytes of the named groups of the regular
+    expression."""
+
+    def group(self, key: Union[int, str] = 0) -> Optional[bytes]:
+        """Get the bytes matched by a group of the regular expression.
+
+        Parameters
+        ----------
+        key:
+            Number or name of the group. Group 0 refers to the whole match.
+
+        Returns
+        -------
+        :
+            The matched bytes or ``None`` if the group did not participate in
+            the match.
+
+        Raises
+        ------
+        IndexError
+            If there is no such group.
+        """
+        if isinstance(key, str):
+            for name, value in self.named_groups:
+                if name == key:
+                    return value
+            raise IndexError(f"no such group: {key!r}")
+        if key == 0:
+            return self.parse_tree
+        if 0 < key <= len(self.groups):
+            return self.groups[key - 1]
+        raise IndexError(f"no such group: {key!r}")
+
+    def groupdict(self) -> Dict[str, Optional[bytes]]:
+        """Get the bytes matched by the named groups of the regular expression.
+
+        Returns
+        -------
+        :
+            Dictionary mapping the group names to the matched bytes.
+        """
+        return dict(self.named_groups)
+
+
+class Regex(Parser[bytes, bytes]):
+    """Parses bytes matching a regular expression.
+
+    The regular expression is matched directly against the bytes held by the
+    input buffer without copying them (see
+    :meth:`bite.io.ParserBuffer.match`). Until the end of the input is found
+    or *max_length* bytes are available, a match or failed match is only
+    accepted once the pattern cannot inspect the end of the currently available
+    input anymore, i.e. when more input could neither extend nor change the
+    result. For example, ``[0-9]+(e[0-9]+)?`` waits for more input when ``1e``
+    is available, but accepts ``1`` from ``1;``. Lookahead assertions and
+    anchors at the end are followed into the bytes they inspect. As a
+    backreference may stand for any bytes, a result reaching one is only final
+    in the same cases as at the end of the input. Thus, when parsing a stream,
+    give a *max_length* to bound the number of bytes buffered for a match.
+
+    Parameters
+    ----------
+    pattern:
+        The regular expression to match. Either a pattern string or a compiled
+        pattern, both operating on bytes.
+    flags:
+        Flags to compile the *pattern* with. Must be 0 for compiled patterns.
+    max_length:
+        Maximum number of bytes the match may span. ``None`` does not limit
+        the length.
+    name:
+        Name to assign to the resulting parse tree node.
+
+    Raises
+    ------
+    ValueError
+        If *flags* are given together with a compiled *pattern*.
+
+    Examples
+    --------
+
+    .. testcode:: regex
+
+        import asyncio
+        from bite import Regex, parse_bytes
+
+        key_value = Regex(rb'(?P<key>[a-z]+)=(?P<value>[0-9]*)')
+        parse_tree = asyncio.run(parse_bytes(key_value, b'answer=42'))
+
+        print(parse_tree.values)
+        print(parse_tree.group('value'))
+
+    .. testoutput:: regex
+
+        (b'answer=42',)
+        b'42'
+    """
+
+    def __init__(
+        self,
+        pattern: Union[bytes, Pattern[bytes]],
+        flags: int = 0,
+        *,
+        max_length: Optional[int] = None,
+        name: Optional[str] = None,
+    ):
+        if isinstance(pattern, bytes):
+            compiled = re.compile(pattern, flags)
+        elif flags:
+            raise ValueError("flags cannot be given for a compiled pattern")
+        else:
+            compiled = pattern
+        super().__init__(name if name else f"Regex({compiled.pattern!r})")
+        self.pattern = compiled
+        self.max_length = max_length
+        self._group_names = tuple(
+            sorted(compiled.groupindex, key=compiled.groupindex.__getitem__)
+        )
+
+    async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedRegex:
+        match = await buf.match(self.pattern, loc, self.max_length)
+        return self._parse_match(match, buf, loc)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedRegex:
+        match = buf.match_nowait(self.pattern, loc, self.max_length)
+        return self._parse_match(match, buf, loc)
+
+    def _parse_match(
+        self, match: Optional[Match[bytes]], buf: ParserBuffer, loc: int
+    ) -> ParsedRegex:
+        if match is None:
+            raise UnmetExpectationError(self, loc, buf)
+        # The match positions refer to the storage of the buffer, which might
+        # be offset from the buffer indices.
+        return ParsedRegex(
+            self.name,
+            match.group(),
+            loc,
+            loc + match.end() - match.pos,
+            match.groups(),
+            tuple((name, match.group(name)) for name in self._group_names),
+        )
+
+
+ParsedSkipTo = ParsedLeaf[bytes]
+
+
+class SkipTo(Parser[bytes, bytes]):
+    r"""Parses all bytes up to the next match of a target.
+
+    The target itself is not consumed. If the target is given as ``bytes`` (or
+    as a `Literal`), the input is scanned with :meth:`bite.io.ParserBuffer.find`
+    instead of invoking a parser for each byte, and bytes that have already
+    been scanned are not scanned again while waiting for more input. Other
+    parsers are tried at each location in turn.
+
+    Parameters
+    ----------
+    target:
+        Bytes or parser to skip to.
+    max_length:
+        Maximum number of bytes to skip. ``None`` does not limit the number of
+        skipped bytes. Parsing fails if the target is not found within these
+        bytes.
+    name:
+        Name to assign to the resulting parse tree node.
+
+    Examples
+    --------
+
+    .. testcode:: skip-to
+
+        import asyncio
+        from bite import Literal, SkipTo, parse_bytes
+
+        line = SkipTo(b'\r\n') + Literal(b'\r\n')
+
+        print(asyncio.run(parse_bytes(line, b'* OK ready\r\n')).values)
+
+    .. testoutput:: skip-to
+
+        (b'* OK ready', b'\r\n')
+    """
+
+    def __init__(
+        self,
+        target: Union[bytes, Parser[Any, Any]],
+        *,
+        max_length: Optional[int] = None,
+        name: Optional[str] = None,
+    ):
+        if isinstance(target, bytes):
+            target = Literal(target)
+        super().__init__(name if name else f"SkipTo({target})")
+        self.target = target
+        self.max_length = max_length
+        self._literal = target.literal if type(target) is Literal else None
+
+    @property
+    def children(self) -> Tuple[Parser, ...]:
+        return (self.target,)
+
+    async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedSkipTo:
+        if self._literal is not None:
+            index = await buf.find(self._literal, loc, self._find_end(loc))
+        else:
+            index = await self._scan(buf, loc)
+        if index < 0:
+            raise UnmetExpectationError(self, loc, buf)
+        return self._parse_skipped(await buf.get(slice(loc, index)), loc)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedSkipTo:
+        if self._literal is not None:
+            index = buf.find_nowait(self._literal, loc, self._find_end(loc))
+        else:
+            index = self._scan_nowait(buf, loc)
+        if index < 0:
+            raise UnmetExpectationError(self, loc, buf)
+        return self._parse_skipped(buf.get_nowait(slice(loc, index)), loc)
+
+    def _find_end(self, loc: int) -> Optional[int]:
+        if self.max_length is None or self._literal is None:
+            return None
+        return loc + self.max_length + len(self._literal)
+
+    async def _scan(self, buf: ParserBuffer, loc: int) -> int:
+        index = loc
+        while self.max_length is None or index - loc <= self.max_length:
+            try:
+                try:
+                    self.target.parse_nowait(buf, index)
+                except WouldBlock:
+                    await self.target.parse(buf, index)
+            except UnmetExpectationError:
+                if not await buf.get(index):
+                    break
+                index += 1
+            else:
+                return index
+        return -1
+
+    def _scan_nowait(self, buf: ParserBuffer, loc: int) -> int:
+        index = loc
+        while self.max_length is None or index - loc <= self.max_length:
+            try:
+                self.target.parse_nowait(buf, index)
+            except UnmetExpectationError:
+                if not buf.get_nowait(index):
+                    break
+                index += 1
+            else:
+                return index
+        return -1
+
+    def _parse_skipped(self, skipped: bytes, loc: int) -> ParsedSkipTo:
+        return ParsedSkipTo(self.name, skipped, loc, loc + len(skipped))
+
+
+ParsedQuotedString = ParsedLeaf[bytes]
+
+
+class QuotedString(Parser[bytes, bytes]):
+    r"""Parses a quoted string with escape sequences.
+
+    The closing quote and the escape bytes are located with
+    :meth:`bite.io.ParserBuffer.find`, the runs of bytes between them are
+    copied in bulk, and only the escape sequences are unescaped individually.
+
+    Parameters
+    ----------
+    quote:
+        The byte enclosing the string.
+    escape:
+        The byte escaping the following byte, or ``None`` if the string cannot
+        contain escape sequences. If it is identical to the *quote*, quotes
+        are escaped by doubling them (as in CSV or SQL).
+    escape_map:
+        Mapping of escaped bytes to their replacement (e.g., ``{b'n': b'\n'}``).
+        Escaped bytes not in the mapping are taken literally.
+    name:
+        Name to assign to the resulting parse tree node.
+
+    Raises
+    ------
+    ValueError
+        If the *quote* or *escape* is not a single byte.
+
+    Examples
+    --------
+
+    .. testcode:: quoted-string
+
+        import asyncio
+        from bite import QuotedString, parse_bytes
+
+        print(asyncio.run(parse_bytes(QuotedString(), rb'"say \"hi\""')).values)
+        print(asyncio.run(parse_bytes(
+            QuotedString(escape_map={b'n': b'\n'}), rb'"a\nb"'
+        )).values)
+        print(asyncio.run(parse_bytes(QuotedString(escape=b'"'), b'"a""b"')).values)
+
+    .. testoutput:: quoted-string
+
+        (b'say "hi"',)
+        (b'a\nb',)
+        (b'a"b',)
+    """
+
+    def __init__(
+        self,
+        quote: bytes = b'"',
+        escape: Optional[bytes] = b"\\",
+        *,
+        escape_map: Optional[Mapping[bytes, bytes]] = None,
+        name: Optional[str] = None,
+    ):
+        if len(quote) != 1 or (escape is not None and len(escape) != 1):
+            raise ValueError("quote and escape must be single bytes")
+        super().__init__(name if name else f"QuotedString({quote!r})")
+        self.quote = quote
+        self.escape = escape
+        self.escape_map = dict(escape_map) if escape_map else {}
+
+    async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedQuotedString:
+        if await buf.get(loc) != self.quote:
+            raise UnmetExpectationError(self, loc, buf)
+        parts = []
+        pos = loc + 1
+        end = -1
+        while True:
+            if end < pos:
+                end = await buf.find(self.quote, pos)
+                if end < 0:
+                    raise UnmetExpectationError(self, loc, buf)
+            if self.escape is None:
+                parts.append(await buf.get(slice(pos, end)))
+                break
+            if self.escape == self.quote:
+                parts.append(await buf.get(slice(pos, end)))
+                if await buf.get(end + 1) != self.quote:
+                    break
+                parts.append(self.quote)
+                pos = end + 2
+                continue
+            escape = await buf.find(self.escape, pos, end)
+            if escape < 0:
+                parts.append(await buf.get(slice(pos, end)))
+                break
+            parts.append(await buf.get(slice(pos, escape)))
+            parts.append(self._unescape(await buf.get(escape + 1), buf, loc))
+            pos = escape + 2
+        return ParsedQuotedString(self.name, b"".join(parts), loc, end + 1)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedQuotedString:
+        if buf.get_nowait(loc) != self.quote:
+            raise UnmetExpectationError(self, loc, buf)
+        parts = []
+        pos = loc + 1
+        end = -1
+        while True:
+            if end < pos:
+                end = buf.find_nowait(self.quote, pos)
+                if end < 0:
+                    raise UnmetExpectationError(self, loc, buf)
+            if self.escape is None:
+                parts.append(buf.get_nowait(slice(pos, end)))
+                break
+            if self.escape == self.quote:
+                parts.append(buf.get_nowait(slice(pos, end)))
+                if buf.get_nowait(end + 1) != self.quote:
+                    break
+                parts.append(self.quote)
+                pos = end + 2
+                continue
+            escape = buf.find_nowait(self.escape, pos, end)
+            if escape < 0:
+                parts.append(buf.get_nowait(slice(pos, end)))
+                break
+            parts.append(buf.get_nowait(slice(pos, escape)))
+            parts.append(self._unescape(buf.get_nowait(escape + 1), buf, loc))
+            pos = escape + 2
+        return ParsedQuotedString(self.name, b"".join(parts), loc, end + 1)
+
+    def _unescape(self, escaped: bytes, buf: ParserBuffer, loc: int) -> bytes:
+        if not escaped:
+            raise UnmetExpectationError(self, loc, buf)
+        # Some buffers return mutable (thus, unhashable) bytearrays.
+        return self.escape_map.get(bytes(escaped), escaped)
+
+
+N = TypeVar("N", bound=Union[int, float])
+
+
+class _NumericParser(Parser[N, N]):
+    # The patterns match every prefix of a valid number and thus accept a
+    # malformed number as a whole instead of backtracking to a valid prefix.
+    # The actual number is extracted and validated from the match afterwards.
+
+    def __init__(
+        self,
+        name: str,
+        pattern: bytes,
+        max_length: Optional[int],
+        min_value: Optional[N],
+        max_value: Optional[N],
+    ):
+        super().__init__(name)
+        self.min_value = min_value
+        self.max_value = max_value
+        self._pattern = re.compile(pattern)
+        self._max_length = max_length
+
+    async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedLeaf[N]:
+        match = await buf.match(self._pattern, loc, self._max_length)
+        return self._parse_match(match, buf, loc)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedLeaf[N]:
+        match = buf.match_nowait(self._pattern, loc, self._max_length)
+        return self._parse_match(match, buf, loc)
+
+    def _parse_match(
+        self, match: Optional[Match[bytes]], buf: ParserBuffer, loc: int
+    ) -> ParsedLeaf[N]:
+        converted = self._convert(match) if match is not None else None
+        if converted is None:
+            raise UnmetExpectationError(self, loc, buf)
+        value, length = converted
+        compared: float = value  # Narrows the union for the comparisons.
+        if (self.min_value is not None and compared < self.min_value) or (
+            self.max_value is not None and compared > self.max_value
+        ):
+            raise UnmetExpectationError(self, loc, buf)
+        return ParsedLeaf(self.name, value, loc, loc + length)
+
+    def _convert(self, match: Match[bytes]) -> Optional[Tuple[N, int]]:
+        raise NotImplementedError()
+
+
+_DIGITS = {
+    2: b"01",
+    8: b"01234567",
+    10: b"0123456789",
+    16: b"0123456789abcdefABCDEF",
+}
+
+ParsedInteger = ParsedLeaf[int]
+
+
+class Integer(_NumericParser[int]):
+    """Parses an integer and converts it to an :class:`int`.
+
+    The digits are scanned in a single pass with a regular expression against
+    the buffered input (see :meth:`bite.io.ParserBuffer.match`).
+
+    Parameters
+    ----------
+    base:
+        Base of the integer, one of 2, 8, 10, or 16. Digits of hexadecimal
+        integers are accepted in upper and lower case. No prefix (like ``0x``)
+        is accepted.
+    signed:
+        Whether to accept a leading ``+`` or ``-`` sign.
+    min_digits:
+        Minimum number of digits.
+    max_digits:
+        Maximum number of digits. Digits following the first *max_digits*
+        digits are not consumed, which allows to parse fixed-width fields. If
+        ``None``, the number of digits is not limited.
+    min_value:
+        Minimum value of the integer. Parsing fails for smaller integers.
+    max_value:
+        Maximum value of the integer. Parsing fails for larger integers.
+    name:
+        Name to assign to the resulting parse tree node.
+
+    Raises
+    ------
+    ValueError
+        If the *base* is not supported.
+
+    Examples
+    --------
+
+    .. testcode:: integer
+
+        import asyncio
+        from bite import Integer, parse_bytes
+
+        print(asyncio.run(parse_bytes(Integer(), b'4711')).values)
+        print(asyncio.run(parse_bytes(Integer(base=16, signed=True), b'-ff')).values)
+        print(asyncio.run(parse_bytes(Integer(max_digits=2)[1, ...], b'2024')).values)
+
+    .. testoutput:: integer
+
+        (4711,)
+        (-255,)
+        (20, 24)
+    """
+
+    def __init__(
+        self,
+        base: int = 10,
+        *,
+        signed: bool = False,
+        min_digits: int = 1,
+        max_digits: Optional[int] = None,
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None,
+        name: Optional[str] = None,
+    ):
+        if base not in _DIGITS:
+            raise ValueError(f"unsupported base {base}")
+        self.base = base
+        self.signed = signed
+        self.min_digits = max(min_digits, 1)
+        self.digits = _DIGITS[base]
+        """Bytes accepted as digits."""
+        repeat = b"*" if max_digits is None else b"{0,%d}" % max_digits
+        super().__init__(
+            name if name else f"Integer(base={base})",
+            (rb"([+-]?)" if signed else rb"()") + b"[" + self.digits + b"]" + repeat,
+            None if max_digits is None else max_digits + signed,
+            min_value,
+            max_value,
+        )
+
+    def _convert(self, match: Match[bytes]) -> Optional[Tuple[int, int]]:
+        length = match.end() - match.pos
+        if length - len(match.group(1)) < self.min_digits:
+            return None
+        return int(match.group(), self.base), length
+
+
+ParsedNumber = ParsedLeaf[Union[int, float]]
+
+
+class Number(_NumericParser[Union[int, float]]):
+    """Parses a decimal number and converts it to an :class:`int` or
+    :class:`float`.
+
+    Numbers consisting only of digits are converted to an :class:`int`.
+    Numbers with a fractional part (e.g., ``1.5``, ``1.`` or ``.5``) or an
+    exponent (e.g., ``1e3``) are converted to a :class:`float`. The number is
+    scanned in a single pass with a regular expression against the buffered
+    input (see :meth:`bite.io.ParserBuffer.match`).
+
+    Parameters
+    ----------
+    signed:
+        Whether to accept a leading ``+`` or ``-`` sign.
+    max_length:
+        Maximum number of bytes of the number. Following bytes are not
+        consumed. If ``None``, the length is not limited.
+    min_value:
+        Minimum value of the number. Parsing fails for smaller numbers.
+    max_value:
+        Maximum value of the number. Parsing fails for larger numbers.
+    name:
+        Name to assign to the resulting parse tree node.
+
+    Examples
+    --------
+
+    .. testcode:: number
+
+        import asyncio
+        from bite import Literal, Number, parse_bytes
+
+        numbers = Number(signed=True) + Literal(b',') + Number(signed=True)
+
+        print(asyncio.run(parse_bytes(numbers, b'-42,2.5e3')).values)
+
+    .. testoutput:: number
+
+        (-42, b',', 2500.0)
+    """
+
+    _valid_number = re.compile(
+        rb"[+-]?(?:[0-9]+(\.[0-9]*)?|(\.[0-9]+))([eE][+-]?[0-9]+)?"
+    )
+
+    def __init__(
+        self,
+        *,
+        signed: bool = False,
+        max_length: Optional[int] = None,
+        min_value: Optional[Union[int, float]] = None,
+        max_value: Optional[Union[int, float]] = None,
+        name: Optional[str] = None,
+    ):
+        self.signed = signed
+        super().__init__(
+            name if name else "Number",
+            (rb"[+-]?" if signed else b"")
+            + rb"[0-9]*(?:\.[0-9]*)?(?:[eE][+-]?[0-9]*)?",
+            max_length,
+            min_value,
+            max_value,
+        )
+
+    def _convert(self, match: Match[bytes]) -> Optional[Tuple[Union[int, float], int]]:
+        # An incomplete exponent (e.g., "1e+") is not part of the number.
+        number = self._valid_number.match(match.string, match.pos, match.end())
+        if number is None:
+            return None
+        length = number.end() - number.pos
+        # Only the fractional part and exponent are captured by groups.
+        if number.lastindex is None:
+            return int(number.group()), length
+        return float(number.group()), length
+
+
 ParsedZeroOrMore = ParsedRepeat
 
 
@@ -859,6 +1673,173 @@ class Opt(Repeat[T, V]):
         super().__init__(parser, min_repeats=0, max_repeats=1, name=name)
 
 
+ParsedDelimitedList = ParsedList
+
+
+class DelimitedList(Parser[Tuple[ParsedNode[T, V], ...], V]):
+    """Apply a parser repeatedly with a separator between the applications.
+
+    This is equivalent to ``item + (separator + item)[min_items - 1, ...]``,
+    but the items (and optionally separators) are collected directly into a
+    flat parse tree node instead of creating nested nodes for each item. A
+    separator is only consumed if it is followed by an item.
+
+    Parameters
+    ----------
+    item:
+        Parser for the items of the list.
+    separator:
+        Bytes or parser separating the items. Separators given as ``bytes``
+        (or as a `Literal`) are compared directly against the input if they
+        are not kept.
+    min_items:
+        Minimum number of items.
+    max_items:
+        Maximum number of items. If ``None``, infinitely many items are
+        allowed.
+    keep_separators:
+        Whether to include the parse tree nodes of the separators in the
+        result.
+    name:
+        Name to assign to the resulting parse tree node.
+
+    Raises
+    ------
+    ValueError
+        If *max_items* is ``None`` and a separator followed by an item matches
+        without consuming any input as it would be applied infinitely often.
+
+    Examples
+    --------
+
+    .. testcode:: delimited-list
+
+        import asyncio
+        from bite import CharacterSet, Combine, DelimitedList, parse_bytes
+
+        item = Combine(CharacterSet(b'0123456789')[1, ...])
+
+        print(asyncio.run(parse_bytes(DelimitedList(item, b','), b'1,22,333')).values)
+        print(asyncio.run(parse_bytes(
+            DelimitedList(item, b' ', keep_separators=True), b'1 22'
+        )).values)
+
+    .. testoutput:: delimited-list
+
+        (b'1', b'22', b'333')
+        (b'1', b' ', b'22')
+    """
+
+    def __init__(
+        self,
+        item: Parser[T, V],
+        separator: Union[bytes, Parser[Any, Any]] = b",",
+        *,
+        min_items: int = 1,
+        max_items: Optional[int] = None,
+        keep_separators: bool = False,
+        name: Optional[str] = None,
+    ):
+        if isinstance(separator, bytes):
+            separator = Literal(separator)
+        super().__init__(name if name else f"DelimitedList({item}, {separator})")
+        self.item = item
+        self.separator = separator
+        self.min_items = min_items
+        self.max_items = max_items
+        self.keep_separators = keep_separators
+        self._skipped_literal = (
+            separator.literal
+            if type(separator) is Literal and not keep_separators
+            else None
+        )
+
+    @property
+    def children(self) -> Tuple[Parser, ...]:
+        return (self.item, self.separator)
+
+    async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedDelimitedList:
+        current_loc = loc
+        parsed: List[ParsedNode[T, V]] = []
+        count = 0
+        while self.max_items is None or count < self.max_items:
+            separator = None
+            try:
+                if count == 0:
+                    item_loc = current_loc
+                elif self._skipped_literal is not None:
+                    item_loc = current_loc + len(self._skipped_literal)
+                    try:
+                        peek = buf.get_nowait(slice(current_loc, item_loc))
+                    except WouldBlock:
+                        peek = await buf.get(slice(current_loc, item_loc))
+                    if peek != self._skipped_literal:
+                        raise UnmetExpectationError(self.separator, current_loc, buf)
+                else:
+                    try:
+                        separator = self.separator.parse_nowait(buf, current_loc)
+                    except WouldBlock:
+                        separator = await self.separator.parse(buf, current_loc)
+                    item_loc = separator.end_loc
+                try:
+                    item = self.item.parse_nowait(buf, item_loc)
+                except WouldBlock:
+                    item = await self.item.parse(buf, item_loc)
+            except UnmetExpectationError:
+                if count < self.min_items:
+                    raise
+                break
+            current_loc = self._append(parsed, separator, item, current_loc, count)
+            count += 1
+
+        return ParsedDelimitedList(self.name, tuple(parsed), loc)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedDelimitedList:
+        current_loc = loc
+        parsed: List[ParsedNode[T, V]] = []
+        count = 0
+        while self.max_items is None or count < self.max_items:
+            separator = None
+            try:
+                if count == 0:
+                    item_loc = current_loc
+                elif self._skipped_literal is not None:
+                    item_loc = current_loc + len(self._skipped_literal)
+                    peek = buf.get_nowait(slice(current_loc, item_loc))
+                    if peek != self._skipped_literal:
+                        raise UnmetExpectationError(self.separator, current_loc, buf)
+                else:
+                    separator = self.separator.parse_nowait(buf, current_loc)
+                    item_loc = separator.end_loc
+                item = self.item.parse_nowait(buf, item_loc)
+            except UnmetExpectationError:
+                if count < self.min_items:
+                    raise
+                break
+            current_loc = self._append(parsed, separator, item, current_loc, count)
+            count += 1
+
+        return ParsedDelimitedList(self.name, tuple(parsed), loc)
+
+    def _append(
+        self,
+        parsed: List[ParsedNode[T, V]],
+        separator: Optional[ParsedNode],
+        item: ParsedNode[T, V],
+        loc: int,
+        count: int,
+    ) -> int:
+        if count > 0 and item.end_loc == loc and self.max_items is None:
+            raise ValueError(
+                f"{self.name} repeats a separator and item that matched without "
+                f"consuming input at position {loc}, which would loop forever"
+            )
+        if separator is not None and self.keep_separators:
+            parsed.append(separator)
+        parsed.append(item)
+        return item.end_loc
+
+
 @dataclass(frozen=True)
 class CountedParseTree:
     """Parse tree children created by the `Counted` parser."""
@@ -953,8 +1934,32 @@ class Counted(Parser[CountedParseTree, V]):
         self.count_parser = count_parser
         self.counted_parser_factory = counted_parser_factory
 
+    @property
+    def children(self) -> Tuple[Parser, ...]:
+        return (self.count_parser,)
+
     async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedCounted[V]:
-        count_parse_tree = await self.count_parser.parse(buf, loc)
+        try:
+            count_parse_tree = self.count_parser.parse_nowait(buf, loc)
+        except WouldBlock:
+            count_parse_tree = await self.count_parser.parse(buf, loc)
+        counted_parser = self._create_counted_parser(count_parse_tree)
+        try:
+            counted = counted_parser.parse_nowait(buf, count_parse_tree.end_loc)
+        except WouldBlock:
+            counted = await counted_parser.parse(buf, count_parse_tree.end_loc)
+        return ParsedCounted(self.name, CountedParseTree(count_parse_tree, counted))
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedCounted[V]:
+        count_parse_tree = self.count_parser.parse_nowait(buf, loc)
+        counted = self._create_counted_parser(count_parse_tree).parse_nowait(
+            buf, count_parse_tree.end_loc
+        )
+        return ParsedCounted(self.name, CountedParseTree(count_parse_tree, counted))
+
+    def _create_counted_parser(
+        self, count_parse_tree: ParsedNode[Any, int]
+    ) -> Parser[Any, V]:
         values_iter = iter(count_parse_tree.values)
         try:
             count = int(next(values_iter))
@@ -963,10 +1968,7 @@ class Counted(Parser[CountedParseTree, V]):
         try:
             next(values_iter)
         except StopIteration:
-            counted = await self.counted_parser_factory(count).parse(
-                buf, count_parse_tree.end_loc
-            )
-            return ParsedCounted(self.name, CountedParseTree(count_parse_tree, counted))
+            return self.counted_parser_factory(count)
         else:
             raise ValueError("count expression returned more than one value")
 
@@ -1011,8 +2013,21 @@ class Combine(Parser[bytes, bytes]):
         super().__init__(name if name else f"Combine({parser})")
         self.parser = parser
 
+    @property
+    def children(self) -> Tuple[Parser, ...]:
+        return (self.parser,)
+
     async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedCombine:
-        parse_tree = await self.parser.parse(buf, loc)
+        try:
+            parse_tree = self.parser.parse_nowait(buf, loc)
+        except WouldBlock:
+            parse_tree = await self.parser.parse(buf, loc)
+        return self._combine(parse_tree)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedCombine:
+        return self._combine(self.parser.parse_nowait(buf, loc))
+
+    def _combine(self, parse_tree: ParsedNode[Any, bytes]) -> ParsedCombine:
         return ParsedCombine(
             self.name,
             b"".join(parse_tree.values),
@@ -1027,24 +2042,134 @@ class ParseError(Exception):
 
 class UnmetExpectationError(ParseError):
     """Error raised when the input does not match the syntax expected by a
-    parser."""
+    parser.
+
+    Only a window of the input of up to :attr:`context_size` bytes before and
+    after the error location is captured for the error message.
+
+    When pickled, the expected parser is replaced by its string representation
+    to avoid transferring a possibly large grammar with each error.
+    """
+
+    context_size = 32
+    """Number of bytes before and after the error location to capture."""
 
     def __init__(self, expected: Parser, at_loc: int, buf: ParserBuffer):
-        super().__init__(self._format_message(expected, at_loc, buf))
+        super().__init__(expected, at_loc, buf)
         self.expected = expected
         self.at_loc = at_loc
         self.buf = buf
 
-    @classmethod
-    def _format_message(cls, expected: Parser, at_loc: int, buf: ParserBuffer) -> str:
+        self.context_start = max(0, at_loc - self.context_size)
+        """Index into the input buffer where the :attr:`context` starts."""
+        context_stop = at_loc + self.context_size
+        context = buf.get_current(slice(self.context_start, context_stop + 1))
+        self.context = context[: context_stop - self.context_start]
+        """Input bytes around the error location."""
+        self.context_truncated = len(context) > len(self.context)
+        """Whether the input continues after the :attr:`context`."""
+
+        # Computed right away as the buffer might change or be closed before
+        # the error is displayed.
+        lineno, colno = _line_and_column(buf, at_loc)
+        self.lineno = lineno
+        """Line number (starting at 1) of the error location.
+
+        Note that the line number is relative to the start of the buffer, which
+        might not be the start of the input for incremental parsing.
+        """
+        self.colno = colno
+        """Column number (starting at 1) of the error location."""
+
+    def __reduce__(self):
+        # The input buffer is not pickled as it might be large or not picklable
+        # at all.
+        expected = str(self.expected)
+        args = (expected, self.at_loc, None)
+        state = dict(self.__dict__, expected=expected, buf=None)
+        return _restore_error, (type(self), args, state)
+
+    def __str__(self) -> str:
+        # Formatted lazily as many of these errors are raised and caught during
+        # backtracking without ever being displayed.
+        leading_ellipsis = "..." if self.context_start > 0 else ""
+        trailing_ellipsis = "..." if self.context_truncated else ""
+        preceding = self.context[: self.at_loc - self.context_start]
+        context_repr = repr(self.context)
+        preceding_repr = repr(preceding)
+        preceding_length = len(preceding_repr) - len("b''")
+        if context_repr[1] == "'" and preceding_repr[1] == '"':
+            # Single quotes are only escaped within the quotes of the context.
+            preceding_length += preceding.count(b"'")
+        caret_indent = (
+            len("Input: ") + len(leading_ellipsis) + len("b'") + preceding_length
+        )
         return (
-            f"expected {expected} at position {at_loc}\n\n"
-            + f"Input: {buf.get_current()!r}\n"
-            + (9 + at_loc) * " "
+            f"expected {self.expected} at position {self.at_loc}\n\n"
+            + f"Input: {leading_ellipsis}{context_repr}{trailing_ellipsis}\n"
+            + caret_indent * " "
             + "^ location of error\n"
         )
 
 
+# Position of the last error in a buffer whose bytes never change, as a tuple of
+# a weak reference to the buffer, its version, the location, the line number,
+# and the start of the line. Errors raised while backtracking are close to each
+# other, so that only the bytes in between need to be scanned.
+_last_position: Optional[tuple] = None
+
+
+def _line_and_column(buf: ParserBuffer, loc: int) -> Tuple[int, int]:
+    global _last_position
+    if isinstance(buf, YieldingBuffer):
+        buf = buf.buffer
+    version: Optional[int] = None
+    if isinstance(buf, BytesBuffer):
+        version = 0
+    elif isinstance(buf, MmapBuffer):
+        # Dropping a prefix is the only change of a mapped file's bytes.
+        version = len(buf)
+    ref, scanned, lineno, line_start = None, 0, 1, 0
+    last = _last_position
+    if version is not None and last is not None:
+        last_ref, last_version, *position = last
+        if last_ref() is buf and last_version == version:
+            ref = last_ref
+            scanned, lineno, line_start = position
+    if loc > scanned:
+        between = buf.get_current(slice(scanned, loc))
+        lineno += between.count(b"\n")
+        index = between.rfind(b"\n")
+        if index >= 0:
+            line_start = scanned + index + 1
+    elif loc < scanned:
+        lineno -= buf.get_current(slice(loc, scanned)).count(b"\n")
+        if line_start > loc:
+            line_start = _line_start(buf, loc)
+    if version is not None:
+        ref = weakref.ref(buf) if ref is None else ref
+        _last_position = (ref, version, loc, lineno, line_start)
+    return lineno, loc - line_start + 1
+
+
+def _line_start(buf: ParserBuffer, loc: int) -> int:
+    # Searches backwards in growing windows to only scan the line itself.
+    size = 64
+    while True:
+        start = max(0, loc - size)
+        index = buf.get_current(slice(start, loc)).rfind(b"\n")
+        if index >= 0 or start == 0:
+            return start + index + 1
+        size *= 2
+
+
+def _restore_error(cls: type, args: tuple, state: dict) -> BaseException:
+    error = cls.__new__(cls, *args)
+    error.args = args
+    error.__dict__.update(state)
+    return error
+
+
 class TrailingBytesError(ParseError):
     """Error raised when the whole input is expected to be consumed by a parser,
     but trailing bytes where found."""
@@ -1056,17 +2181,23 @@ __all__ = [
     "CharacterSet",
     "Combine",
     "Counted",
+    "DelimitedList",
     "FixedByteCount",
     "Forward",
+    "Integer",
     "Literal",
     "MatchFirst",
     "Not",
+    "Number",
     "OneOrMore",
     "Opt",
     "ParseError",
     "Parser",
+    "QuotedString",
+    "Regex",
     "Repeat",
     "Repeat",
+    "SkipTo",
     "TrailingBytesError",
     "UnmetExpectationError",
     "ZeroOrMore",
@@ -0,0 +1,269 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional
+
+from bite.instrumentation import Instrumentation, ParseMethod, ParseNowaitMethod
+from bite.io import ParserBuffer, WouldBlock
+from bite.parsers import ParsedNode, ParseError, Parser
+
+
+@dataclass
+class ParserStats:
+    """Statistics collected by a `Profiler` for a single parser."""
+
+    name: str
+    """Name of the parser."""
+
+    calls: int = 0
+    """Number of completed invocations of the parser.
+
+    Invocations of the synchronous fast path that had to be continued
+    asynchronously are counted once.
+    """
+
+    successes: int = 0
+    """Number of invocations that successfully parsed the input."""
+
+    failures: int = 0
+    """Number of invocations that failed to parse the input, i.e. required
+    backtracking."""
+
+    inclusive_time: float = 0.0
+    """Time in seconds spent in the parser including its children.
+
+    Attempts of the synchronous fast path that had to be continued
+    asynchronously are not timed, as the asynchronous invocation repeats them.
+    """
+
+    exclusive_time: float = 0.0
+    """Time in seconds spent in the parser excluding its children."""
+
+    bytes_consumed: int = 0
+    """Total number of bytes consumed by successful invocations."""
+
+
+class _Frame:
+    __slots__ = ("children_time",)
+
+    def __init__(self):
+        self.children_time = 0.0
+
+
+# A context variable instead of a stack on the profiler to keep concurrently
+# running parses in different tasks apart.
+_current_frame: ContextVar[Optional[_Frame]] = ContextVar(
+    "_current_frame", default=None
+)
+
+
+class Profiler(Instrumentation):
+    r"""Collect statistics on the invocations of each parser in a grammar.
+
+    The profiler only adds overhead while it is attached with
+    :meth:`~bite.instrumentation.Instrumentation.attach` or used as a context
+    manager. Statistics are accumulated over all parses while attached until
+    :meth:`reset` is called.
+
+    Note that times include the time spent waiting for input if a parse
+    suspends. To profile the computational cost, the input should be fully
+    buffered. Times of recursively used parsers include the time of the
+    nested invocations multiple times.
+
+    Parameters
+    ----------
+    grammar:
+        The grammar to profile.
+
+    Examples
+    --------
+
+    .. testcode:: profiler
+
+        import asyncio
+        from bite import CharacterSet, Combine, Literal, parse_bytes
+        from bite.profiling import Profiler
+
+        integer = Combine(CharacterSet(b'0123456789')[1, ...], name='integer')
+        expr = integer + Literal(b'+', name='plus') + integer
+
+        with Profiler(expr) as profiler:
+            asyncio.run(parse_bytes(expr, b'23+42'))
+
+        for stats in profiler.stats():
+            print(stats.name, stats.calls, stats.successes, stats.failures)
+
+    .. testoutput:: profiler
+        :options: +NORMALIZE_WHITESPACE
+
+        (integer) + (plus) + (integer) 1 1 0
+        integer 2 2 0
+        (CharacterSet(b'0123456789'))[1, None] 2 2 0
+        CharacterSet(b'0123456789') 6 4 2
+        plus 1 1 0
+    """
+
+    def __init__(self, grammar: Parser):
+        super().__init__(grammar)
+        self._stats: Dict[int, ParserStats] = {}
+
+    def reset(self):
+        """Discard all collected statistics."""
+        # The statistics objects are referenced by the method wrappers and
+        # need to be reset in place.
+        for stats in self._stats.values():
+            for field in fields(ParserStats):
+                if field.name != "name":
+                    setattr(stats, field.name, field.default)
+
+    def stats(self, sort_by: Optional[str] = None) -> List[ParserStats]:
+        """Get the collected statistics.
+
+        Parameters
+        ----------
+        sort_by:
+            Name of a `ParserStats` attribute to sort by in descending order. If
+            ``None``, the statistics are returned in the order of the parsers in
+            the grammar.
+
+        Returns
+        -------
+        :
+            The statistics for each parser in the grammar.
+        """
+        stats = list(self._stats.values())
+        if sort_by is not None:
+            stats.sort(key=lambda s: getattr(s, sort_by), reverse=True)
+        return stats
+
+    def report(
+        self,
+        sort_by: str = "exclusive_time",
+        limit: Optional[int] = None,
+        name_width: int = 50,
+    ) -> str:
+        """Format the collected statistics as a table.
+
+        Parameters
+        ----------
+        sort_by:
+            Name of a `ParserStats` attribute to sort by in descending order.
+        limit:
+            Maximum number of parsers to include. ``None`` includes all.
+        name_width:
+            Maximum width of the name column. Longer names are truncated.
+
+        Returns
+        -------
+        :
+            The formatted table.
+        """
+        stats = self.stats(sort_by)[:limit]
+        width = max((len(s.name) for s in stats), default=4)
+        width = max(4, min(width, name_width))
+        lines = [
+            f"{'name':<{width}} {'calls':>9} {'success':>9} {'failure':>9} "
+            + f"{'incl [s]':>10} {'excl [s]':>10} {'bytes':>10}"
+        ]
+        for s in stats:
+            name = s.name if len(s.name) <= width else s.name[: width - 3] + "..."
+            lines.append(
+                f"{name:<{width}} {s.calls:>9} {s.successes:>9} {s.failures:>9} "
+                + f"{s.inclusive_time:>10.6f} {s.exclusive_time:>10.6f} "
+                + f"{s.bytes_consumed:>10}"
+            )
+        return "\n".join(lines)
+
+    def wrap_parse(self, parser: Parser, parse: ParseMethod) -> ParseMethod:
+        """Wrap the ``parse`` method to record statistics.
+
+        Parameters
+        ----------
+        parser:
+            The parser to instrument.
+        parse:
+            The ``parse`` method to wrap.
+
+        Returns
+        -------
+        :
+            The wrapped method.
+        """
+        stats = self._stats.setdefault(id(parser), ParserStats(str(parser)))
+
+        async def profiled_parse(buf: ParserBuffer, loc: int = 0) -> ParsedNode:
+            parent = _current_frame.get()
+            frame = _Frame()
+            _current_frame.set(frame)
+            start = time.perf_counter()
+            try:
+                parse_tree = await parse(buf, loc)
+            except ParseError:
+                stats.failures += 1
+                stats.calls += 1
+                raise
+            else:
+                stats.successes += 1
+                stats.calls += 1
+                stats.bytes_consumed += parse_tree.end_loc - loc
+                return parse_tree
+            finally:
+                _record_time(stats, start, frame, parent)
+                _current_frame.set(parent)
+
+        return profiled_parse
+
+    def wrap_parse_nowait(
+        self, parser: Parser, parse_nowait: ParseNowaitMethod
+    ) -> ParseNowaitMethod:
+        """Wrap the ``parse_nowait`` method to record statistics.
+
+        Parameters
+        ----------
+        parser:
+            The parser to instrument.
+        parse_nowait:
+            The ``parse_nowait`` method to wrap.
+
+        Returns
+        -------
+        :
+            The wrapped method.
+        """
+        stats = self._stats.setdefault(id(parser), ParserStats(str(parser)))
+
+        def profiled_parse_nowait(buf: ParserBuffer, loc: int = 0) -> ParsedNode:
+            parent = _current_frame.get()
+            frame = _Frame()
+            _current_frame.set(frame)
+            start = time.perf_counter()
+            try:
+                parse_tree = parse_nowait(buf, loc)
+            except WouldBlock:
+                # Will be repeated with parse() and counted and timed there.
+                raise
+            except ParseError:
+                stats.failures += 1
+                stats.calls += 1
+                _record_time(stats, start, frame, parent)
+                raise
+            else:
+                stats.successes += 1
+                stats.calls += 1
+                stats.bytes_consumed += parse_tree.end_loc - loc
+                _record_time(stats, start, frame, parent)
+                return parse_tree
+            finally:
+                _current_frame.set(parent)
+
+        return profiled_parse_nowait
+
+
+def _record_time(
+    stats: ParserStats, start: float, frame: _Frame, parent: Optional[_Frame]
+):
+    elapsed = time.perf_counter() - start
+    stats.inclusive_time += elapsed
+    stats.exclusive_time += elapsed - frame.children_time
+    if parent is not None:
+        parent.children_time += elapsed
@@ -0,0 +1,127 @@
+import asyncio
+from typing import Callable, Generic, Optional, TypeVar
+
+from bite.parsers import ParsedNode, ParseError, Parser
+from bite.push import PushParser
+
+T = TypeVar("T", covariant=True)
+V = TypeVar("V", covariant=True)
+
+
+class ParserProtocol(asyncio.BufferedProtocol, Generic[T, V]):
+    r"""An :class:`asyncio.BufferedProtocol` parsing the received bytes.
+
+    The transport writes received bytes directly into the buffer of a
+    `bite.push.PushParser`, avoiding the copies and task switches of reading from an
+    :class:`asyncio.StreamReader`. Each complete match of the *grammar* is
+    passed to :meth:`message_received`.
+
+    Parameters
+    ----------
+    grammar:
+        Parser combinators defining the grammar to parse.
+    message_callback:
+        Function called with the parse tree of each complete match of the
+        *grammar* by the default implementation of :meth:`message_received`.
+        For example, the ``put_nowait`` method of an :class:`asyncio.Queue`.
+        Location indices of the parse tree will be relative to the start of
+        that parsed segment.
+
+    Examples
+    --------
+
+    .. testcode:: parser_protocol
+
+        import asyncio
+        import socket
+        from bite import CharacterSet, Combine, Literal, ParserProtocol, Suppress
+
+        integer_token = Combine(CharacterSet(b'0123456789')[1, ...])
+        line = integer_token + Literal(b'+') + integer_token + Suppress(Literal(b'\r\n'))
+
+        async def main():
+            queue = asyncio.Queue()
+            local_socket, remote_socket = socket.socketpair()
+            await asyncio.get_running_loop().create_connection(
+                lambda: ParserProtocol(line, queue.put_nowait), sock=local_socket
+            )
+            remote_socket.sendall(b"1+2\r\n23+42\r\n")
+            for _ in range(2):
+                print("Parsed line:", (await queue.get()).values)
+            remote_socket.close()
+
+        asyncio.run(main())
+
+    .. testoutput:: parser_protocol
+
+        Parsed line: (b'1', b'+', b'2')
+        Parsed line: (b'23', b'+', b'42')
+    """
+
+    def __init__(
+        self,
+        grammar: Parser[T, V],
+        message_callback: Optional[Callable[[ParsedNode[T, V]], object]] = None,
+    ):
+        self.grammar = grammar
+        self.message_callback = message_callback
+        self.transport: Optional[asyncio.BaseTransport] = None
+        self._parser = PushParser(grammar)
+        self._failed = False
+
+    def connection_made(self, transport: asyncio.BaseTransport):
+        self.transport = transport
+
+    def connection_lost(self, exc: Optional[Exception]):
+        self._parser.close()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._parser.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes: int):
+        self._parser.buffer_updated(nbytes)
+        self._parse_buffered()
+
+    def eof_received(self) -> Optional[bool]:
+        self._parser.feed_eof()
+        self._parse_buffered()
+        return None
+
+    def message_received(self, parse_tree: ParsedNode[T, V]):
+        """Called with the parse tree of each complete match of the grammar.
+
+        The default implementation passes the *parse_tree* to the
+        *message_callback* given to the constructor.
+
+        Parameters
+        ----------
+        parse_tree:
+            The parse tree of the match. Location indices will be relative to
+            the start of the parsed segment.
+        """
+        if self.message_callback is not None:
+            self.message_callback(parse_tree)
+
+    def parse_failed(self, exc: ParseError):
+        """Called when the received bytes do not match the grammar.
+
+        No further bytes will be parsed afterwards. The default implementation
+        closes the transport.
+
+        Parameters
+        ----------
+        exc:
+            The error raised by the grammar.
+        """
+        if self.transport is not None:
+            self.transport.close()
+
+    def _parse_buffered(self):
+        if self._failed:
+            return
+        try:
+            for parse_tree in self._parser.messages():
+                self.message_received(parse_tree)
+        except ParseError as exc:
+            self._failed = True
+            self.parse_failed(exc)
@@ -0,0 +1,154 @@
+from typing import Coroutine, Generic, Iterator, Optional, TypeVar
+
+from bite.io import WAIT_FOR_DATA, FeedBuffer, WouldBlock
+from bite.parsers import ParsedNode, Parser
+
+T = TypeVar("T", covariant=True)
+V = TypeVar("V", covariant=True)
+
+
+class PushParser(Generic[T, V]):
+    r"""Parse bytes pushed into the parser incrementally.
+
+    This parser does not perform any I/O itself, but bytes have to be passed to
+    it with :meth:`feed`. Thus, it can be used with any I/O framework or
+    blocking sockets. Parse trees of complete matches of the *grammar* are
+    obtained with :meth:`messages`.
+
+    Parsing is suspended at a match that is only partially received. It will be
+    resumed where it stopped once more bytes are fed. Thus, bytes are not
+    scanned again, even if a large match is received in many small pieces.
+
+    Parameters
+    ----------
+    grammar:
+        Parser combinators defining the grammar to parse.
+
+    Examples
+    --------
+
+    .. testcode:: push_parser
+
+        from bite import CharacterSet, Combine, Literal, PushParser, Suppress
+
+        integer_token = Combine(CharacterSet(b'0123456789')[1, ...])
+        line = integer_token + Literal(b'+') + integer_token + Suppress(Literal(b'\r\n'))
+
+        parser = PushParser(line)
+        for data in (b"1+2\r\n23+", b"42\r\n1234+4321\r\n"):
+            parser.feed(data)
+            for parsed_line in parser.messages():
+                print("Parsed line:", parsed_line.values)
+        parser.feed_eof()
+        assert list(parser.messages()) == []
+
+    .. testoutput:: push_parser
+
+        Parsed line: (b'1', b'+', b'2')
+        Parsed line: (b'23', b'+', b'42')
+        Parsed line: (b'1234', b'+', b'4321')
+    """
+
+    def __init__(self, grammar: Parser[T, V]):
+        self.grammar = grammar
+        self._buffer = FeedBuffer()
+        self._pending: Optional[Coroutine[object, None, ParsedNode[T, V]]] = None
+
+    def feed(self, data: bytes):
+        """Pass bytes to the parser.
+
+        Parameters
+        ----------
+        data:
+            The bytes to append to the input.
+        """
+        self._buffer.feed(data)
+
+    def feed_eof(self):
+        """Signal the end of the input. No more bytes may be fed afterwards."""
+        self._buffer.feed_eof()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Get memory to write the next bytes of the input into without copying.
+
+        Call :meth:`buffer_updated` after writing to the memory.
+
+        Parameters
+        ----------
+        sizehint:
+            Minimum size of the returned memory. Values smaller than 1 request
+            a buffer of a default size.
+
+        Returns
+        -------
+        :
+            Memory to write the next bytes of the input into.
+        """
+        return self._buffer.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes: int):
+        """Mark bytes written into the memory obtained with :meth:`get_buffer`
+        as part of the input.
+
+        Parameters
+        ----------
+        nbytes:
+            Number of bytes written.
+        """
+        self._buffer.buffer_updated(nbytes)
+
+    def messages(self) -> Iterator[ParsedNode[T, V]]:
+        """Parse the bytes fed so far.
+
+        Yields
+        ------
+        :
+            A parse tree for each complete match of the *grammar*. Note that
+            location indices of the parse tree will be relative to the start of
+            that parsed segment.
+
+        Raises
+        ------
+        bite.parsers.ParseError
+            If the *grammar* fails to parse the fed bytes. The bytes of the
+            failed match are retained. Thus, parsing the same input again will
+            fail again.
+        RuntimeError
+            If a parser of the *grammar* awaits something other than more input.
+        """
+        while not self._buffer.at_eof():
+            parse_tree = self._parse_next()
+            if parse_tree is None:
+                return
+            self._buffer.drop_prefix(parse_tree.end_loc)
+            yield parse_tree
+
+    def close(self):
+        """Abort parsing a partially received match.
+
+        The bytes of the match are retained and parsed from their start with the
+        next call to :meth:`messages`.
+        """
+        if self._pending is not None:
+            self._pending.close()
+            self._pending = None
+
+    def _parse_next(self) -> Optional[ParsedNode[T, V]]:
+        if self._pending is None:
+            try:
+                return self.grammar.parse_nowait(self._buffer, 0)
+            except WouldBlock:
+                self._pending = self.grammar.parse(self._buffer, 0)
+
+        try:
+            awaited = self._pending.send(None)
+        except BaseException as exc:
+            self._pending = None
+            if isinstance(exc, StopIteration):
+                return exc.value
+            raise
+
+        if awaited is not WAIT_FOR_DATA:
+            self.close()
+            raise RuntimeError("parsers used with PushParser may only await input")
+        return None
@@ -0,0 +1,123 @@
+import pytest
+
+from bite.analysis import (
+    LEFT_RECURSION,
+    NULLABLE_REPEAT,
+    OVERLAPPING_ALTERNATIVES,
+    SHADOWED_ALTERNATIVE,
+    GrammarAnalysis,
+    analyze,
+)
+from bite.parsers import (
+    CaselessLiteral,
+    CharacterSet,
+    Combine,
+    DelimitedList,
+    FixedByteCount,
+    Forward,
+    Integer,
+    Literal,
+    MatchFirst,
+    Not,
+    Number,
+    Opt,
+    QuotedString,
+    Regex,
+    SkipTo,
+)
+from bite.transformers import Suppress
+
+
+@pytest.mark.parametrize(
+    "parser,nullable,first",
+    [
+        (Literal(b"ab"), False, b"a"),
+        (CaselessLiteral(b"ab"), False, b"aA"),
+        (CharacterSet(b"xy"), False, b"xy"),
+        (FixedByteCount(0), True, b""),
+        (Not(Literal(b"a")), True, b""),
+        (Regex(rb"a+"), False, bytes(range(256))),
+        (Regex(rb"a*"), True, bytes(range(256))),
+        (SkipTo(b"a"), True, bytes(range(256))),
+        (Integer(), False, b"0123456789"),
+        (Integer(16, signed=True), False, b"0123456789abcdefABCDEF+-"),
+        (Number(), False, b"0123456789."),
+        (QuotedString(b"'"), False, b"'"),
+        (DelimitedList(Literal(b"a")), False, b"a"),
+        (DelimitedList(Opt(Literal(b"a")), b","), True, b"a,"),
+        (DelimitedList(Opt(Literal(b"a")), b",", max_items=1), True, b"a"),
+        (Opt(Literal(b"a")), True, b"a"),
+        (Literal(b"a")[1, ...], False, b"a"),
+        (Opt(Literal(b"a")) + Literal(b"b") + Literal(b"c"), False, b"ab"),
+        (Literal(b"a") | Opt(Literal(b"b")), True, b"ab"),
+        (Combine(Literal(b"a")[0, ...]), True, b"a"),
+        (Suppress(Literal(b"a")), False, b"a"),
+    ],
+)
+def test_nullable_and_first(parser, nullable, first):
+    analysis = GrammarAnalysis(parser)
+    assert analysis.nullable(parser) == nullable
+    assert analysis.first(parser) == frozenset(first)
+
+
+def test_analysis_of_recursive_grammar():
+    expr = Forward(name="expr")
+    expr.assign(Literal(b"(") + Opt(expr) + Literal(b")") | Opt(Literal(b"x")))
+    analysis = GrammarAnalysis(expr)
+    assert analysis.nullable(expr)
+    assert analysis.first(expr) == frozenset(b"(x")
+
+
+def test_analyze_finds_no_hazards_in_safe_grammar():
+    expr = Forward(name="expr")
+    expr.assign(
+        Literal(b"[") + (expr | CharacterSet(b"0123456789"))[0, ...] + Literal(b"]")
+    )
+    assert analyze(expr) == []
+
+
+def test_analyze_finds_nullable_repeat():
+    item = Opt(Literal(b"a"), name="item")
+    items = item[0, ...]
+    hazards = analyze(items)
+    assert [(h.kind, h.parser) for h in hazards] == [(NULLABLE_REPEAT, items)]
+    assert "item" in hazards[0].message
+
+
+def test_analyze_finds_nullable_delimited_list():
+    items = DelimitedList(Opt(Literal(b"a")), Opt(Literal(b",")))
+    hazards = analyze(items)
+    assert [(h.kind, h.parser) for h in hazards] == [(NULLABLE_REPEAT, items)]
+    assert analyze(DelimitedList(Opt(Literal(b"a")), b",")) == []
+
+
+def test_analyze_ignores_bounded_nullable_repeat():
+    assert analyze(Opt(Literal(b"a"))[0, 3]) == []
+
+
+def test_analyze_finds_left_recursion():
+    expr = Forward(name="expr")
+    expr.assign(Opt(Literal(b"-")) + expr + Literal(b"+") | Literal(b"1"))
+    assert [(h.kind, h.parser) for h in analyze(expr)] == [(LEFT_RECURSION, expr)]
+
+
+def test_analyze_finds_shadowed_alternative():
+    choice = MatchFirst([Opt(Literal(b"a")), Literal(b"b")], name="choice")
+    assert [(h.kind, h.parser) for h in analyze(choice)] == [
+        (SHADOWED_ALTERNATIVE, choice)
+    ]
+
+
+def test_analyze_finds_overlapping_alternatives_within_repetitions():
+    choice = MatchFirst(
+        [Literal(b"ab", name="ab"), Literal(b"ac", name="ac")], name="choice"
+    )
+    assert analyze(choice) == []
+
+    hazards = analyze(choice[0, ...])
+    assert [(h.kind, h.parser) for h in hazards] == [(OVERLAPPING_ALTERNATIVES, choice)]
+    assert "ab and ac of choice within a repetition" in hazards[0].message
+    assert "b'a'" in hazards[0].message
+
+    hazards = analyze((choice[1, ...] + Literal(b";"))[0, ...])
+    assert "within nested repetitions" in hazards[0].message
@@ -0,0 +1,73 @@
+import pickle
+
+from bite.cache import cached_grammar, default_cache_dir
+from bite.io import BytesBuffer
+from bite.parsers import CharacterSet, Combine, Literal
+from bite.transformers import Group, Suppress, TransformValues
+
+build_count = 0
+
+
+def build_grammar():
+    global build_count
+    build_count += 1
+    integer_token = Combine(CharacterSet(b"0123456789")[1, ...])
+    return Group(integer_token + Suppress(Literal(b"+")) + integer_token)
+
+
+def test_cached_grammar_builds_grammar_once(tmp_path):
+    count_before = build_count
+
+    grammar = cached_grammar(build_grammar, cache_dir=tmp_path)
+    cached = cached_grammar(build_grammar, cache_dir=tmp_path)
+
+    assert build_count == count_before + 1
+    assert cached is not grammar
+    assert cached.parse_nowait(BytesBuffer(b"23+42")).values == ((b"23", b"42"),)
+
+
+def test_cached_grammar_key(tmp_path):
+    count_before = build_count
+
+    cached_grammar(build_grammar, cache_dir=tmp_path, key="a")
+    cached_grammar(build_grammar, cache_dir=tmp_path, key="b")
+
+    assert build_count == count_before + 2
+
+
+def test_cached_grammar_rebuilds_corrupted_cache_entries(tmp_path):
+    cached_grammar(build_grammar, cache_dir=tmp_path)
+    (cache_file,) = tmp_path.iterdir()
+    cache_file.write_bytes(b"corrupted")
+    count_before = build_count
+
+    grammar = cached_grammar(build_grammar, cache_dir=tmp_path)
+
+    assert build_count == count_before + 1
+    assert grammar.parse_nowait(BytesBuffer(b"23+42")).values == ((b"23", b"42"),)
+    assert pickle.loads(cache_file.read_bytes()) is not None
+
+
+def build_unpicklable_grammar():
+    return TransformValues(Literal(b"1"), lambda values: (int(values[0]),))
+
+
+def test_cached_grammar_returns_unpicklable_grammar(tmp_path):
+    grammar = cached_grammar(build_unpicklable_grammar, cache_dir=tmp_path)
+
+    assert grammar.parse_nowait(BytesBuffer(b"1")).values == (1,)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cached_grammar_with_unwritable_cache_dir(tmp_path):
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_bytes(b"")
+
+    grammar = cached_grammar(build_grammar, cache_dir=not_a_dir / "cache")
+
+    assert grammar.parse_nowait(BytesBuffer(b"23+42")).values == ((b"23", b"42"),)
+
+
+def test_default_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_dir() == tmp_path / "bite"
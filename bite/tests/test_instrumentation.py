@@ -0,0 +1,91 @@
+import asyncio
+import pickle
+from typing import List, Optional
+
+import pytest
+
+from bite.instrumentation import Instrumentation, iter_parsers
+from bite.parse_functions import parse_bytes
+from bite.parsers import CharacterSet, Forward, Literal, Opt, Parser
+
+
+def test_iter_parsers_visits_each_parser_once():
+    digit = CharacterSet(b"0123456789", name="digit")
+    grammar = digit + Literal(b"+", name="plus") + digit
+    assert [parser.name for parser in iter_parsers(grammar)] == [
+        grammar.name,
+        "digit",
+        "plus",
+    ]
+
+
+def test_iter_parsers_handles_recursive_grammars():
+    expr = Forward(name="expr")
+    expr.assign(Literal(b"[") + Opt(expr) + Literal(b"]"))
+    parsers = list(iter_parsers(expr))
+    assert parsers[0] is expr
+    assert sum(parser is expr for parser in parsers) == 1
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self, grammar: Parser):
+        super().__init__(grammar)
+        self.calls: List[Optional[str]] = []
+
+    def wrap_parse(self, parser, parse):
+        async def wrapped(buf, loc=0):
+            self.calls.append(parser.name)
+            return await parse(buf, loc)
+
+        return wrapped
+
+    def wrap_parse_nowait(self, parser, parse_nowait):
+        def wrapped(buf, loc=0):
+            self.calls.append(parser.name)
+            return parse_nowait(buf, loc)
+
+        return wrapped
+
+
+def test_instrumentation_wraps_parsers_while_attached():
+    grammar = Literal(b"a", name="a") + Literal(b"b", name="b")
+    instrumentation = RecordingInstrumentation(grammar)
+
+    with instrumentation:
+        assert instrumentation.attached
+        asyncio.run(parse_bytes(grammar, b"ab"))
+    assert not instrumentation.attached
+    assert instrumentation.calls == [grammar.name, "a", "b"]
+
+    asyncio.run(parse_bytes(grammar, b"ab"))
+    assert len(instrumentation.calls) == 3
+
+
+def test_instrumentation_detach_restores_class_methods():
+    grammar = Literal(b"a") + Opt(Literal(b"b"))
+    with RecordingInstrumentation(grammar):
+        pass
+    for parser in iter_parsers(grammar):
+        assert "parse" not in vars(parser)
+        assert "parse_nowait" not in vars(parser)
+    pickle.dumps(grammar)
+
+
+def test_instrumentations_can_be_nested():
+    grammar = Literal(b"a", name="a")
+    outer = RecordingInstrumentation(grammar)
+    inner = RecordingInstrumentation(grammar)
+    with outer:
+        with inner:
+            asyncio.run(parse_bytes(grammar, b"a"))
+        asyncio.run(parse_bytes(grammar, b"a"))
+    assert outer.calls == ["a", "a"]
+    assert inner.calls == ["a"]
+    assert "parse" not in vars(grammar)
+
+
+def test_instrumentation_cannot_be_attached_twice():
+    instrumentation = Instrumentation(Literal(b"a"))
+    with instrumentation:
+        with pytest.raises(RuntimeError):
+            instrumentation.attach()
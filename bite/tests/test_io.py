@@ -1,9 +1,21 @@
-from asyncio import Future, IncompleteReadError
+import re
+from asyncio import Future, IncompleteReadError, StreamReader
 from unittest.mock import MagicMock
 
 import pytest
 
-from bite.io import BytesBuffer, StreamReaderBuffer
+from bite.io import (
+    WAIT_FOR_DATA,
+    BufferLimitExceededError,
+    BytesBuffer,
+    FeedBuffer,
+    IterableBuffer,
+    MmapBuffer,
+    StreamReaderBuffer,
+    StreamStats,
+    WouldBlock,
+    YieldingBuffer,
+)
 from bite.tests.mock_reader import MockReader
 
 
@@ -36,14 +48,50 @@ async def test_stream_reader_buffer_random_access(index, expected):
 
 
 @pytest.mark.asyncio
-async def test_stream_reader_buffer_reads_not_more_than_necessary():
+async def test_stream_reader_buffer_reads_ahead_in_chunks():
     future = Future()
-    future.set_result(b"abc")
+    future.set_result(b"abcdef")
 
     reader = MagicMock()
-    reader.readexactly.return_value = future
-    await StreamReaderBuffer(reader).get(slice(0, 3))
-    reader.readexactly.assert_called_once_with(3)
+    reader.read.return_value = future
+    buffer = StreamReaderBuffer(reader, chunk_size=8)
+    assert await buffer.get(slice(0, 3)) == b"abc"
+    assert await buffer.get(slice(3, 6)) == b"def"
+    reader.read.assert_called_once_with(8)
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_records_stats():
+    reader = StreamReader()
+    reader.feed_data(b"abcdef")
+    reader.feed_eof()
+    stats = StreamStats()
+    buffer = StreamReaderBuffer(reader, chunk_size=4, stats=stats)
+
+    assert await buffer.get(slice(0, 3)) == b"abc"
+    await buffer.drop_prefix(2)
+    assert await buffer.get(slice(0, 4)) == b"cdef"
+
+    assert stats.bytes_read == 6
+    assert stats.reads == 2
+    assert stats.buffer_high_water_mark == 4
+    assert stats.io_wait_time >= 0
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_reads_at_least_requested_length():
+    future = Future()
+    future.set_result(b"abcdef")
+
+    reader = MagicMock()
+    reader.read.return_value = future
+    await StreamReaderBuffer(reader, chunk_size=2).get(slice(0, 6))
+    reader.read.assert_called_once_with(6)
+
+
+def test_stream_reader_buffer_rejects_non_positive_chunk_size():
+    with pytest.raises(ValueError):
+        StreamReaderBuffer(MockReader(b""), chunk_size=0)
 
 
 @pytest.mark.asyncio
@@ -62,6 +110,131 @@ async def test_stream_reader_buffer_repeated_random_access():
     assert await buffer.get(8) == b"8"
 
 
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_limits_read_ahead_to_max_buffer_size():
+    future = Future()
+    future.set_result(b"abc")
+
+    reader = MagicMock()
+    reader.read.return_value = future
+    reader.at_eof.return_value = False
+    buffer = StreamReaderBuffer(reader, chunk_size=8, max_buffer_size=5)
+    await buffer.get(slice(0, 3))
+    reader.read.assert_called_once_with(5)
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_max_buffer_size_exceeded():
+    buffer = StreamReaderBuffer(
+        MockReader(b"0123456789", chunk_size=2), chunk_size=2, max_buffer_size=4
+    )
+    assert await buffer.get(slice(0, 4)) == b"0123"
+    with pytest.raises(BufferLimitExceededError):
+        await buffer.get(4)
+    with pytest.raises(BufferLimitExceededError):
+        await buffer.get(slice(0, None))
+    await buffer.drop_prefix(2)
+    assert await buffer.get(slice(0, 4)) == b"2345"
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_max_buffer_size_allows_eof():
+    reader = StreamReader()
+    reader.feed_data(b"0123")
+    reader.feed_eof()
+    buffer = StreamReaderBuffer(reader, max_buffer_size=4)
+    assert await buffer.get(slice(0, None)) == b"0123"
+    assert await buffer.get(slice(2, 8)) == b"23"
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_max_lookahead_exceeded():
+    buffer = StreamReaderBuffer(MockReader(b"0123456789"), max_lookahead=4)
+    assert await buffer.get(slice(0, 4)) == b"0123"
+    assert buffer.get_nowait(slice(0, 4)) == b"0123"
+    with pytest.raises(BufferLimitExceededError):
+        await buffer.get(slice(2, 5))
+    with pytest.raises(BufferLimitExceededError):
+        buffer.get_nowait(slice(2, 5))
+    with pytest.raises(BufferLimitExceededError):
+        await buffer.get(slice(0, None))
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_get_nowait():
+    buffer = StreamReaderBuffer(MockReader(b"0123456789", chunk_size=4), chunk_size=4)
+    with pytest.raises(WouldBlock):
+        buffer.get_nowait(0)
+    await buffer.get(0)
+    assert buffer.get_nowait(slice(0, 4)) == b"0123"
+    with pytest.raises(WouldBlock):
+        buffer.get_nowait(slice(2, 6))
+    with pytest.raises(WouldBlock):
+        buffer.get_nowait(slice(2, None))
+    await buffer.get(slice(0, None))
+    assert buffer.get_nowait(slice(2, None)) == b"23456789"
+    assert buffer.get_nowait(slice(8, 12)) == b"89"
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_match_reads_until_match_is_final():
+    buffer = StreamReaderBuffer(MockReader(b"0123456789ab", chunk_size=4), chunk_size=4)
+    match = await buffer.match(re.compile(rb"[0-9]+"), 2)
+    assert match.group() == b"23456789"
+    assert buffer.get_current() == b"0123456789ab"
+    assert (await buffer.match(re.compile(rb"[a-z]+"), 10)).group() == b"ab"
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_match_nowait():
+    buffer = StreamReaderBuffer(MockReader(b"0123456789", chunk_size=4), chunk_size=4)
+    await buffer.get(0)
+    pattern = re.compile(rb"[0-9]+")
+    with pytest.raises(WouldBlock):
+        buffer.match_nowait(pattern, 0)
+    assert buffer.match_nowait(pattern, 0, max_length=3).group() == b"012"
+    assert buffer.match_nowait(re.compile(rb"[0-2]+"), 0).group() == b"012"
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_match_respects_max_lookahead():
+    buffer = StreamReaderBuffer(
+        MockReader(b"0123456789", chunk_size=4), chunk_size=4, max_lookahead=6
+    )
+    with pytest.raises(BufferLimitExceededError):
+        await buffer.match(re.compile(rb"[0-9]+"), 0)
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_find_reads_until_found():
+    buffer = StreamReaderBuffer(
+        MockReader(b"0123456789\r\nab", chunk_size=4), chunk_size=4
+    )
+    assert await buffer.find(b"\r\n", 2) == 10
+    assert buffer.get_current() == b"0123456789\r\n"
+    assert await buffer.find(b"x") == -1
+    assert buffer.get_current() == b"0123456789\r\nab"
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_find_nowait():
+    buffer = StreamReaderBuffer(MockReader(b"0123456789", chunk_size=4), chunk_size=4)
+    await buffer.get(0)
+    with pytest.raises(WouldBlock):
+        buffer.find_nowait(b"5")
+    assert buffer.find_nowait(b"2") == 2
+    assert buffer.find_nowait(b"5", 0, 3) == -1
+
+
+@pytest.mark.asyncio
+async def test_stream_reader_buffer_find_respects_max_lookahead():
+    buffer = StreamReaderBuffer(
+        MockReader(b"0123456789", chunk_size=4), chunk_size=4, max_lookahead=6
+    )
+    with pytest.raises(BufferLimitExceededError):
+        await buffer.find(b"9")
+
+
 @pytest.mark.asyncio
 async def test_stream_reader_buffer_get_current():
     buffer = StreamReaderBuffer(MockReader(b"0123456789"))
@@ -127,6 +300,419 @@ async def test_bytes_buffer_random_access(index, expected):
     assert await buffer.get(index) == expected
 
 
+def test_bytes_buffer_get_nowait():
+    buffer = BytesBuffer(b"0123456789")
+    assert buffer.get_nowait(slice(2, 5)) == b"234"
+    assert buffer.get_nowait(11) == b""
+
+
+def test_bytes_buffer_match():
+    buffer = BytesBuffer(b"abc123")
+    match = buffer.match_nowait(re.compile(rb"[0-9]+"), 3)
+    assert match.group() == b"123"
+    assert (match.pos, match.end()) == (3, 6)
+    assert buffer.match_nowait(re.compile(rb"[0-9]+"), 3, max_length=2).group() == (
+        b"12"
+    )
+    assert buffer.match_nowait(re.compile(rb"[0-9]+"), 0) is None
+
+
+def test_bytes_buffer_find():
+    buffer = BytesBuffer(b"ab\r\ncd\r\n")
+    assert buffer.find_nowait(b"\r\n") == 2
+    assert buffer.find_nowait(b"\r\n", 3) == 6
+    assert buffer.find_nowait(b"\r\n", 3, 7) == -1
+    assert buffer.find_nowait(b"x") == -1
+
+
 def test_bytes_buffer_get_current():
     buffer = BytesBuffer(b"0123456789")
     assert buffer.get_current() == b"0123456789"
+
+
+@pytest.fixture(params=[(b"", None), (b"__", 12)], ids=["to_eof", "with_end"])
+def mmap_buffer(tmp_path, request):
+    suffix, end = request.param
+    path = tmp_path / "buffer"
+    path.write_bytes(b"__0123456789" + suffix)
+    with MmapBuffer(path, end=end) as buffer:
+        buffer.drop_prefix(2)
+        yield buffer
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index,expected",
+    [
+        (0, b"0"),
+        (2, b"2"),
+        (-2, b"8"),
+        (slice(3), b"012"),
+        (slice(-3), b"0123456"),
+        (slice(None, 3), b"012"),
+        (slice(2, 5), b"234"),
+        (slice(8, None), b"89"),
+        (slice(2, 6, 2), b"24"),
+        (slice(-8, -4, 2), b"24"),
+        (slice(6, 2, -2), b"64"),
+        (slice(6, None, -2), b"6420"),
+        (slice(None, 2, -2), b"9753"),
+        (11, b""),
+        (slice(5, 11), b"56789"),
+        (slice(11, 12), b""),
+        (slice(11, 5, -1), b"9876"),
+    ],
+)
+async def test_mmap_buffer_random_access(mmap_buffer, index, expected):
+    assert await mmap_buffer.get(index) == expected
+    assert mmap_buffer.get_nowait(index) == expected
+
+
+def test_mmap_buffer_get_current(mmap_buffer):
+    assert mmap_buffer.get_current() == b"0123456789"
+
+
+def test_mmap_buffer_match(mmap_buffer):
+    match = mmap_buffer.match_nowait(re.compile(rb"[0-9]+"), 2)
+    assert match.group() == b"23456789"
+    assert match.end() - match.pos == 8
+    assert mmap_buffer.match_nowait(re.compile(rb"_"), 10) is None
+
+
+def test_mmap_buffer_find(mmap_buffer):
+    assert mmap_buffer.find_nowait(b"45") == 4
+    assert mmap_buffer.find_nowait(b"45", 0, 5) == -1
+    assert mmap_buffer.find_nowait(b"_") == -1
+
+
+def test_mmap_buffer_drop_prefix(mmap_buffer):
+    mmap_buffer.drop_prefix(4)
+    assert mmap_buffer.get_nowait(0) == b"4"
+    assert len(mmap_buffer) == 6
+    with pytest.raises(ValueError):
+        mmap_buffer.drop_prefix(7)
+
+
+def test_mmap_buffer_empty_file(tmp_path):
+    path = tmp_path / "buffer"
+    path.write_bytes(b"")
+    with MmapBuffer(path) as buffer:
+        assert len(buffer) == 0
+        assert buffer.get_nowait(slice(0, 1)) == b""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index,expected",
+    [
+        (0, b"0"),
+        (2, b"2"),
+        (-2, b"8"),
+        (slice(3), b"012"),
+        (slice(-3), b"0123456"),
+        (slice(None, 3), b"012"),
+        (slice(2, 5), b"234"),
+        (slice(8, None), b"89"),
+        (slice(2, 6, 2), b"24"),
+        (slice(-8, -4, 2), b"24"),
+        (slice(6, 2, -2), b"64"),
+        (slice(6, None, -2), b"6420"),
+        (slice(None, 2, -2), b"9753"),
+        (11, b""),
+        (slice(5, 11), b"56789"),
+        (slice(11, 12), b""),
+        (slice(11, 5, -1), b"9876"),
+    ],
+)
+async def test_iterable_buffer_random_access(index, expected):
+    buffer = IterableBuffer([b"012", b"", b"3456", b"7", b"89"])
+    assert await buffer.get(index) == expected
+    assert buffer.get_nowait(index) == expected
+
+
+def test_iterable_buffer_pulls_chunks_on_demand():
+    pulled = []
+
+    def chunks():
+        for chunk in (b"012", b"345", b"678"):
+            pulled.append(chunk)
+            yield chunk
+
+    buffer = IterableBuffer(chunks())
+    assert buffer.get_nowait(slice(0, 2)) == b"01"
+    assert pulled == [b"012"]
+    assert buffer.get_nowait(slice(2, 4)) == b"23"
+    assert pulled == [b"012", b"345"]
+
+
+def test_iterable_buffer_match_across_chunks():
+    buffer = IterableBuffer(iter([b"xx0", b"12", b"345", b"a"]))
+    buffer.drop_prefix(2)
+    pattern = re.compile(rb"[0-9]+")
+    match = buffer.match_nowait(pattern, 1)
+    assert match.group() == b"12345"
+    assert match.end() - match.pos == 5
+    assert buffer.match_nowait(pattern, 6) is None
+    assert buffer.match_nowait(pattern, 7) is None
+
+
+@pytest.mark.parametrize(
+    "sub,start,end,expected",
+    [
+        (b"3", 0, None, 1),
+        (b"45", 0, None, 2),  # spans a chunk boundary
+        (b"3456", 0, None, 1),  # spans multiple chunk boundaries
+        (b"45", 3, None, -1),
+        (b"45", 0, 3, -1),
+        (b"7", 0, None, 5),
+        (b"x", 0, None, -1),
+    ],
+)
+def test_iterable_buffer_find(sub, start, end, expected):
+    buffer = IterableBuffer(iter([b"xx2", b"34", b"5", b"67"]))
+    buffer.drop_prefix(2)
+    assert buffer.find_nowait(sub, start, end) == expected
+
+
+def test_iterable_buffer_find_pulls_chunks_on_demand():
+    pulled = []
+
+    def chunks():
+        for chunk in (b"012", b"345", b"678"):
+            pulled.append(chunk)
+            yield chunk
+
+    buffer = IterableBuffer(chunks())
+    assert buffer.find_nowait(b"34") == 3
+    assert pulled == [b"012", b"345"]
+
+
+def test_iterable_buffer_drop_prefix():
+    buffer = IterableBuffer([b"012", b"345", b"678"])
+    buffer.drop_prefix(4)
+    assert buffer.get_current() == b"45"
+    assert buffer.get_nowait(slice(0, 3)) == b"456"
+    buffer.drop_prefix(5)
+    assert buffer.get_nowait(slice(0, None)) == b""
+    assert buffer.at_eof()
+    with pytest.raises(ValueError):
+        buffer.drop_prefix(1)
+
+
+def test_iterable_buffer_at_eof():
+    buffer = IterableBuffer([b"01"])
+    assert not buffer.at_eof()
+    buffer.drop_prefix(2)
+    assert not buffer.at_eof()
+    assert buffer.get_nowait(0) == b""
+    assert buffer.at_eof()
+
+
+def test_iterable_buffer_get_current_does_not_pull_chunks():
+    buffer = IterableBuffer([b"012", b"345"])
+    assert buffer.get_current() == b""
+    buffer.get_nowait(slice(0, 2))
+    assert buffer.get_current(slice(1, 5)) == b"12"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index,expected",
+    [
+        (0, b"0"),
+        (-2, b"8"),
+        (slice(-3), b"0123456"),
+        (slice(2, 5), b"234"),
+        (slice(6, None, -2), b"6420"),
+        (slice(None, 2, -2), b"9753"),
+        (11, b""),
+        (slice(11, 5, -1), b"9876"),
+    ],
+)
+async def test_feed_buffer_random_access(index, expected):
+    buffer = FeedBuffer()
+    buffer.feed(b"xx0123")
+    buffer.drop_prefix(2)
+    buffer.feed(b"456789")
+    buffer.feed_eof()
+    assert await buffer.get(index) == expected
+    assert buffer.get_nowait(index) == expected
+
+
+def test_feed_buffer_get_waits_for_data():
+    buffer = FeedBuffer()
+    buffer.feed(b"01")
+    coroutine = buffer.get(slice(1, 3))
+    assert coroutine.send(None) is WAIT_FOR_DATA
+    buffer.feed(b"2")
+    with pytest.raises(StopIteration) as stop:
+        coroutine.send(None)
+    assert stop.value.value == b"12"
+
+
+def test_feed_buffer_get_nowait():
+    buffer = FeedBuffer()
+    buffer.feed(b"012")
+    assert buffer.get_nowait(slice(0, 3)) == b"012"
+    with pytest.raises(WouldBlock):
+        buffer.get_nowait(slice(2, 4))
+    with pytest.raises(WouldBlock):
+        buffer.get_nowait(-1)
+    buffer.feed_eof()
+    assert buffer.get_nowait(slice(2, 4)) == b"2"
+
+
+def test_feed_buffer_match_waits_for_data():
+    buffer = FeedBuffer()
+    buffer.feed(b"xx01")
+    buffer.drop_prefix(2)
+    pattern = re.compile(rb"[0-9]+")
+    with pytest.raises(WouldBlock):
+        buffer.match_nowait(pattern, 0)
+
+    coroutine = buffer.match(pattern, 1)
+    assert coroutine.send(None) is WAIT_FOR_DATA
+    buffer.feed(b"2;")
+    with pytest.raises(StopIteration) as stop:
+        coroutine.send(None)
+    assert stop.value.value.group() == b"12"
+
+    buffer.feed_eof()
+    assert buffer.match_nowait(pattern, 3) is None
+
+
+def test_feed_buffer_find_waits_for_data():
+    buffer = FeedBuffer()
+    buffer.feed(b"xxab\r")
+    buffer.drop_prefix(2)
+    with pytest.raises(WouldBlock):
+        buffer.find_nowait(b"\r\n")
+
+    coroutine = buffer.find(b"\r\n")
+    assert coroutine.send(None) is WAIT_FOR_DATA
+    buffer.feed(b"\n")
+    with pytest.raises(StopIteration) as stop:
+        coroutine.send(None)
+    assert stop.value.value == 2
+
+    buffer.feed_eof()
+    assert buffer.find_nowait(b"\r\n", 3) == -1
+
+
+def test_feed_buffer_writes_into_provided_memory():
+    buffer = FeedBuffer()
+    memory = buffer.get_buffer(4)
+    assert len(memory) >= 4
+    memory[:3] = b"012"
+    del memory
+    buffer.buffer_updated(3)
+    assert buffer.get_current() == b"012"
+
+
+def test_feed_buffer_reuses_memory_of_dropped_prefix():
+    buffer = FeedBuffer()
+    memory = buffer.get_buffer(8)
+    size = len(memory)
+    memory[:size] = b"0" * (size - 2) + b"12"
+    del memory
+    buffer.buffer_updated(size)
+    buffer.drop_prefix(size - 2)
+
+    buffer.feed(b"3" * (size - 2))
+
+    assert buffer.get_current(slice(0, 3)) == b"123"
+    assert len(buffer) == size
+    assert len(buffer._buf) == size
+
+
+def test_feed_buffer_grows_geometrically():
+    buffer = FeedBuffer()
+    reallocations = 0
+    for i in range(1000):
+        previous = buffer._buf
+        buffer.feed(bytes([i % 256]))
+        reallocations += buffer._buf is not previous
+
+    assert buffer.get_current() == bytes(i % 256 for i in range(1000))
+    assert reallocations <= 11
+
+
+def test_feed_buffer_does_not_compact_mostly_pending_bytes():
+    buffer = FeedBuffer()
+    buffer.feed(b"0123")
+    buffer.drop_prefix(1)
+    previous = buffer._buf
+
+    buffer.feed(b"4567")
+
+    assert buffer._buf is not previous
+    assert buffer.get_current() == b"1234567"
+
+
+def test_feed_buffer_drop_prefix():
+    buffer = FeedBuffer()
+    buffer.feed(b"0123")
+    buffer.drop_prefix(3)
+    assert buffer.get_current() == b"3"
+    with pytest.raises(ValueError):
+        buffer.drop_prefix(2)
+
+
+def test_feed_buffer_at_eof():
+    buffer = FeedBuffer()
+    buffer.feed(b"01")
+    buffer.feed_eof()
+    assert not buffer.at_eof()
+    buffer.drop_prefix(2)
+    assert buffer.at_eof()
+
+
+def test_yielding_buffer_limits_steps():
+    buffer = YieldingBuffer(BytesBuffer(b"0123"), max_steps=2)
+    assert buffer.get_nowait(0) == b"0"
+    assert buffer.get_nowait(1) == b"1"
+    with pytest.raises(WouldBlock):
+        buffer.get_nowait(2)
+
+    coroutine = buffer.get(2)
+    assert coroutine.send(None) is None  # yields to the event loop
+    with pytest.raises(StopIteration) as stop:
+        coroutine.send(None)
+    assert stop.value.value == b"2"
+    assert buffer.get_nowait(3) == b"3"
+
+
+def test_yielding_buffer_limits_match_steps():
+    buffer = YieldingBuffer(BytesBuffer(b"0123"), max_steps=1)
+    pattern = re.compile(rb"[0-9]+")
+    assert buffer.match_nowait(pattern, 0).group() == b"0123"
+    with pytest.raises(WouldBlock):
+        buffer.match_nowait(pattern, 0)
+
+    coroutine = buffer.match(pattern, 1)
+    assert coroutine.send(None) is None  # yields to the event loop
+    with pytest.raises(StopIteration) as stop:
+        coroutine.send(None)
+    assert stop.value.value.group() == b"123"
+
+
+def test_yielding_buffer_limits_find_steps():
+    buffer = YieldingBuffer(BytesBuffer(b"0123"), max_steps=1)
+    assert buffer.find_nowait(b"2") == 2
+    with pytest.raises(WouldBlock):
+        buffer.find_nowait(b"2")
+
+
+def test_yielding_buffer_limits_time(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    buffer = YieldingBuffer(BytesBuffer(b"0123"), max_interval=0.5)
+    assert buffer.get_nowait(0) == b"0"
+    now = 0.5
+    with pytest.raises(WouldBlock):
+        buffer.get_nowait(1)
+
+
+def test_yielding_buffer_rejects_non_positive_max_steps():
+    with pytest.raises(ValueError):
+        YieldingBuffer(BytesBuffer(b""), max_steps=0)
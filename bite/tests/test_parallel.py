@@ -0,0 +1,143 @@
+import pytest
+
+from bite.io import MmapBuffer
+from bite.parallel import parse_file_parallel, parse_many
+from bite.parsers import (
+    CharacterSet,
+    Combine,
+    Literal,
+    Repeat,
+    TrailingBytesError,
+    UnmetExpectationError,
+)
+
+grammar = Combine(CharacterSet(b"0123456789")[1, ...]) + Literal(b";")
+
+
+def test_parse_many_ordered():
+    inputs = [str(i).encode() + b";" for i in range(100)]
+    results = parse_many(grammar, inputs, workers=2, batch_size=7)
+    assert [result.values for result in results] == [
+        (str(i).encode(), b";") for i in range(100)
+    ]
+
+
+def test_parse_many_as_completed():
+    inputs = (str(i).encode() + b";" for i in range(100))
+    results = parse_many(grammar, inputs, workers=2, batch_size=7, ordered=False)
+    assert sorted((index, result.values) for index, result in results) == [
+        (i, (str(i).encode(), b";")) for i in range(100)
+    ]
+
+
+def test_parse_many_empty_inputs():
+    assert list(parse_many(grammar, [], workers=1)) == []
+
+
+def test_parse_many_raises_parse_error():
+    with pytest.raises(UnmetExpectationError) as exc_info:
+        list(parse_many(grammar, [b"1;", b"x;"], workers=1))
+    assert exc_info.value.at_loc == 0
+    assert exc_info.value.lineno == 1
+
+
+def test_parse_many_return_exceptions():
+    results = list(
+        parse_many(
+            grammar,
+            [b"1;", b"x;", b"2;2"],
+            workers=1,
+            parse_all=True,
+            return_exceptions=True,
+        )
+    )
+    assert results[0].values == (b"1", b";")
+    assert isinstance(results[1], UnmetExpectationError)
+    assert isinstance(results[2], TrailingBytesError)
+
+
+def test_parse_many_rejects_non_positive_batch_size():
+    with pytest.raises(ValueError):
+        list(parse_many(grammar, [b"1;"], batch_size=0))
+
+
+@pytest.fixture
+def lines_file(tmp_path):
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"".join(str(i).encode() + b";\n" for i in range(200)))
+    return path
+
+
+line = Combine(CharacterSet(b"0123456789")[1, ...]) + Literal(b";\n")
+
+
+def parse_file_sequentially(grammar, path):
+    with MmapBuffer(path) as buffer:
+        return grammar.parse_nowait(buffer)
+
+
+@pytest.mark.parametrize("max_repeats", [None, 50])
+def test_parse_file_parallel_with_delimiter(lines_file, max_repeats):
+    grammar = Repeat(line, max_repeats=max_repeats, name="lines")
+    parse_tree = parse_file_parallel(
+        grammar, lines_file, delimiter=b"\n", workers=2, chunk_size=100
+    )
+    assert parse_tree == parse_file_sequentially(grammar, lines_file)
+
+
+def test_parse_file_parallel_with_sync_point(lines_file):
+    def after_newline(buffer, loc):
+        return buffer.get_nowait(loc - 1) == b"\n"
+
+    grammar = line[0, ...]
+    parse_tree = parse_file_parallel(
+        grammar, lines_file, sync_point=after_newline, workers=2, chunk_size=100
+    )
+    assert parse_tree == parse_file_sequentially(grammar, lines_file)
+
+
+def test_parse_file_parallel_stops_at_first_failing_repetition(tmp_path):
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"1;\n2;\nx;\n3;\n4;\n")
+    grammar = line[0, ...]
+
+    parse_tree = parse_file_parallel(grammar, path, delimiter=b"\n", chunk_size=2)
+
+    assert parse_tree == parse_file_sequentially(grammar, path)
+    assert parse_tree.values == (b"1", b";\n", b"2", b";\n")
+    with pytest.raises(TrailingBytesError):
+        parse_file_parallel(grammar, path, delimiter=b"\n", parse_all=True)
+
+
+def test_parse_file_parallel_min_repeats(lines_file):
+    with pytest.raises(UnmetExpectationError):
+        parse_file_parallel(
+            line[201, ...], lines_file, delimiter=b"\n", workers=2, chunk_size=100
+        )
+
+
+def test_parse_file_parallel_detects_matches_spanning_sync_points(tmp_path):
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"1;\n2;\n3;\n4;\n")
+    grammar = (line + line)[0, ...]
+
+    with pytest.raises(ValueError):
+        parse_file_parallel(grammar, path, delimiter=b"\n", chunk_size=2)
+
+
+def test_parse_file_parallel_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    parse_tree = parse_file_parallel(line[0, ...], path, delimiter=b"\n")
+    assert parse_tree.values == ()
+
+
+def test_parse_file_parallel_rejects_invalid_arguments(lines_file):
+    with pytest.raises(TypeError):
+        parse_file_parallel(line, lines_file, delimiter=b"\n")
+    with pytest.raises(ValueError):
+        parse_file_parallel(line[0, ...], lines_file)
+    with pytest.raises(ValueError):
+        parse_file_parallel(
+            line[0, ...], lines_file, delimiter=b"\n", sync_point=lambda buf, loc: True
+        )
@@ -1,7 +1,25 @@
+import asyncio
+import io
+from asyncio import StreamReader
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import pytest
 
-from bite.parse_functions import parse_bytes, parse_incremental
-from bite.parsers import Literal, ParsedLiteral, TrailingBytesError
+from bite.io import BufferLimitExceededError, MmapBuffer, StreamStats
+from bite.parse_functions import (
+    parse_bytes,
+    parse_file,
+    parse_file_incremental,
+    parse_incremental,
+    parse_incremental_batches,
+    parse_iter,
+)
+from bite.parsers import (
+    Literal,
+    ParsedLiteral,
+    TrailingBytesError,
+    UnmetExpectationError,
+)
 from bite.tests.mock_reader import MockReader
 
 
@@ -18,6 +36,268 @@ async def test_parse_incremental():
     assert count == 3
 
 
+@pytest.mark.asyncio
+async def test_parse_incremental_max_lookahead():
+    grammar = Literal(b"A", name="A")[1, ...] + Literal(b";")
+    reader = MockReader(b"AA;AAAA;")
+
+    parse_trees = parse_incremental(grammar, reader, max_lookahead=4)
+    assert (await parse_trees.__anext__()).values == (b"A", b"A", b";")
+    with pytest.raises(BufferLimitExceededError):
+        await parse_trees.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_records_stats():
+    grammar = Literal(b"A", name="A")[1, ...] + Literal(b";")
+    reader = StreamReader()
+    stats = StreamStats()
+
+    async def feed():
+        for data in (b"AA", b";A", b"AA;"):
+            reader.feed_data(data)
+            await asyncio.sleep(0.01)
+        reader.feed_eof()
+
+    feed_task = asyncio.create_task(feed())
+    parse_trees = [
+        parse_tree
+        async for parse_tree in parse_incremental(grammar, reader, stats=stats)
+    ]
+    await feed_task
+
+    assert len(parse_trees) == 2
+    assert stats.bytes_read == 7
+    assert stats.messages == 2
+    assert stats.message_bytes == 7
+    assert stats.buffer_high_water_mark <= 4
+    assert stats.io_wait_time > 0.01
+    assert 0 < stats.parse_time < stats.io_wait_time
+    assert stats.max_message_latency > 0.01
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_batches_records_each_message():
+    grammar = Literal(b"A", name="A")
+    stats = StreamStats()
+    batches = [
+        batch
+        async for batch in parse_incremental_batches(
+            grammar, MockReader(b"AAA"), stats=stats
+        )
+    ]
+    assert len(batches) == 1
+    assert stats.messages == 3
+    assert stats.message_bytes == 3
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_offloads_buffered_messages():
+    grammar = Literal(b"A", name="A")[1, ...] + Literal(b";")
+    reader = StreamReader()
+    reader.feed_data(b"AA;AAAA;A;")
+    reader.feed_eof()
+
+    with CountingExecutor() as executor:
+        parse_trees = [
+            parse_tree.values
+            async for parse_tree in parse_incremental(
+                grammar, reader, executor=executor, offload_threshold=3
+            )
+        ]
+
+    assert parse_trees == [
+        (b"A", b"A", b";"),
+        (b"A", b"A", b"A", b"A", b";"),
+        (b"A", b";"),
+    ]
+    assert executor.submitted == 1
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_does_not_offload_small_buffered_messages():
+    grammar = Literal(b"A", name="A")[1, ...] + Literal(b";")
+    reader = StreamReader()
+    reader.feed_data(b"AA;" * 100)
+    reader.feed_eof()
+
+    with CountingExecutor() as executor:
+        count = 0
+        async for _ in parse_incremental(
+            grammar, reader, executor=executor, offload_threshold=3
+        ):
+            count += 1
+
+    assert count == 100
+    assert executor.submitted == 0
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_offloading_respects_max_lookahead():
+    grammar = Literal(b"A", name="A")[1, ...] + Literal(b";")
+    reader = StreamReader()
+    reader.feed_data(b"AAAAAA;")
+    reader.feed_eof()
+
+    with CountingExecutor() as executor:
+        with pytest.raises(BufferLimitExceededError):
+            async for _ in parse_incremental(
+                grammar, reader, executor=executor, offload_threshold=2, max_lookahead=4
+            ):
+                pass
+
+    assert executor.submitted == 1
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_offloading_falls_back_for_partial_messages():
+    grammar = Literal(b"A", name="A")[1, ...] + Literal(b";")
+    reader = StreamReader()
+    reader.feed_data(b"AA;AAA")
+
+    async def feed_rest():
+        await asyncio.sleep(0)
+        reader.feed_data(b"A;")
+        reader.feed_eof()
+
+    with CountingExecutor() as executor:
+        parse_trees = parse_incremental(
+            grammar, reader, executor=executor, offload_threshold=3
+        )
+        assert (await parse_trees.__anext__()).values == (b"A", b"A", b";")
+        feed_task = asyncio.create_task(feed_rest())
+        assert (await parse_trees.__anext__()).values == (b"A",) * 4 + (b";",)
+        await feed_task
+
+    assert executor.submitted == 1
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_offloading_to_process_pool():
+    grammar = Literal(b"A", name="A")[1, ...] + Literal(b";")
+    reader = MockReader(b"AA;AAAA;")
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        parse_trees = [
+            parse_tree.values
+            async for parse_tree in parse_incremental(
+                grammar, reader, executor=executor, offload_threshold=1
+            )
+        ]
+
+    assert parse_trees == [(b"A", b"A", b";"), (b"A", b"A", b"A", b"A", b";")]
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_yields_to_event_loop():
+    grammar = Literal(b"A", name="A")[1, ...] + Literal(b";")
+    reader = MockReader(b"A" * 100 + b";")
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    tick_task = asyncio.create_task(tick())
+    await asyncio.sleep(0)
+    ticks = 0
+    async for parse_tree in parse_incremental(grammar, reader, yield_steps=10):
+        assert parse_tree.end_loc == 101
+    tick_task.cancel()
+
+    assert ticks >= 9
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_batches():
+    grammar = Literal(b"A", name="A")
+    reader = MockReader(b"AAA")
+
+    batches = [batch async for batch in parse_incremental_batches(grammar, reader)]
+
+    assert batches == [
+        [
+            ParsedLiteral("A", b"A", 0, 1),
+            ParsedLiteral("A", b"A", 1, 2),
+            ParsedLiteral("A", b"A", 2, 3),
+        ]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_batches_with_partial_reads():
+    grammar = Literal(b"AB", name="AB")
+    reader = MockReader(b"ABABAB", chunk_size=3)
+
+    batches = [
+        batch
+        async for batch in parse_incremental_batches(grammar, reader, chunk_size=3)
+    ]
+
+    assert [len(batch) for batch in batches] == [1, 2]
+    assert [tree.values for batch in batches for tree in batch] == 3 * [(b"AB",)]
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_batches_limits_lookahead_per_message():
+    grammar = Literal(b"AB", name="AB")
+    reader = MockReader(b"ABABABAB")
+
+    batches = [
+        batch
+        async for batch in parse_incremental_batches(grammar, reader, max_lookahead=4)
+    ]
+
+    assert [len(batch) for batch in batches] == [2, 2]
+    assert [tree.values for batch in batches for tree in batch] == 4 * [(b"AB",)]
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_batches_exceeding_lookahead():
+    grammar = Literal(b"ABC", name="ABC")
+    reader = MockReader(b"ABCABC")
+
+    with pytest.raises(BufferLimitExceededError):
+        async for _ in parse_incremental_batches(grammar, reader, max_lookahead=2):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_parse_incremental_batches_failure():
+    grammar = Literal(b"AB", name="AB")
+    reader = MockReader(b"ABABAX")
+
+    batches = []
+    with pytest.raises(UnmetExpectationError):
+        async for batch in parse_incremental_batches(grammar, reader):
+            batches.append(batch)
+
+    assert [tree.values for batch in batches for tree in batch] == 2 * [(b"AB",)]
+
+
+@pytest.mark.asyncio
+async def test_parse_bytes_yields_to_event_loop():
+    grammar = Literal(b"A", name="A")[1, ...]
+    other_task = asyncio.create_task(asyncio.sleep(0))
+
+    parse_tree = await parse_bytes(grammar, b"A" * 100, yield_steps=10)
+
+    assert other_task.done()
+    assert parse_tree.end_loc == 100
+
+
 @pytest.mark.asyncio
 async def test_parse_bytes():
     grammar = Literal(b"A", name="A")
@@ -37,3 +317,95 @@ async def test_parse_bytes_parse_all_failure():
     grammar = Literal(b"A", name="A")
     with pytest.raises(TrailingBytesError):
         assert await parse_bytes(grammar, b"AA", parse_all=True)
+
+
+@pytest.mark.asyncio
+async def test_parse_file(tmp_path):
+    path = tmp_path / "input"
+    path.write_bytes(b"AAA")
+    grammar = Literal(b"A", name="A")
+    assert await parse_file(grammar, path) == ParsedLiteral("A", b"A", 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_parse_file_parse_all_failure(tmp_path):
+    path = tmp_path / "input"
+    path.write_bytes(b"AA")
+    grammar = Literal(b"A", name="A")
+    with pytest.raises(TrailingBytesError):
+        assert await parse_file(grammar, path, parse_all=True)
+
+
+@pytest.mark.asyncio
+async def test_parse_file_error_message(tmp_path):
+    path = tmp_path / "input"
+    path.write_bytes(b"AB")
+    grammar = Literal(b"A") + Literal(b"A")
+    with pytest.raises(UnmetExpectationError) as excinfo:
+        await parse_file(grammar, path)
+    assert "Input: b'AB'" in str(excinfo.value)
+    assert (excinfo.value.lineno, excinfo.value.colno) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_parse_file_closes_mapping(tmp_path, monkeypatch):
+    closed = []
+    monkeypatch.setattr(MmapBuffer, "close", lambda self: closed.append(self))
+    path = tmp_path / "input"
+    path.write_bytes(b"AB")
+
+    await parse_file(Literal(b"A"), path)
+    with pytest.raises(UnmetExpectationError):
+        await parse_file(Literal(b"B"), path)
+    with pytest.raises(UnmetExpectationError):
+        async for _ in parse_file_incremental(Literal(b"A"), path):
+            pass
+
+    assert len(closed) == 3
+
+
+@pytest.mark.asyncio
+async def test_parse_file_incremental(tmp_path):
+    path = tmp_path / "input"
+    path.write_bytes(b"AAA")
+    grammar = Literal(b"A", name="A")
+
+    count = 0
+    async for parse_tree in parse_file_incremental(grammar, path):
+        assert parse_tree == ParsedLiteral("A", b"A", 0, 1)
+        count += 1
+
+    assert count == 3
+
+
+@pytest.mark.asyncio
+async def test_parse_file_incremental_empty_file(tmp_path):
+    path = tmp_path / "input"
+    path.write_bytes(b"")
+    async for _ in parse_file_incremental(Literal(b"A"), path):
+        raise AssertionError("no parse tree expected")
+
+
+def test_parse_iter():
+    grammar = Literal(b"AB", name="AB")
+    chunks = [b"A", b"BA", b"BAB"]
+    assert list(parse_iter(grammar, chunks)) == 3 * [ParsedLiteral("AB", b"AB", 0, 2)]
+
+
+def test_parse_iter_file_like():
+    grammar = Literal(b"AB", name="AB")
+    source = io.BufferedReader(io.BytesIO(b"ABABAB"))
+    assert list(parse_iter(grammar, source, chunk_size=3)) == 3 * [
+        ParsedLiteral("AB", b"AB", 0, 2)
+    ]
+
+
+@pytest.mark.parametrize("chunks", [[], [b""], [b"", b""]])
+def test_parse_iter_empty_input(chunks):
+    assert list(parse_iter(Literal(b"AB"), chunks)) == []
+
+
+def test_parse_iter_failure():
+    grammar = Literal(b"AB", name="AB")
+    with pytest.raises(UnmetExpectationError):
+        list(parse_iter(grammar, [b"ABA"]))
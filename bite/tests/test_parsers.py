@@ -1,17 +1,32 @@
+import pickle
+import re
+from asyncio import StreamReader
+
 import pytest
 
-from bite.io import BytesBuffer, ParserBuffer
+from bite.io import (
+    BytesBuffer,
+    FeedBuffer,
+    MmapBuffer,
+    ParserBuffer,
+    StreamReaderBuffer,
+    WouldBlock,
+)
+from bite.parse_functions import parse_iter
 from bite.parsers import (
     And,
     CaselessLiteral,
     CharacterSet,
     Combine,
     Counted,
+    DelimitedList,
     FixedByteCount,
     Forward,
+    Integer,
     Literal,
     MatchFirst,
     Not,
+    Number,
     OneOrMore,
     Opt,
     ParsedAnd,
@@ -25,13 +40,18 @@ from bite.parsers import (
     ParsedNode,
     ParsedOneOrMore,
     ParsedOpt,
+    ParsedRegex,
     ParsedRepeat,
     ParsedZeroOrMore,
     Parser,
+    QuotedString,
+    Regex,
     Repeat,
+    SkipTo,
     UnmetExpectationError,
     ZeroOrMore,
 )
+from bite.tests.mock_reader import MockReader
 from bite.transformers import ParsedTransform, Suppress
 
 
@@ -67,6 +87,70 @@ from bite.transformers import ParsedTransform, Suppress
             FixedByteCount(4, name="fixed length"),
             ParsedFixedByteCount("fixed length", b"0123", 4, 8),
         ),
+        # Regex
+        (
+            b"ab12;",
+            Regex(rb"[a-z]+([0-9]+)", name="regex"),
+            ParsedRegex("regex", b"ab12", 4, 8, (b"12",)),
+        ),
+        (
+            b"AB12",
+            Regex(rb"[a-z]+([0-9]+)", re.IGNORECASE, name="regex"),
+            ParsedRegex("regex", b"AB12", 4, 8, (b"12",)),
+        ),
+        # Integer and Number
+        (b"4711 ", Integer(name="int"), ParsedLeaf("int", 4711, 4, 8)),
+        (b"+12", Integer(signed=True, name="int"), ParsedLeaf("int", 12, 4, 7)),
+        (b"-12", Integer(signed=True, name="int"), ParsedLeaf("int", -12, 4, 7)),
+        (b"fF", Integer(16, name="int"), ParsedLeaf("int", 255, 4, 6)),
+        (b"0178", Integer(8, name="int"), ParsedLeaf("int", 0o17, 4, 7)),
+        (b"1012", Integer(2, name="int"), ParsedLeaf("int", 5, 4, 7)),
+        (b"20240101", Integer(max_digits=4, name="int"), ParsedLeaf("int", 2024, 4, 8)),
+        (b"42", Number(name="num"), ParsedLeaf("num", 42, 4, 6)),
+        (b"-1.5e2", Number(signed=True, name="num"), ParsedLeaf("num", -150.0, 4, 10)),
+        (b"1.", Number(name="num"), ParsedLeaf("num", 1.0, 4, 6)),
+        (b".5x", Number(name="num"), ParsedLeaf("num", 0.5, 4, 6)),
+        (b"2e", Number(name="num"), ParsedLeaf("num", 2, 4, 5)),
+        (b"12345", Number(max_length=3, name="num"), ParsedLeaf("num", 123, 4, 7)),
+        # QuotedString
+        (b'"abc" ', QuotedString(name="str"), ParsedLeaf("str", b"abc", 4, 9)),
+        (b'""', QuotedString(name="str"), ParsedLeaf("str", b"", 4, 6)),
+        (
+            b'"a\\"b\\\\" "',
+            QuotedString(name="str"),
+            ParsedLeaf("str", b'a"b\\', 4, 12),
+        ),
+        (
+            b'"a\\tb\\x"',
+            QuotedString(escape_map={b"t": b"\t"}, name="str"),
+            ParsedLeaf("str", b"a\tbx", 4, 12),
+        ),
+        (
+            b"'a''''b''c'",
+            QuotedString(b"'", b"'", name="str"),
+            ParsedLeaf("str", b"a''b'c", 4, 15),
+        ),
+        (
+            b"'a\\'",
+            QuotedString(b"'", None, name="str"),
+            ParsedLeaf("str", b"a\\", 4, 8),
+        ),
+        # SkipTo
+        (
+            b"ab\r\ncd\r\n",
+            SkipTo(b"\r\n", name="skip"),
+            ParsedLeaf("skip", b"ab", 4, 6),
+        ),
+        (
+            b"\r\n",
+            SkipTo(b"\r\n", name="skip"),
+            ParsedLeaf("skip", b"", 4, 4),
+        ),
+        (
+            b"ab12",
+            SkipTo(CharacterSet(b"0123456789"), name="skip"),
+            ParsedLeaf("skip", b"ab", 4, 6),
+        ),
         # MatchFirst
         (
             b"A foo",
@@ -317,6 +401,12 @@ from bite.transformers import ParsedTransform, Suppress
 async def test_successful_parsing(input_buf, grammar, expected):
     buffer = BytesBuffer(b"foo " + input_buf)
     assert await grammar.parse(buffer, 4) == expected
+    assert grammar.parse_nowait(buffer, 4) == expected
+
+    trickling_buffer = StreamReaderBuffer(
+        MockReader(b"foo " + input_buf, chunk_size=1), chunk_size=1
+    )
+    assert await grammar.parse(trickling_buffer, 4) == expected
 
 
 @pytest.mark.asyncio
@@ -372,6 +462,24 @@ async def test_unsuccessful_counted_parsing(input_buf, at_loc):
         (b"A", CharacterSet(b"0123456789")),
         (b"0", CharacterSet(b"0123456789", invert=True)),
         (b"0123", FixedByteCount(6)),
+        (b"12", Regex(rb"[a-z]+")),
+        (b"abc", SkipTo(b"\r\n")),
+        (b"abc", QuotedString()),
+        (b'"abc', QuotedString()),
+        (b'"abc\\"', QuotedString()),
+        (b'"abc\\', QuotedString()),
+        (b"x1", Integer()),
+        (b"-1", Integer()),
+        (b"12", Integer(min_digits=3)),
+        (b"12", Integer(min_value=13)),
+        (b"12", Integer(max_value=11)),
+        (b"g", Integer(16)),
+        (b".", Number()),
+        (b"-1", Number()),
+        (b"1.5", Number(max_value=1)),
+        (b"abc\r\n", SkipTo(b"\r\n", max_length=2)),
+        (b"abc", SkipTo(CharacterSet(b"0123456789"))),
+        (b"abc1", SkipTo(CharacterSet(b"0123456789"), max_length=2)),
         (b"A", Not(Literal(b"A"))),
     ],
 )
@@ -415,6 +523,19 @@ async def test_parsing_failure_repeat():
     assert excinfo.value.at_loc == 1
 
 
+@pytest.mark.asyncio
+async def test_unbounded_repeat_rejects_non_consuming_matches():
+    grammar = Repeat(Opt(Literal(b"A")), min_repeats=0, max_repeats=None)
+
+    with pytest.raises(ValueError):
+        await grammar.parse(BytesBuffer(b"AAb"))
+    with pytest.raises(ValueError):
+        grammar.parse_nowait(BytesBuffer(b"AAb"))
+
+    bounded = Repeat(Opt(Literal(b"A")), min_repeats=0, max_repeats=3)
+    assert (await bounded.parse(BytesBuffer(b"b"))).end_loc == 0
+
+
 @pytest.mark.asyncio
 async def test_parsing_failure_one_or_more():
     grammar = OneOrMore(Literal(b"A"))
@@ -575,3 +696,360 @@ Input: b'01234567890abcdef'
                      ^ location of error
 """
     )
+
+
+@pytest.mark.asyncio
+async def test_parse_nowait_raises_would_block_if_input_is_not_buffered():
+    grammar = Literal(b"A") + Literal(b"B")
+    buffer = StreamReaderBuffer(MockReader(b"AB", chunk_size=1), chunk_size=1)
+    await buffer.get(0)
+
+    with pytest.raises(WouldBlock):
+        grammar.parse_nowait(buffer)
+    assert await grammar.parse(buffer) == await grammar.parse(BytesBuffer(b"AB"))
+
+
+class AsyncOnlyParser(Parser[bytes, bytes]):
+    def __init__(self, inner: Parser[bytes, bytes]):
+        super().__init__("AsyncOnlyParser")
+        self.inner = inner
+
+    async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedNode[bytes, bytes]:
+        return await self.inner.parse(buf, loc)
+
+
+def test_default_parse_nowait_completes_without_suspension():
+    grammar = AsyncOnlyParser(Literal(b"A"))
+    assert grammar.parse_nowait(BytesBuffer(b"A")).values == (b"A",)
+    with pytest.raises(UnmetExpectationError):
+        grammar.parse_nowait(BytesBuffer(b"B"))
+
+
+@pytest.mark.asyncio
+async def test_default_parse_nowait_raises_would_block_on_suspension():
+    grammar = AsyncOnlyParser(Literal(b"AB"))
+    reader = StreamReader()
+    reader.feed_data(b"A")
+    buffer = StreamReaderBuffer(reader)
+
+    with pytest.raises(WouldBlock):
+        grammar.parse_nowait(buffer)
+
+    reader.feed_data(b"B")
+    reader.feed_eof()
+    assert (await grammar.parse(buffer)).values == (b"AB",)
+
+
+def test_unmet_expectation_error_captures_window_of_input():
+    buf = BytesBuffer(100 * b"a" + b"\r\nX" + 100 * b"b")
+    err = UnmetExpectationError(Literal(b"Y", name="Y"), 102, buf)
+
+    assert err.context == 30 * b"a" + b"\r\nX" + 31 * b"b"
+    assert (
+        str(err)
+        == f"""expected Y at position 102
+
+Input: ...b'{30 * "a"}\\r\\nX{31 * "b"}'...
+{(7 + 3 + 2 + 30 + 4) * " "}^ location of error
+"""
+    )
+
+
+def test_unmet_expectation_error_caret_with_differently_quoted_prefix():
+    err = UnmetExpectationError(Literal(b"Y", name="Y"), 3, BytesBuffer(b"a'bX'\"'"))
+    assert str(err) == (
+        "expected Y at position 3\n\n"
+        + "Input: b'a\\'bX\\'\"\\''\n"
+        + "             ^ location of error\n"
+    )
+
+
+def test_unmet_expectation_error_line_and_column():
+    buf = BytesBuffer(b"ab\ncd\nef")
+    err = UnmetExpectationError(Literal(b"Y"), 7, buf)
+    assert err.lineno == 3
+    assert err.colno == 2
+
+    err = UnmetExpectationError(Literal(b"Y"), 1, buf)
+    assert err.lineno == 1
+    assert err.colno == 2
+
+    err = UnmetExpectationError(Literal(b"Y"), 4, buf)
+    assert err.lineno == 2
+    assert err.colno == 2
+
+
+def test_unmet_expectation_error_line_and_column_after_dropped_prefix(tmp_path):
+    path = tmp_path / "input"
+    path.write_bytes(b"ab\ncd\nef")
+    with MmapBuffer(path) as buf:
+        err = UnmetExpectationError(Literal(b"Y"), 7, buf)
+        assert (err.lineno, err.colno) == (3, 2)
+        buf.drop_prefix(3)
+        err = UnmetExpectationError(Literal(b"Y"), 4, buf)
+        assert (err.lineno, err.colno) == (2, 2)
+    assert str(err).startswith("expected b'Y' at position 4")
+
+
+def test_regex_groups():
+    grammar = Regex(rb"(?P<key>[a-z]+)=(?P<value>[0-9]+)?(;)?")
+    parse_tree = grammar.parse_nowait(BytesBuffer(b"x key=;"), 2)
+    assert parse_tree.values == (b"key=;",)
+    assert (parse_tree.start_loc, parse_tree.end_loc) == (2, 7)
+    assert parse_tree.group() == b"key=;"
+    assert parse_tree.group(1) == b"key"
+    assert parse_tree.group("value") is None
+    assert parse_tree.group(3) == b";"
+    assert parse_tree.groupdict() == {"key": b"key", "value": None}
+    with pytest.raises(IndexError):
+        parse_tree.group(4)
+    with pytest.raises(IndexError):
+        parse_tree.group("missing")
+
+
+def test_regex_accepts_compiled_pattern():
+    pattern = re.compile(rb"a+", re.IGNORECASE)
+    assert Regex(pattern).parse_nowait(BytesBuffer(b"aAb")).values == (b"aA",)
+    with pytest.raises(ValueError):
+        Regex(pattern, re.IGNORECASE)
+
+
+@pytest.mark.asyncio
+async def test_regex_waits_for_match_to_complete():
+    grammar = Regex(rb"[0-9]+")
+    reader = StreamReader()
+    reader.feed_data(b"12")
+    buffer = StreamReaderBuffer(reader)
+    await buffer.get(0)
+
+    with pytest.raises(WouldBlock):
+        grammar.parse_nowait(buffer)
+
+    reader.feed_data(b"34")
+    reader.feed_eof()
+    assert (await grammar.parse(buffer)).values == (b"1234",)
+
+
+@pytest.mark.asyncio
+async def test_regex_fails_without_waiting_if_buffered_bytes_cannot_match():
+    grammar = MatchFirst([Regex(rb"[0-9]+;"), Literal(b"x;")])
+    reader = StreamReader()
+    reader.feed_data(b"x;zzzz")
+    buffer = StreamReaderBuffer(reader)
+    await buffer.get(0)
+
+    assert grammar.parse_nowait(buffer).values == (b"x;",)
+    with pytest.raises(UnmetExpectationError):
+        Regex(rb"[0-9]+;").parse_nowait(buffer)
+
+
+@pytest.mark.asyncio
+async def test_regex_waits_if_lookahead_could_match_later():
+    grammar = Regex(rb"a(?=b)")
+    reader = StreamReader()
+    reader.feed_data(b"a")
+    buffer = StreamReaderBuffer(reader)
+    await buffer.get(0)
+
+    with pytest.raises(WouldBlock):
+        grammar.parse_nowait(buffer)
+
+    reader.feed_data(b"b")
+    reader.feed_eof()
+    assert (await grammar.parse(buffer)).values == (b"a",)
+
+
+@pytest.mark.parametrize(
+    "chunks", [[b"1e5;"], [b"1e", b"5;"], [b"1", b"e", b"5", b";"], [b"1e5", b";"]]
+)
+def test_regex_result_does_not_depend_on_chunking(chunks):
+    grammar = Regex(rb"[0-9]+(?:e[0-9]+)?") + Literal(b";")
+    assert [parsed.values for parsed in parse_iter(grammar, chunks)] == [(b"1e5", b";")]
+
+
+@pytest.mark.parametrize("chunks", [[b"1;"], [b"1", b";"]])
+def test_regex_accepts_match_without_optional_part_under_any_chunking(chunks):
+    grammar = Regex(rb"[0-9]+(?:e[0-9]+)?") + Literal(b";")
+    assert [parsed.values for parsed in parse_iter(grammar, chunks)] == [(b"1", b";")]
+
+
+def test_regex_accepts_match_ending_at_end_of_buffered_bytes_if_final():
+    grammar = Regex(rb"\* OK [^\r\n]*\r\n")
+    buffer = FeedBuffer()
+    buffer.feed(b"* OK ready\r\n")
+    assert grammar.parse_nowait(buffer).values == (b"* OK ready\r\n",)
+
+
+def test_regex_waits_if_more_bytes_could_extend_match_before_buffered_end():
+    grammar = Regex(rb"[0-9]+(?:e[0-9]+)?")
+    buffer = FeedBuffer()
+    buffer.feed(b"1e")
+    with pytest.raises(WouldBlock):
+        grammar.parse_nowait(buffer)
+    buffer.feed(b"5")
+    buffer.feed(b";")
+    assert grammar.parse_nowait(buffer).values == (b"1e5",)
+
+
+def test_regex_max_length_bounds_match():
+    grammar = Regex(rb"[0-9]+", max_length=3)
+    buffer = FeedBuffer()
+    buffer.feed(b"12345")
+    assert grammar.parse_nowait(buffer).values == (b"123",)
+
+
+@pytest.mark.asyncio
+async def test_skip_to_waits_for_target_split_across_reads():
+    grammar = SkipTo(b"\r\n", max_length=8)
+    reader = StreamReader()
+    reader.feed_data(b"abc\r")
+    buffer = StreamReaderBuffer(reader)
+    await buffer.get(0)
+
+    with pytest.raises(WouldBlock):
+        grammar.parse_nowait(buffer)
+
+    reader.feed_data(b"\ndef")
+    assert (await grammar.parse(buffer)).values == (b"abc",)
+
+
+def test_skip_to_max_length_allows_target_at_limit():
+    grammar = SkipTo(b"\r\n", max_length=3)
+    buffer = FeedBuffer()
+    buffer.feed(b"abc\r\n")
+    assert grammar.parse_nowait(buffer).values == (b"abc",)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "input_buf,grammar,expected_values,end_loc",
+    [
+        (b"1,2,3", DelimitedList(CharacterSet(b"0123456789")), (b"1", b"2", b"3"), 5),
+        (b"1,2,", DelimitedList(CharacterSet(b"0123456789")), (b"1", b"2"), 3),
+        (b"1, 2", DelimitedList(CharacterSet(b"0123456789")), (b"1",), 1),
+        (
+            b"1, 2",
+            DelimitedList(CharacterSet(b"0123456789"), Literal(b",") + Literal(b" ")),
+            (b"1", b"2"),
+            4,
+        ),
+        (
+            b"1,2",
+            DelimitedList(CharacterSet(b"0123456789"), keep_separators=True),
+            (b"1", b",", b"2"),
+            3,
+        ),
+        (b"x", DelimitedList(CharacterSet(b"0123456789"), min_items=0), (), 0),
+        (
+            b"1;2;3",
+            DelimitedList(CharacterSet(b"0123456789"), b";", max_items=2),
+            (b"1", b"2"),
+            3,
+        ),
+    ],
+)
+async def test_delimited_list(input_buf, grammar, expected_values, end_loc):
+    buffer = BytesBuffer(input_buf)
+    parse_tree = await grammar.parse(buffer)
+    assert parse_tree.values == expected_values
+    assert parse_tree.end_loc == end_loc
+    assert grammar.parse_nowait(buffer) == parse_tree
+
+    trickling_buffer = StreamReaderBuffer(
+        MockReader(input_buf, chunk_size=1), chunk_size=1
+    )
+    assert await grammar.parse(trickling_buffer) == parse_tree
+
+
+@pytest.mark.asyncio
+async def test_delimited_list_failure():
+    grammar = DelimitedList(CharacterSet(b"0123456789"), min_items=3)
+    with pytest.raises(UnmetExpectationError) as excinfo:
+        await grammar.parse(BytesBuffer(b"1,2;3"))
+    assert excinfo.value.expected == grammar.separator
+    assert excinfo.value.at_loc == 3
+
+    with pytest.raises(UnmetExpectationError) as excinfo:
+        grammar.parse_nowait(BytesBuffer(b"1,2,x"))
+    assert excinfo.value.expected == grammar.item
+    assert excinfo.value.at_loc == 4
+
+
+def test_delimited_list_rejects_non_consuming_matches():
+    grammar = DelimitedList(Opt(Literal(b"a")), Opt(Literal(b",")))
+    with pytest.raises(ValueError):
+        grammar.parse_nowait(BytesBuffer(b"a,b"))
+
+
+def test_numeric_parsers_do_not_wait_for_eof_once_result_is_final():
+    buffer = FeedBuffer()
+    buffer.feed(b"NIL 1.5e")
+    grammar = Integer() | Literal(b"NIL")
+    assert grammar.parse_nowait(buffer).values == (b"NIL",)
+    with pytest.raises(WouldBlock):
+        Number().parse_nowait(buffer, 4)
+    buffer.feed(b"2 ")
+    assert Number().parse_nowait(buffer, 4).values == (150.0,)
+
+    buffer = FeedBuffer()
+    buffer.feed(b"12")
+    with pytest.raises(WouldBlock):
+        Integer(min_digits=3).parse_nowait(buffer)
+    buffer.feed(b"x")
+    with pytest.raises(UnmetExpectationError):
+        Integer(min_digits=3).parse_nowait(buffer)
+
+
+def test_quoted_string_rejects_multi_byte_quotes():
+    with pytest.raises(ValueError):
+        QuotedString(b"''")
+    with pytest.raises(ValueError):
+        QuotedString(escape=b"")
+
+
+@pytest.mark.asyncio
+async def test_quoted_string_waits_for_closing_quote():
+    grammar = QuotedString()
+    reader = StreamReader()
+    reader.feed_data(b'"ab\\')
+    buffer = StreamReaderBuffer(reader)
+    await buffer.get(0)
+
+    with pytest.raises(WouldBlock):
+        grammar.parse_nowait(buffer)
+
+    reader.feed_data(b'"c" ')
+    assert (await grammar.parse(buffer)).values == (b'ab"c',)
+
+
+def test_integer_rejects_unsupported_base():
+    with pytest.raises(ValueError):
+        Integer(36)
+
+
+def test_number_converts_to_int_or_float():
+    assert type(Number().parse_nowait(BytesBuffer(b"10")).parse_tree) is int
+    assert type(Number().parse_nowait(BytesBuffer(b"1e1")).parse_tree) is float
+
+
+def test_parse_tree_pickling():
+    grammar = (
+        Opt(Literal(b"A"))
+        + Not(Literal(b"B"))
+        + CharacterSet(b"0123456789")
+        + Regex(rb"(?P<letter>[a-z])")
+    )
+    parse_tree = grammar.parse_nowait(BytesBuffer(b"A1x"))
+    assert pickle.loads(pickle.dumps(parse_tree)) == parse_tree
+
+
+def test_unmet_expectation_error_pickling():
+    with pytest.raises(UnmetExpectationError) as exc_info:
+        Literal(b"B").parse_nowait(BytesBuffer(b"A\nAA"), 3)
+
+    err = pickle.loads(pickle.dumps(exc_info.value))
+
+    assert err.expected == "b'B'"
+    assert err.at_loc == 3
+    assert (err.lineno, err.colno) == (2, 2)
+    assert str(err) == str(exc_info.value)
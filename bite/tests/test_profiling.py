@@ -0,0 +1,116 @@
+import asyncio
+from asyncio import StreamReader
+
+import pytest
+
+import bite.profiling
+from bite.parse_functions import parse_bytes, parse_incremental
+from bite.parsers import CharacterSet, Combine, Literal, UnmetExpectationError
+from bite.profiling import Profiler
+from bite.tests.mock_reader import MockReader
+
+digit = CharacterSet(b"0123456789", name="digit")
+integer = Combine(digit[1, ...], name="integer")
+grammar = integer + Literal(b";", name="semicolon")
+
+
+def stats_by_name(profiler):
+    return {stats.name: stats for stats in profiler.stats()}
+
+
+def test_profiler_counts_calls_and_bytes():
+    with Profiler(grammar) as profiler:
+        asyncio.run(parse_bytes(grammar, b"123;"))
+
+    stats = stats_by_name(profiler)
+    assert (stats["digit"].calls, stats["digit"].failures) == (4, 1)
+    assert stats["digit"].bytes_consumed == 3
+    assert (stats["integer"].calls, stats["integer"].successes) == (1, 1)
+    assert stats["semicolon"].bytes_consumed == 1
+    assert stats[grammar.name].bytes_consumed == 4
+
+
+def test_profiler_counts_failures():
+    with Profiler(grammar) as profiler:
+        with pytest.raises(UnmetExpectationError):
+            asyncio.run(parse_bytes(grammar, b"12:"))
+
+    stats = stats_by_name(profiler)
+    assert (stats["semicolon"].calls, stats["semicolon"].failures) == (1, 1)
+    assert stats[grammar.name].failures == 1
+
+
+def test_profiler_times_are_consistent():
+    with Profiler(grammar) as profiler:
+        asyncio.run(parse_bytes(grammar, b"1234567890;"))
+
+    stats = stats_by_name(profiler)
+    total = stats[grammar.name].inclusive_time
+    assert total > 0
+    assert sum(s.exclusive_time for s in profiler.stats()) == pytest.approx(total)
+    for s in profiler.stats():
+        assert 0 <= s.exclusive_time <= s.inclusive_time
+
+
+def test_profiler_counts_suspended_parses_once():
+    async def parse_trickled():
+        reader = StreamReader()
+
+        async def feed():
+            for byte in b"12;34;":
+                reader.feed_data(bytes([byte]))
+                await asyncio.sleep(0)
+            reader.feed_eof()
+
+        feed_task = asyncio.create_task(feed())
+        values = [parsed.values async for parsed in parse_incremental(grammar, reader)]
+        await feed_task
+        return values
+
+    with Profiler(grammar) as profiler:
+        assert asyncio.run(parse_trickled()) == [(b"12", b";"), (b"34", b";")]
+
+    stats = stats_by_name(profiler)
+    assert stats[grammar.name].calls == 2
+    assert stats["integer"].calls == 2
+
+
+def test_profiler_times_only_completed_parses_of_chunked_stream(monkeypatch):
+    recorded = {}
+
+    def record_time(stats, start, frame, parent):
+        recorded[stats.name] = recorded.get(stats.name, 0) + 1
+        record_time_unpatched(stats, start, frame, parent)
+
+    record_time_unpatched = bite.profiling._record_time
+    monkeypatch.setattr(bite.profiling, "_record_time", record_time)
+
+    async def parse_chunked():
+        reader = MockReader(b"123;45;", chunk_size=2)
+        return [parsed.values async for parsed in parse_incremental(grammar, reader)]
+
+    with Profiler(grammar) as profiler:
+        assert asyncio.run(parse_chunked()) == [(b"123", b";"), (b"45", b";")]
+
+    stats = stats_by_name(profiler)
+    assert stats[grammar.name].calls == 2
+    assert recorded == {s.name: s.calls for s in profiler.stats()}
+
+
+def test_profiler_reset():
+    profiler = Profiler(grammar)
+    with profiler:
+        asyncio.run(parse_bytes(grammar, b"1;"))
+        profiler.reset()
+        asyncio.run(parse_bytes(grammar, b"2;"))
+    assert stats_by_name(profiler)[grammar.name].calls == 1
+
+
+def test_profiler_report():
+    with Profiler(grammar) as profiler:
+        asyncio.run(parse_bytes(grammar, b"1;"))
+
+    lines = profiler.report(sort_by="calls", limit=2).splitlines()
+    assert len(lines) == 3
+    assert lines[0].split()[:4] == ["name", "calls", "success", "failure"]
+    assert lines[1].split()[:4] == ["digit", "2", "1", "1"]
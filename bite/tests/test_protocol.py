@@ -0,0 +1,117 @@
+import asyncio
+import socket
+from unittest.mock import MagicMock
+
+import pytest
+
+from bite.io import ParserBuffer
+from bite.parsers import (
+    CharacterSet,
+    Literal,
+    ParsedNode,
+    Parser,
+    UnmetExpectationError,
+)
+from bite.protocol import ParserProtocol
+
+grammar = CharacterSet(b"0123456789")[1, ...] + Literal(b";")
+
+
+def feed(protocol: ParserProtocol, data: bytes):
+    memory = protocol.get_buffer(len(data))
+    memory[: len(data)] = data
+    del memory
+    protocol.buffer_updated(len(data))
+
+
+def test_parser_protocol_delivers_messages():
+    messages = []
+    protocol = ParserProtocol(grammar, messages.append)
+    protocol.connection_made(MagicMock())
+
+    feed(protocol, b"12;3")
+    assert [message.values for message in messages] == [(b"1", b"2", b";")]
+
+    feed(protocol, b"4")
+    feed(protocol, b"5;67;")
+    assert [message.values for message in messages] == [
+        (b"1", b"2", b";"),
+        (b"3", b"4", b"5", b";"),
+        (b"6", b"7", b";"),
+    ]
+    assert messages[1].start_loc == 0
+    assert messages[1].end_loc == 4
+
+    protocol.eof_received()
+    assert len(messages) == 3
+
+
+def test_parser_protocol_message_received_can_be_overridden():
+    class CollectingProtocol(ParserProtocol):
+        def __init__(self):
+            super().__init__(grammar)
+            self.messages = []
+
+        def message_received(self, parse_tree):
+            self.messages.append(parse_tree.values)
+
+    protocol = CollectingProtocol()
+    feed(protocol, b"1;2;")
+    assert protocol.messages == [(b"1", b";"), (b"2", b";")]
+
+
+def test_parser_protocol_closes_transport_on_parse_error():
+    messages = []
+    transport = MagicMock()
+    protocol = ParserProtocol(grammar, messages.append)
+    protocol.connection_made(transport)
+
+    feed(protocol, b"1;x;2;")
+
+    assert len(messages) == 1
+    transport.close.assert_called_once()
+
+
+def test_parser_protocol_reports_incomplete_message_at_eof():
+    class FailingProtocol(ParserProtocol):
+        def parse_failed(self, exc):
+            self.exc = exc
+
+    protocol = FailingProtocol(grammar)
+    feed(protocol, b"1;2")
+    protocol.eof_received()
+
+    assert isinstance(protocol.exc, UnmetExpectationError)
+
+
+class SleepingParser(Parser[bytes, bytes]):
+    def __init__(self, inner: Parser[bytes, bytes]):
+        super().__init__("SleepingParser")
+        self.inner = inner
+
+    async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedNode[bytes, bytes]:
+        await asyncio.sleep(0)
+        return await self.inner.parse(buf, loc)
+
+
+def test_parser_protocol_rejects_parsers_awaiting_other_things():
+    protocol = ParserProtocol(SleepingParser(Literal(b"A")))
+    with pytest.raises(RuntimeError):
+        feed(protocol, b"A")
+
+
+@pytest.mark.asyncio
+async def test_parser_protocol_with_transport():
+    queue: asyncio.Queue = asyncio.Queue()
+    local_socket, remote_socket = socket.socketpair()
+    transport, _ = await asyncio.get_running_loop().create_connection(
+        lambda: ParserProtocol(grammar, queue.put_nowait), sock=local_socket
+    )
+    try:
+        remote_socket.sendall(b"12;34")
+        assert (await queue.get()).values == (b"1", b"2", b";")
+        remote_socket.sendall(b";")
+        assert (await queue.get()).values == (b"3", b"4", b";")
+    finally:
+        remote_socket.close()
+        transport.close()
@@ -0,0 +1,121 @@
+import time
+
+import pytest
+
+from bite.io import ParserBuffer
+from bite.parsers import (
+    CharacterSet,
+    Literal,
+    ParsedNode,
+    Parser,
+    SkipTo,
+    UnmetExpectationError,
+)
+from bite.push import PushParser
+
+grammar = CharacterSet(b"0123456789")[1, ...] + Literal(b";")
+
+
+class CountingParser(Parser[bytes, bytes]):
+    def __init__(self, inner: Parser[bytes, bytes]):
+        super().__init__("CountingParser")
+        self.inner = inner
+        self.count = 0
+
+    async def parse(self, buf: ParserBuffer, loc: int = 0) -> ParsedNode[bytes, bytes]:
+        self.count += 1
+        return await self.inner.parse(buf, loc)
+
+    def parse_nowait(self, buf: ParserBuffer, loc: int = 0) -> ParsedNode[bytes, bytes]:
+        self.count += 1
+        return self.inner.parse_nowait(buf, loc)
+
+
+def test_push_parser_yields_complete_messages():
+    parser = PushParser(grammar)
+
+    parser.feed(b"12;3")
+    assert [message.values for message in parser.messages()] == [(b"1", b"2", b";")]
+
+    parser.feed(b"4")
+    assert list(parser.messages()) == []
+
+    parser.feed(b"5;67;")
+    messages = list(parser.messages())
+    assert [message.values for message in messages] == [
+        (b"3", b"4", b"5", b";"),
+        (b"6", b"7", b";"),
+    ]
+    assert (messages[0].start_loc, messages[0].end_loc) == (0, 4)
+
+    parser.feed_eof()
+    assert list(parser.messages()) == []
+
+
+def test_push_parser_get_buffer():
+    parser = PushParser(grammar)
+    memory = parser.get_buffer(4)
+    memory[:4] = b"12;3"
+    del memory
+    parser.buffer_updated(4)
+    assert [message.values for message in parser.messages()] == [(b"1", b"2", b";")]
+
+
+def test_push_parser_does_not_rescan_partial_messages():
+    digit = CountingParser(CharacterSet(b"0123456789"))
+    parser = PushParser(digit[1, ...] + Literal(b";"))
+
+    for _ in range(100):
+        parser.feed(b"1")
+        assert list(parser.messages()) == []
+    parser.feed(b";")
+
+    assert len(list(parser.messages())) == 1
+    # Each digit may be attempted synchronously first and then asynchronously,
+    # but re-scanning the message on every feed would be quadratic.
+    assert digit.count < 3 * 101
+
+
+def test_push_parser_raises_parse_error():
+    parser = PushParser(grammar)
+    parser.feed(b"1;x;")
+    messages = parser.messages()
+    assert next(messages).values == (b"1", b";")
+    with pytest.raises(UnmetExpectationError):
+        next(messages)
+
+
+def test_push_parser_raises_parse_error_for_incomplete_message_at_eof():
+    parser = PushParser(grammar)
+    parser.feed(b"1;2")
+    assert len(list(parser.messages())) == 1
+    parser.feed_eof()
+    with pytest.raises(UnmetExpectationError):
+        list(parser.messages())
+
+
+def test_push_parser_close_restarts_partial_message():
+    parser = PushParser(grammar)
+    parser.feed(b"12")
+    assert list(parser.messages()) == []
+    parser.close()
+    parser.feed(b";")
+    assert [message.values for message in parser.messages()] == [(b"1", b"2", b";")]
+
+
+def test_push_parser_scales_linearly_with_message_size():
+    def feed_time(size: int) -> float:
+        piece = b"x" * 2**12
+        best = float("inf")
+        for _ in range(3):
+            parser = PushParser(SkipTo(b"\n") + Literal(b"\n"))
+            start = time.perf_counter()
+            for _ in range(size // len(piece)):
+                parser.feed(piece)
+                assert list(parser.messages()) == []
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    # An eight times larger message takes about 8 to 20 times longer
+    # depending on caches, whereas quadratic growth gives a ratio above 100.
+    assert feed_time(3 * 2**21) / feed_time(3 * 2**18) < 40
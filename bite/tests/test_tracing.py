@@ -0,0 +1,108 @@
+import asyncio
+from asyncio import StreamReader
+
+import pytest
+
+from bite.instrumentation import iter_parsers
+from bite.parse_functions import parse_bytes, parse_incremental
+from bite.parsers import (
+    CharacterSet,
+    Literal,
+    MatchFirst,
+    Parser,
+    UnmetExpectationError,
+)
+from bite.tracing import ENTER, FAIL, SUCCESS, RingBufferListener, Tracer
+
+a = Literal(b"a", name="a")
+b = Literal(b"b", name="b")
+grammar: Parser = MatchFirst([a + a, a + b], name="grammar")
+
+
+def summarize(events):
+    return [(event.kind, event.parser.name, event.loc, event.depth) for event in events]
+
+
+def test_tracer_emits_events():
+    events = []
+    with Tracer(grammar, events.append):
+        asyncio.run(parse_bytes(grammar, b"ab"))
+
+    assert summarize(events) == [
+        (ENTER, "grammar", 0, 0),
+        (ENTER, (a + a).name, 0, 1),
+        (ENTER, "a", 0, 2),
+        (SUCCESS, "a", 0, 2),
+        (ENTER, "a", 1, 2),
+        (FAIL, "a", 1, 2),
+        (FAIL, (a + a).name, 0, 1),
+        (ENTER, (a + b).name, 0, 1),
+        (ENTER, "a", 0, 2),
+        (SUCCESS, "a", 0, 2),
+        (ENTER, "b", 1, 2),
+        (SUCCESS, "b", 1, 2),
+        (SUCCESS, (a + b).name, 0, 1),
+        (SUCCESS, "grammar", 0, 0),
+    ]
+    assert events[-1].end_loc == 2
+    assert isinstance(events[5].error, UnmetExpectationError)
+
+
+def test_tracer_emits_events_for_suspended_parses():
+    async def parse_trickled(grammar):
+        reader = StreamReader()
+
+        async def feed():
+            for byte in b"12;":
+                reader.feed_data(bytes([byte]))
+                await asyncio.sleep(0)
+            reader.feed_eof()
+
+        feed_task = asyncio.create_task(feed())
+        values = [parsed.values async for parsed in parse_incremental(grammar, reader)]
+        await feed_task
+        return values
+
+    digits = CharacterSet(b"0123456789", name="digit")[1, ...]
+    trickled_grammar = digits + Literal(b";", name="semicolon")
+    events = []
+    with Tracer(trickled_grammar, events.append):
+        assert asyncio.run(parse_trickled(trickled_grammar)) == [(b"1", b"2", b";")]
+
+    results = [event for event in events if event.kind != ENTER]
+    assert [(event.kind, event.parser.name) for event in results] == [
+        (SUCCESS, "digit"),
+        (SUCCESS, "digit"),
+        (FAIL, "digit"),
+        (SUCCESS, digits.name),
+        (SUCCESS, "semicolon"),
+        (SUCCESS, trickled_grammar.name),
+    ]
+    assert all(event.depth == 0 for event in events if event.parser is trickled_grammar)
+
+
+def test_tracer_is_removed_when_detached():
+    events = []
+    with Tracer(grammar, events.append):
+        pass
+    asyncio.run(parse_bytes(grammar, b"ab"))
+    assert events == []
+    for parser in iter_parsers(grammar):
+        assert "parse" not in vars(parser)
+
+
+def test_ring_buffer_listener_keeps_last_events():
+    listener = RingBufferListener(maxlen=3)
+    with Tracer(grammar, listener):
+        with pytest.raises(UnmetExpectationError):
+            asyncio.run(parse_bytes(grammar, b"ac"))
+
+    assert summarize(listener.events) == [
+        (FAIL, "b", 1, 2),
+        (FAIL, (a + b).name, 0, 1),
+        (FAIL, "grammar", 0, 0),
+    ]
+    assert listener.format().splitlines()[0].startswith("    fail b at 1: ")
+
+    listener.clear()
+    assert listener.events == []
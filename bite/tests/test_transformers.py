@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from bite.io import BytesBuffer
@@ -63,3 +65,13 @@ async def test_successful_parsing(input_buf, grammar, expected_values):
     buffer = BytesBuffer(input_buf)
     parse_tree = await grammar.parse(buffer)
     assert parse_tree.values == expected_values
+
+
+def test_grammars_are_picklable():
+    grammar = Group(
+        Suppress(Literal(b"[")) + TransformValues(Literal(b"A"), list) + Literal(b"]")
+    )
+
+    unpickled = pickle.loads(pickle.dumps(grammar))
+
+    assert unpickled.parse_nowait(BytesBuffer(b"[A]")).values == ((b"A", b"]"),)
@@ -0,0 +1,212 @@
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Optional
+
+from bite.instrumentation import Instrumentation, ParseMethod, ParseNowaitMethod
+from bite.io import ParserBuffer
+from bite.parsers import ParsedNode, ParseError, Parser
+
+ENTER = "enter"
+"""Kind of the `TraceEvent` emitted when a parser is invoked."""
+
+SUCCESS = "success"
+"""Kind of the `TraceEvent` emitted when a parser matched the input."""
+
+FAIL = "fail"
+"""Kind of the `TraceEvent` emitted when a parser failed to match the input."""
+
+
+@dataclass(frozen=True)
+class TraceEvent:
+    """Event emitted by a `Tracer`."""
+
+    kind: str
+    """One of `ENTER`, `SUCCESS`, or `FAIL`."""
+
+    parser: Parser
+    """The parser emitting the event."""
+
+    loc: int
+    """The location in the input at which the parser was invoked."""
+
+    depth: int
+    """The nesting depth of the parser invocation."""
+
+    end_loc: Optional[int] = None
+    """The location after the parsed input for `SUCCESS` events."""
+
+    error: Optional[ParseError] = None
+    """The raised exception for `FAIL` events."""
+
+    def __str__(self) -> str:
+        line = f"{'  ' * self.depth}{self.kind} {self.parser} at {self.loc}"
+        if self.end_loc is not None:
+            line += f"..{self.end_loc}"
+        if self.error is not None:
+            line += f": {str(self.error).splitlines()[0]}"
+        return line
+
+
+TraceListener = Callable[[TraceEvent], None]
+"""Callable receiving the events emitted by a `Tracer`."""
+
+
+class RingBufferListener:
+    """Trace listener keeping only the last *maxlen* events.
+
+    This bounds the memory and time spent on tracing, so that it can stay
+    enabled to inspect the events leading up to a failure.
+
+    Parameters
+    ----------
+    maxlen:
+        Maximum number of events to keep.
+    """
+
+    def __init__(self, maxlen: int = 1024):
+        self._events: Deque[TraceEvent] = deque(maxlen=maxlen)
+
+    def __call__(self, event: TraceEvent):
+        self._events.append(event)
+
+    @property
+    def events(self) -> List[TraceEvent]:
+        """The kept events, oldest first."""
+        return list(self._events)
+
+    def clear(self):
+        """Discard all kept events."""
+        self._events.clear()
+
+    def format(self) -> str:
+        """Format the kept events with one indented line per event.
+
+        Returns
+        -------
+        :
+            The formatted events.
+        """
+        return "\n".join(str(event) for event in self._events)
+
+
+_depth: ContextVar[int] = ContextVar("_depth", default=0)
+
+
+class Tracer(Instrumentation):
+    """Emit events for each invocation of the parsers in a grammar.
+
+    Like other instrumentations, the tracer does not add any overhead while it
+    is not attached.
+
+    If a parser invoked through the synchronous fast path
+    (`bite.parsers.Parser.parse_nowait`) has to wait for more input, no result
+    event is emitted for this attempt and the parse is continued with
+    `bite.parsers.Parser.parse`, emitting another `ENTER` event.
+
+    Parameters
+    ----------
+    grammar:
+        The grammar to trace.
+    listener:
+        Callable receiving each emitted `TraceEvent`. It is called
+        synchronously from within the parse and should return quickly.
+
+    Examples
+    --------
+
+    .. testcode:: tracer
+
+        import asyncio
+        from bite import CharacterSet, Combine, Literal, parse_bytes
+        from bite.tracing import RingBufferListener, Tracer
+
+        integer = Combine(CharacterSet(b'0123456789')[1, ...], name='integer')
+        expr = integer + Literal(b'+', name='plus') + integer
+
+        listener = RingBufferListener(maxlen=4)
+        with Tracer(expr, listener):
+            try:
+                asyncio.run(parse_bytes(expr, b'23-42'))
+            except Exception:
+                print(listener.format())
+
+    .. testoutput:: tracer
+
+          success integer at 0..2
+          enter plus at 2
+          fail plus at 2: expected plus at position 2
+        fail (integer) + (plus) + (integer) at 0: expected plus at position 2
+    """
+
+    def __init__(self, grammar: Parser, listener: TraceListener):
+        super().__init__(grammar)
+        self.listener = listener
+
+    def wrap_parse(self, parser: Parser, parse: ParseMethod) -> ParseMethod:
+        """Wrap the ``parse`` method to emit events.
+
+        Parameters
+        ----------
+        parser:
+            The parser to instrument.
+        parse:
+            The ``parse`` method to wrap.
+
+        Returns
+        -------
+        :
+            The wrapped method.
+        """
+        listener = self.listener
+
+        async def traced_parse(buf: ParserBuffer, loc: int = 0) -> ParsedNode:
+            depth = _depth.get()
+            listener(TraceEvent(ENTER, parser, loc, depth))
+            _depth.set(depth + 1)
+            try:
+                parse_tree = await parse(buf, loc)
+            except ParseError as err:
+                listener(TraceEvent(FAIL, parser, loc, depth, error=err))
+                raise
+            finally:
+                _depth.set(depth)
+            listener(TraceEvent(SUCCESS, parser, loc, depth, parse_tree.end_loc))
+            return parse_tree
+
+        return traced_parse
+
+    def wrap_parse_nowait(
+        self, parser: Parser, parse_nowait: ParseNowaitMethod
+    ) -> ParseNowaitMethod:
+        """Wrap the ``parse_nowait`` method to emit events.
+
+        Parameters
+        ----------
+        parser:
+            The parser to instrument.
+        parse_nowait:
+            The ``parse_nowait`` method to wrap.
+
+        Returns
+        -------
+        :
+            The wrapped method.
+        """
+        listener = self.listener
+
+        def traced_parse_nowait(buf: ParserBuffer, loc: int = 0) -> ParsedNode:
+            depth = _depth.get()
+            listener(TraceEvent(ENTER, parser, loc, depth))
+            _depth.set(depth + 1)
+            try:
+                parse_tree = parse_nowait(buf, loc)
+            except ParseError as err:
+                listener(TraceEvent(FAIL, parser, loc, depth, error=err))
+                raise
+            finally:
+                _depth.set(depth)
+            listener(TraceEvent(SUCCESS, parser, loc, depth, parse_tree.end_loc))
+            return parse_tree
+
+        return traced_parse_nowait
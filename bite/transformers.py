@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Callable, Generic, Iterable, Optional, Tuple, TypeVar
 
-from bite.io import ParserBuffer
+from bite.io import ParserBuffer, WouldBlock
 from bite.parsers import ParsedBaseNode, ParsedNode, Parser
 
 T = TypeVar("T", covariant=True)
@@ -85,11 +85,24 @@ class Transform(Parser[ParsedNode[T, VIn_co], VOut_co]):
         self.parser = parser
         self.transform = transform
 
+    @property
+    def children(self) -> Tuple[Parser, ...]:
+        return (self.parser,)
+
     async def parse(
         self, buf: ParserBuffer, loc: int = 0
+    ) -> ParsedTransform[T, VIn_co, VOut_co]:
+        try:
+            parse_tree = self.parser.parse_nowait(buf, loc)
+        except WouldBlock:
+            parse_tree = await self.parser.parse(buf, loc)
+        return ParsedTransform(self.name, parse_tree, self.transform)
+
+    def parse_nowait(
+        self, buf: ParserBuffer, loc: int = 0
     ) -> ParsedTransform[T, VIn_co, VOut_co]:
         return ParsedTransform(
-            self.name, await self.parser.parse(buf, loc), self.transform
+            self.name, self.parser.parse_nowait(buf, loc), self.transform
         )
 
 
@@ -124,10 +137,14 @@ class Suppress(Transform[T, VIn_co, None]):
 
     def __init__(self, parser: Parser[T, VIn_co], *, name: Optional[str] = None):
         super().__init__(
-            parser, lambda _: [], name=name if name else f"Suppress({parser.name})"
+            parser, _suppress, name=name if name else f"Suppress({parser.name})"
         )
 
 
+def _suppress(parse_tree: ParsedNode) -> Iterable[None]:
+    return []
+
+
 class TransformValues(Transform[T, VIn_co, VOut_co]):
     """Transform parsed values.
 
@@ -177,11 +194,20 @@ class TransformValues(Transform[T, VIn_co, VOut_co]):
     ):
         super().__init__(
             parser,
-            lambda parse_tree: transform(parse_tree.values),
+            _TransformValuesOf[T, VIn_co, VOut_co](transform),
             name=name if name else f"TransformValues({parser.name})",
         )
 
 
+@dataclass(frozen=True)
+class _TransformValuesOf(Generic[T, VIn_co, VOut_co]):
+    # A class instead of a closure to keep grammars picklable.
+    transform: Callable[[Iterable[VIn_co]], Iterable[VOut_co]]
+
+    def __call__(self, parse_tree: ParsedNode[T, VIn_co]) -> Iterable[VOut_co]:
+        return self.transform(parse_tree.values)
+
+
 class Group(TransformValues[T, VIn_co, Tuple[VIn_co, ...]]):
     """Group the values of a resulting parse tree node into a tuple.
 
@@ -223,11 +249,15 @@ class Group(TransformValues[T, VIn_co, Tuple[VIn_co, ...]]):
     def __init__(self, parser: Parser[T, VIn_co], *, name: Optional[str] = None):
         super().__init__(
             parser,
-            lambda values: (tuple(values),),
+            _group,
             name=name if name else f"Group({parser.name})",
         )
 
 
+def _group(values: Iterable[VIn_co]) -> Tuple[Tuple[VIn_co, ...]]:
+    return (tuple(values),)
+
+
 __all__ = [
     "Group",
     "Suppress",